@@ -0,0 +1,36 @@
+"""kyc review queue partial index
+
+Revision ID: 0001_kyc_review_queue_index
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_kyc_review_queue_index"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_kyc_documents_review_queue",
+        "kyc_documents",
+        ["uploaded_at", "document_id"],
+        postgresql_include=["verification_status", "user_id"],
+        postgresql_where=sa.text(
+            "is_active = true AND verification_status IN ('submitted', 're-submitted')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_kyc_documents_review_queue", table_name="kyc_documents")
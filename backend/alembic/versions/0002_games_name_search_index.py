@@ -0,0 +1,32 @@
+"""games name search index
+
+Revision ID: 0002_games_name_search_index
+Revises: 0001_kyc_review_queue_index
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_games_name_search_index"
+down_revision: Union[str, Sequence[str], None] = "0001_kyc_review_queue_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_games_game_name_lower",
+        "games",
+        [sa.text("lower(game_name) text_pattern_ops")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_games_game_name_lower", table_name="games")
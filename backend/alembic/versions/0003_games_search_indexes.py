@@ -0,0 +1,43 @@
+"""games full-text and trigram search indexes
+
+Revision ID: 0003_games_search_indexes
+Revises: 0002_games_name_search_index
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_games_search_indexes"
+down_revision: Union[str, Sequence[str], None] = "0002_games_name_search_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_games_search_vector",
+        "games",
+        [sa.text("to_tsvector('simple', game_name || ' ' || game_code)")],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_games_game_name_trgm",
+        "games",
+        ["game_name"],
+        postgresql_using="gin",
+        postgresql_ops={"game_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_games_game_name_trgm", table_name="games")
+    op.drop_index("ix_games_search_vector", table_name="games")
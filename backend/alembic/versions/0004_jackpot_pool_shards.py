@@ -0,0 +1,40 @@
+"""jackpot pool shards
+
+Revision ID: 0004_jackpot_pool_shards
+Revises: 0003_games_search_indexes
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_jackpot_pool_shards"
+down_revision: Union[str, Sequence[str], None] = "0003_games_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jackpot_pool_shards",
+        sa.Column(
+            "jackpot_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jackpots.jackpot_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("shard_no", sa.SmallInteger(), primary_key=True),
+        sa.Column("pending_amount", sa.Numeric(18, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("jackpot_pool_shards")
@@ -0,0 +1,61 @@
+"""jackpot draw selection
+
+Revision ID: 0005_jackpot_draw_selection
+Revises: 0004_jackpot_pool_shards
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_jackpot_draw_selection"
+down_revision: Union[str, Sequence[str], None] = "0004_jackpot_pool_shards"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jackpots",
+        sa.Column("winner_selection", sa.String(20), nullable=False, server_default="UNIFORM"),
+    )
+    op.create_check_constraint(
+        "jackpot_winner_selection_check",
+        "jackpots",
+        "winner_selection IN ('UNIFORM', 'WEIGHTED')",
+    )
+
+    op.add_column("jackpot_wins", sa.Column("draw_seed", sa.String(64), nullable=True))
+    op.add_column("jackpot_wins", sa.Column("selection_mode", sa.String(20), nullable=True))
+    op.add_column("jackpot_wins", sa.Column("population_size", sa.Integer(), nullable=True))
+
+    op.create_index(
+        "ix_jackpot_contributions_draw",
+        "jackpot_contributions",
+        ["jackpot_id", "player_id"],
+        postgresql_include=["amount"],
+    )
+    op.create_index(
+        "ix_wallets_tenant_player_active",
+        "wallets",
+        ["tenant_id", "player_id"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_wallets_tenant_player_active", table_name="wallets")
+    op.drop_index("ix_jackpot_contributions_draw", table_name="jackpot_contributions")
+
+    op.drop_column("jackpot_wins", "population_size")
+    op.drop_column("jackpot_wins", "selection_mode")
+    op.drop_column("jackpot_wins", "draw_seed")
+
+    op.drop_constraint("jackpot_winner_selection_check", "jackpots", type_="check")
+    op.drop_column("jackpots", "winner_selection")
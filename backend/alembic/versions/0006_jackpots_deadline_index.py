@@ -0,0 +1,28 @@
+"""jackpots deadline index
+
+Revision ID: 0006_jackpots_deadline_index
+Revises: 0005_jackpot_draw_selection
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_jackpots_deadline_index"
+down_revision: Union[str, Sequence[str], None] = "0005_jackpot_draw_selection"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_jackpots_status_deadline", "jackpots", ["status", "deadline"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jackpots_status_deadline", table_name="jackpots")
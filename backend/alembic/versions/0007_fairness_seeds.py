@@ -0,0 +1,53 @@
+"""fairness seeds
+
+Revision ID: 0007_fairness_seeds
+Revises: 0006_jackpots_deadline_index
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_fairness_seeds"
+down_revision: Union[str, Sequence[str], None] = "0006_jackpots_deadline_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fairness_seeds",
+        sa.Column("seed_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "player_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("players.player_id"),
+            nullable=False,
+        ),
+        sa.Column("server_seed", sa.String(64), nullable=False),
+        sa.Column("server_seed_hash", sa.String(64), nullable=False, unique=True),
+        sa.Column("client_seed", sa.String(64), nullable=False),
+        sa.Column("nonce", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("revealed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "uq_fairness_seeds_active_player",
+        "fairness_seeds",
+        ["player_id"],
+        unique=True,
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_fairness_seeds_active_player", table_name="fairness_seeds")
+    op.drop_table("fairness_seeds")
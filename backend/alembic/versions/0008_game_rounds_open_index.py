@@ -0,0 +1,33 @@
+"""game rounds open index
+
+Revision ID: 0008_game_rounds_open_index
+Revises: 0007_fairness_seeds
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_game_rounds_open_index"
+down_revision: Union[str, Sequence[str], None] = "0007_fairness_seeds"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_game_rounds_open",
+        "game_rounds",
+        ["started_at"],
+        postgresql_where=sa.text("ended_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_game_rounds_open", table_name="game_rounds")
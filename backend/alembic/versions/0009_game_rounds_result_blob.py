@@ -0,0 +1,30 @@
+"""game rounds result blob
+
+Revision ID: 0009_game_rounds_result_blob
+Revises: 0008_game_rounds_open_index
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_game_rounds_result_blob"
+down_revision: Union[str, Sequence[str], None] = "0008_game_rounds_open_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Packed payloads are small and already dense: keep them inline, skip TOAST compression
+    op.add_column("game_rounds", sa.Column("result_blob", sa.LargeBinary(), nullable=True))
+    op.execute("ALTER TABLE game_rounds ALTER COLUMN result_blob SET STORAGE MAIN")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("game_rounds", "result_blob")
@@ -0,0 +1,141 @@
+"""partition game_rounds, bets and wallet_transactions by month
+
+Revision ID: 0010_partition_round_tables
+Revises: 0009_game_rounds_result_blob
+Create Date: 2026-10-19 00:00:00
+
+Each table is renamed to <table>_legacy and attached, without copying,
+as the partition covering everything before the first monthly one.
+The primary key gains the partition key and FKs pointing at round_id /
+bet_id are dropped (PostgreSQL cannot reference a partitioned table by
+a key that excludes the partition column).
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_partition_round_tables"
+down_revision: Union[str, Sequence[str], None] = "0009_game_rounds_result_blob"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (primary key column, partition key, extra unique constraints as (name, columns))
+TABLES = {
+    "game_rounds": ("round_id", "started_at", []),
+    "bets": ("bet_id", "placed_at", [("unique_round_bet", "round_id, placed_at")]),
+    "wallet_transactions": ("transaction_id", "created_at", []),
+}
+MONTHS_AHEAD = 3
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # FKs into the tables being partitioned (bets -> game_rounds, jackpot_* / bet_taxes -> bets, ...)
+    incoming = bind.execute(sa.text("""
+        SELECT conrelid::regclass::text AS source, conname
+        FROM pg_constraint
+        WHERE contype = 'f' AND confrelid = ANY (CAST(:tables AS regclass[]))
+    """), {"tables": list(TABLES)}).all()
+    for fk in incoming:
+        op.execute(f'ALTER TABLE {fk.source} DROP CONSTRAINT "{fk.conname}"')
+
+    for table, (pk, key, uniques) in TABLES.items():
+        legacy = f"{table}_legacy"
+
+        newest = bind.execute(sa.text(f"SELECT max({key}) FROM {table}")).scalar()
+        now = datetime.utcnow()
+        boundary = _add_months(datetime(now.year, now.month, 1), 1)
+        if newest and newest >= boundary:
+            boundary = _add_months(datetime(newest.year, newest.month, 1), 1)
+
+        # Outgoing FKs (to wallets, sessions, ...) are recreated on the partitioned parent
+        outgoing = bind.execute(sa.text("""
+            SELECT conname, pg_get_constraintdef(oid) AS definition
+            FROM pg_constraint
+            WHERE contype = 'f' AND conrelid = CAST(:table AS regclass)
+        """), {"table": table}).all()
+        constraints = bind.execute(sa.text("""
+            SELECT conname FROM pg_constraint
+            WHERE contype IN ('p', 'u') AND conrelid = CAST(:table AS regclass)
+        """), {"table": table}).scalars().all()
+        indexes = bind.execute(sa.text("""
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = :table
+              AND indexname NOT IN (
+                  SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass)
+              )
+        """), {"table": table}).all()
+
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        for name in constraints:
+            op.execute(f'ALTER TABLE {legacy} DROP CONSTRAINT "{name}"')
+        for index in indexes:
+            op.execute(f'ALTER INDEX "{index.indexname}" RENAME TO "{index.indexname}_legacy"')
+
+        # Rows from before the key had a default cannot be routed to a range
+        op.execute(f"UPDATE {legacy} SET {key} = TIMESTAMP '1970-01-01' WHERE {key} IS NULL")
+        op.execute(f"ALTER TABLE {legacy} ALTER COLUMN {key} SET NOT NULL")
+        op.execute(f"ALTER TABLE {legacy} ALTER COLUMN {key} SET DEFAULT now()")
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS "
+            f"INCLUDING STORAGE INCLUDING COMMENTS) PARTITION BY RANGE ({key})"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk}, {key})")
+        for name, columns in uniques:
+            op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({columns})")
+        for fk in outgoing:
+            if not any(f"REFERENCES {target}(" in fk.definition for target in TABLES):
+                op.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{fk.conname}" {fk.definition}')
+        for index in indexes:
+            # A unique index must include the partition key to exist on the parent
+            if index.indexdef.startswith("CREATE UNIQUE") and key not in index.indexdef:
+                continue
+            # Same definition on the parent; ATTACH adopts the legacy copy instead of rebuilding it
+            op.execute(index.indexdef)
+
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{boundary:%Y-%m-%d}')"
+        )
+
+        month = boundary
+        while month <= _add_months(datetime(now.year, now.month, 1), MONTHS_AHEAD):
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_add_months(month, 1):%Y-%m-%d}')"
+            )
+            month = _add_months(month, 1)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for table, (pk, key, uniques) in TABLES.items():
+        flat = f"{table}_unpartitioned"
+        op.execute(f"CREATE TABLE {flat} (LIKE {table} INCLUDING ALL)")
+        op.execute(f"INSERT INTO {flat} SELECT * FROM {table}")
+
+        partitions = bind.execute(sa.text("""
+            SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table AS regclass)
+        """), {"table": table}).scalars().all()
+        op.execute(f"DROP TABLE {table}")
+        for partition in partitions:
+            op.execute(f"DROP TABLE IF EXISTS {partition}")
+
+        op.execute(f"ALTER TABLE {flat} RENAME TO {table}")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {flat}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk})")
+    # Dropped FKs into these tables are not restored: rows written while partitioned may not satisfy them
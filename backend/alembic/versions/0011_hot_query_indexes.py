@@ -0,0 +1,70 @@
+"""hot query indexes
+
+Revision ID: 0011_hot_query_indexes
+Revises: 0010_partition_round_tables
+Create Date: 2026-10-19 00:00:00
+
+Indexes for the per-bet lookups (sessions, wallets, limits, bonus
+wagering, round numbering) and the wallet / history reads. On the
+partitioned tables the index is created on the parent and cascades to
+every partition. `python -m database_check.index_advisor` replays the
+queries these serve.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_hot_query_indexes"
+down_revision: Union[str, Sequence[str], None] = "0010_partition_round_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_game_sessions_player_game_active",
+        "game_sessions",
+        ["player_id", "game_id", "tenant_id"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.create_index("ix_game_rounds_session_round", "game_rounds", ["session_id", "round_number"])
+    op.create_index("ix_wallet_transactions_wallet_created", "wallet_transactions", ["wallet_id", "created_at"])
+    op.create_index(
+        "ix_wallet_transactions_reference",
+        "wallet_transactions",
+        ["reference_id", "created_at"],
+        postgresql_include=["balance_after"],
+        postgresql_where=sa.text("reference_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_wallets_player_tenant_type_active",
+        "wallets",
+        ["player_id", "tenant_id", "wallet_type_id"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+    op.create_index(
+        "ix_player_limits_lookup",
+        "player_limits",
+        ["player_id", "tenant_id", "limit_type", "period", "status"],
+    )
+    op.create_index(
+        "ix_bonus_usage_player_status",
+        "bonus_usage",
+        ["player_id", "status"],
+        postgresql_include=["bonus_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_bonus_usage_player_status", table_name="bonus_usage")
+    op.drop_index("ix_player_limits_lookup", table_name="player_limits")
+    op.drop_index("ix_wallets_player_tenant_type_active", table_name="wallets")
+    op.drop_index("ix_wallet_transactions_reference", table_name="wallet_transactions")
+    op.drop_index("ix_wallet_transactions_wallet_created", table_name="wallet_transactions")
+    op.drop_index("ix_game_rounds_session_round", table_name="game_rounds")
+    op.drop_index("ix_game_sessions_player_game_active", table_name="game_sessions")
@@ -0,0 +1,46 @@
+"""game session round counter
+
+Revision ID: 0012_game_session_round_count
+Revises: 0011_hot_query_indexes
+Create Date: 2026-10-19 00:00:00
+
+Round numbers come from game_sessions.round_count (UPDATE ... RETURNING)
+instead of max(round_number) over the session's rounds. game_rounds is
+range partitioned on started_at, so a UNIQUE (session_id, round_number)
+cannot be declared on it; the counter's row lock is what keeps numbers
+unique.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_game_session_round_count"
+down_revision: Union[str, Sequence[str], None] = "0011_hot_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "game_sessions",
+        sa.Column("round_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute("""
+        UPDATE game_sessions s
+        SET round_count = r.last_round
+        FROM (
+            SELECT session_id, max(round_number) AS last_round
+            FROM game_rounds
+            GROUP BY session_id
+        ) r
+        WHERE s.session_id = r.session_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("game_sessions", "round_count")
@@ -0,0 +1,41 @@
+"""game session last activity
+
+Revision ID: 0013_game_session_last_activity
+Revises: 0012_game_session_round_count
+Create Date: 2026-10-19 00:00:00
+
+Open sessions start with a fresh idle window so the session reaper does
+not close them the moment it is deployed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_game_session_last_activity"
+down_revision: Union[str, Sequence[str], None] = "0012_game_session_round_count"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("game_sessions", sa.Column("last_activity_at", sa.TIMESTAMP(), nullable=True))
+    op.execute("""
+        UPDATE game_sessions
+        SET last_activity_at = CASE WHEN status = 'active' THEN LOCALTIMESTAMP ELSE coalesce(ended_at, started_at) END
+    """)
+    op.create_index(
+        "ix_game_sessions_idle",
+        "game_sessions",
+        ["last_activity_at"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_game_sessions_idle", table_name="game_sessions")
+    op.drop_column("game_sessions", "last_activity_at")
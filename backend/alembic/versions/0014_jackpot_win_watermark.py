@@ -0,0 +1,40 @@
+"""jackpot win contribution window
+
+Revision ID: 0014_jackpot_win_watermark
+Revises: 0013_game_session_last_activity
+Create Date: 2026-10-19 00:00:00
+
+Contributor draws only count contributions in (contributions_from,
+contributions_until]. Earlier contributor draws ran over everything up
+to their win, so that is taken as their watermark; the next draw of a
+recurring pool then starts after it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_jackpot_win_watermark"
+down_revision: Union[str, Sequence[str], None] = "0013_game_session_last_activity"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("jackpot_wins", sa.Column("contributions_from", sa.DateTime(), nullable=True))
+    op.add_column("jackpot_wins", sa.Column("contributions_until", sa.DateTime(), nullable=True))
+    op.execute("""
+        UPDATE jackpot_wins AS w
+        SET contributions_until = w.won_at
+        FROM jackpots AS j
+        WHERE j.jackpot_id = w.jackpot_id AND j.jackpot_type IN ('PROGRESSIVE', 'SPONSORED')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("jackpot_wins", "contributions_until")
+    op.drop_column("jackpot_wins", "contributions_from")
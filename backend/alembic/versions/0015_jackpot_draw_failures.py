@@ -0,0 +1,35 @@
+"""jackpot draw failures
+
+Revision ID: 0015_jackpot_draw_failures
+Revises: 0014_jackpot_win_watermark
+Create Date: 2026-10-19 00:00:00
+
+Scheduled draws that keep failing back off (next_draw_at) and are
+paused after a few attempts instead of being retried on every pass.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015_jackpot_draw_failures"
+down_revision: Union[str, Sequence[str], None] = "0014_jackpot_win_watermark"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jackpots",
+        sa.Column("draw_failures", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("jackpots", sa.Column("next_draw_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("jackpots", "next_draw_at")
+    op.drop_column("jackpots", "draw_failures")
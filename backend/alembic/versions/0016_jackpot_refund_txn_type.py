@@ -0,0 +1,43 @@
+"""jackpot refund transaction type
+
+Revision ID: 0016_jackpot_refund_txn_type
+Revises: 0015_jackpot_draw_failures
+Create Date: 2026-10-19 00:00:00
+
+Contributions that reached a jackpot after it closed are credited back
+under their own transaction type instead of as jackpot payouts.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0016_jackpot_refund_txn_type"
+down_revision: Union[str, Sequence[str], None] = "0015_jackpot_draw_failures"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        INSERT INTO transaction_types (transaction_type_id, transaction_code, description, direction)
+        SELECT (SELECT COALESCE(MAX(transaction_type_id), 0) + 1 FROM transaction_types), 'jackpot_refund',
+               'Jackpot contribution returned after the jackpot closed', 'credit'
+        WHERE NOT EXISTS (SELECT 1 FROM transaction_types WHERE transaction_code = 'jackpot_refund')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Refunds already posted fall back to the type they were booked under before
+    op.execute("""
+        UPDATE wallet_transactions SET transaction_type_id = (
+            SELECT transaction_type_id FROM transaction_types WHERE transaction_code = 'jackpot_payout'
+        )
+        WHERE transaction_type_id = (
+            SELECT transaction_type_id FROM transaction_types WHERE transaction_code = 'jackpot_refund'
+        )
+    """)
+    op.execute("DELETE FROM transaction_types WHERE transaction_code = 'jackpot_refund'")
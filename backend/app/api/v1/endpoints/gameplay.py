@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query 
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 import uuid
 from uuid import UUID
@@ -8,11 +8,15 @@ from typing import Optional
 from app.core.security import get_db, get_current_user
 from app.core.kyc_guard import enforce_kyc_verified
 
-from app.schemas.gameplay import PlayRequest
+from app.schemas.gameplay import PlayRequest, RoundStartRequest, RoundRevealRequest, CrashTableBetRequest
+from app.schemas.fairness import FairnessRotateRequest, FairnessVerifyRequest
 
 from app.services.gameplay_service import GameplayService
 from app.services.wallet_service import WalletService
 from app.services.history_service import HistoryService
+from app.services.fairness_service import FairnessService
+from app.services.interactive_round_service import InteractiveRoundService
+from app.services.crash_table_service import CrashTableService
 
 
 router = APIRouter(tags=["Gameplay"])
@@ -29,7 +33,8 @@ def play_game(req: PlayRequest, db: Session = Depends(get_db), user=Depends(get_
         opt_in=req.opt_in,
         player_choice=req.player_choice,   
         target_multiplier=req.target_multiplier,  
-        successful_picks=req.successful_picks
+        successful_picks=req.successful_picks,
+        include_path=req.include_path
     )
 
 
@@ -63,12 +68,124 @@ def get_detailed_history(
     db: Session = Depends(get_db), 
     user = Depends(get_current_user),
     game: Optional[str] = Query(None),
-    status: Optional[str] = Query(None) 
+    status: Optional[str] = Query(None),
+    days: Optional[int] = Query(None, ge=1, le=3650)
 ):
     enforce_kyc_verified(user)
     return HistoryService.get_player_dashboard(
         db, 
         user.user_id, 
         game_name=game, 
-        status=status
-    )
\ No newline at end of file
+        status=status,
+        days=days
+    )
+
+
+# ─────────────────────────────
+# Provably fair seeds
+# ─────────────────────────────
+@router.get("/fairness/seed")
+def get_fairness_seed(db: Session = Depends(get_db), user=Depends(get_current_user)):
+    return FairnessService.public_view(FairnessService.get_active_seed(db, user.user_id))
+
+
+@router.post("/fairness/rotate")
+def rotate_fairness_seed(
+    payload: FairnessRotateRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    return FairnessService.rotate_seed(db, user.user_id, payload.client_seed)
+
+
+@router.post("/fairness/verify")
+def verify_round(
+    payload: FairnessVerifyRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    return FairnessService.verify_round(db, user.user_id, payload.round_id)
+
+
+# ─────────────────────────────
+# Interactive rounds (Mines, live Crash)
+# ─────────────────────────────
+@router.post("/rounds/start")
+def start_round(req: RoundStartRequest, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    enforce_kyc_verified(user)
+    return InteractiveRoundService.start(
+        db,
+        user.user_id,
+        req.tenant_id,
+        req.game_id,
+        req.bet_amount,
+        opt_in=req.opt_in,
+        auto_cashout=req.auto_cashout
+    )
+
+
+@router.post("/rounds/{round_id}/reveal")
+def reveal_cell(
+    round_id: uuid.UUID,
+    req: RoundRevealRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    return InteractiveRoundService.reveal(db, user.user_id, round_id, req.cell)
+
+
+@router.post("/rounds/{round_id}/cashout")
+def cash_out(round_id: uuid.UUID, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    return InteractiveRoundService.cashout(db, user.user_id, round_id)
+
+
+@router.get("/rounds/{round_id}")
+def get_round(round_id: uuid.UUID, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    return InteractiveRoundService.get_state(db, user.user_id, round_id)
+
+
+# ─────────────────────────────
+# Shared crash table
+# ─────────────────────────────
+@router.post("/crash-table/{game_id}/bet")
+async def place_crash_table_bet(
+    game_id: uuid.UUID,
+    req: CrashTableBetRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    enforce_kyc_verified(user)
+    return await CrashTableService.place_bet(
+        db, user.user_id, req.tenant_id, game_id, req.bet_amount, req.auto_cashout, req.opt_in
+    )
+
+
+@router.post("/crash-table/{game_id}/cashout")
+async def crash_table_cash_out(game_id: uuid.UUID, tenant_id: uuid.UUID, user=Depends(get_current_user)):
+    return await CrashTableService.cash_out(user.user_id, tenant_id, game_id)
+
+
+@router.get("/crash-table/{game_id}")
+async def get_crash_table(game_id: uuid.UUID, tenant_id: uuid.UUID, user=Depends(get_current_user)):
+    table = await CrashTableService.get_table(tenant_id, game_id)
+    return CrashTableService.snapshot(table, user.user_id)
+
+
+@router.websocket("/crash-table/{game_id}/ws")
+async def crash_table_stream(websocket: WebSocket, game_id: uuid.UUID, tenant_id: uuid.UUID):
+    """Public round feed (phase, multiplier, crash point); carries no player data."""
+    try:
+        table, queue = await CrashTableService.subscribe(tenant_id, game_id)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+
+    await websocket.accept()
+    try:
+        while True:
+            await websocket.send_text(await queue.get())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        CrashTableService.unsubscribe(table, queue)
+
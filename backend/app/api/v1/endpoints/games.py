@@ -15,6 +15,7 @@ from app.models.game import Game
 from app.models.game import GameStatusEnum
 
 from app.services.game_service import GameService
+from app.game_engines.registry import engine_registry
 
 
 router = APIRouter(tags=["Games"])
@@ -39,6 +40,12 @@ def submit_game(
     return GameService.submit_game(db, payload, current_user.user_id)
 
 
+@router.get("/engines")
+def list_engines(current_user: User = Depends(get_current_user)):
+    """Installed game engines with their capabilities and engine_config JSON schema."""
+    return engine_registry.specs()
+
+
 @router.get("/pending")
 def get_pending_games(
     db: Session = Depends(get_db),
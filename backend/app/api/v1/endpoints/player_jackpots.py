@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
 import uuid
 
-from app.core.security import get_current_player
+from app.core.security import (
+    STREAM_TOKEN_EXPIRE_SECONDS, create_stream_token, get_current_player, get_stream_player
+)
 from app.core.database import get_db
 
 from app.models.player import Player
@@ -14,16 +17,38 @@ from app.models.jackpot_win import JackpotWin
 from app.schemas.jackpot import JackpotContribution
 
 from app.services.jackpot_service import JackpotService
+from app.services.jackpot_ticker import JackpotTicker
+from app.services.lobby_service import LobbyService
 
 
 router = APIRouter(prefix="/player/jackpots", tags=["Player Jackpots"])
 
 @router.get("/active")
 def get_active_jackpots(tenant_id: uuid.UUID, user=Depends(get_current_player), db=Depends(get_db)):
-    return db.query(Jackpot).filter(
+    jackpots = db.query(Jackpot).filter(
         Jackpot.tenant_id == tenant_id,
         Jackpot.status == "ACTIVE"
     ).all()
+    return JackpotService.with_live_pools(db, jackpots)
+
+@router.post("/stream-token")
+def get_stream_token(user=Depends(get_current_player)):
+    """Short-lived token for /stream: EventSource cannot send an Authorization header."""
+    return {"token": create_stream_token(user.user_id), "expires_in": STREAM_TOKEN_EXPIRE_SECONDS}
+
+@router.get("/stream")
+def stream_jackpots(tenant_id: uuid.UUID, user=Depends(get_stream_player), db: Session = Depends(get_db)):
+    """
+    Server-sent events: `pools` whenever a pool amount changes, `win` when a jackpot is drawn.
+    Authenticated by ?token= from /stream-token, checked when the stream opens.
+    """
+    LobbyService.ensure_casino_profile(db, user.user_id, tenant_id)
+
+    return StreamingResponse(
+        JackpotTicker.stream(tenant_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.post("/{jackpot_id}/contribute")
 def contribute(jackpot_id: uuid.UUID, payload: JackpotContribution, tenant_id: uuid.UUID, user=Depends(get_current_player), db=Depends(get_db)):
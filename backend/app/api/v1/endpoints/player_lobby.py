@@ -1,38 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException 
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 import uuid
 
 from app.core.database import get_db
 from app.core.security import get_current_player
 
-from app.models.wallet import Wallet
-from app.models.game import Game
-from app.models.tenant_game import TenantGame
+from app.services.lobby_service import LobbyService
 
 router = APIRouter(tags=["Player Lobby"])
 
 @router.get("/player/lobby-games")
 def get_lobby_games(
-    tenant_id: uuid.UUID, 
+    tenant_id: uuid.UUID,
+    if_none_match: str | None = Header(None),
     db: Session = Depends(get_db),
     user = Depends(get_current_player)
 ):
+    LobbyService.ensure_casino_profile(db, user.user_id, tenant_id)
 
-    wallet_exists = db.query(Wallet).filter(
-        Wallet.player_id == user.user_id,
-        Wallet.tenant_id == tenant_id
-    ).first()
-    
-    if not wallet_exists:
-        raise HTTPException(
-            status_code=403, 
-            detail="Casino profile not initialized. Please enter via the Marketplace."
-        )
-
-    games = db.query(Game).join(TenantGame, Game.game_id == TenantGame.game_id).filter(
-        TenantGame.tenant_id == tenant_id,
-        TenantGame.is_active == True,
-        Game.status == "active"
-    ).all()
-    
-    return games
\ No newline at end of file
+    snapshot = LobbyService.get_snapshot(db, tenant_id)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+
+    if snapshot.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get("/player/lobby-games/search")
+def search_lobby_games(
+    tenant_id: uuid.UUID,
+    q: str | None = Query(None, max_length=100),
+    provider_name: str | None = None,
+    engine_type: str | None = None,
+    volatility: str | None = None,
+    rtp_band: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user = Depends(get_current_player)
+):
+    LobbyService.ensure_casino_profile(db, user.user_id, tenant_id)
+
+    snapshot = LobbyService.get_snapshot(db, tenant_id)
+    return snapshot.search_index.search(
+        q,
+        filters={
+            "provider_name": provider_name,
+            "engine_type": engine_type,
+            "volatility": volatility.lower() if volatility else None,
+            "rtp_band": rtp_band,
+        },
+        limit=limit
+    )
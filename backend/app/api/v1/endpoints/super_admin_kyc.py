@@ -10,7 +10,10 @@ from app.models.user import User
 from app.models.kyc_document import KYCDocument
 from app.models.role import Role
 
+from app.schemas.kyc import KYCBulkReviewRequest, KYCBulkReviewResponse
+
 from app.services.kyc_engine import recalculate_user_kyc_status
+from app.services.kyc_review_service import KYCReviewService
 
 router = APIRouter(prefix="/admin/kyc", tags=["Super Admin KYC"])
 
@@ -35,6 +38,24 @@ def get_business_pending_requests(
     ).all()
 
 
+@router.get("/queue")
+def get_review_queue(
+    role_name: str | None = Query(None, regex="^(tenant_admin|game_provider|player)$"),
+    status: str | None = Query(None, regex="^(submitted|re-submitted)$"),
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    admin=Depends(require_super_admin)
+):
+    return KYCReviewService.get_pending_queue(
+        db,
+        role_name=role_name,
+        status=status,
+        cursor=cursor,
+        limit=limit
+    )
+
+
 @router.post("/verify-document/{document_id}")
 def super_admin_verify(
     document_id: int,
@@ -66,6 +87,21 @@ def super_admin_verify(
     return {"message": f"Document {status} successfully"}
 
 
+@router.post("/verify-documents", response_model=KYCBulkReviewResponse)
+def super_admin_bulk_verify(
+    payload: KYCBulkReviewRequest,
+    db: Session = Depends(get_db),
+    admin=Depends(require_super_admin)
+):
+    return KYCReviewService.bulk_review(
+        db,
+        admin.user_id,
+        payload.document_ids,
+        payload.status,
+        payload.reason
+    )
+
+
 @router.get("/user-documents/{user_id}")
 def get_user_documents(
     user_id: uuid.UUID,
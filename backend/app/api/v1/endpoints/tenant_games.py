@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -7,17 +7,57 @@ from app.core.security import require_tenant_admin
 from app.core.kyc_guard import enforce_kyc_verified
 
 from app.services.tenant_game_service import TenantGameService
+from app.services.game_search_service import GameSearchService
 
 router = APIRouter(tags=["Tenant Games"])
 
 
 @router.get("/marketplace")
 def get_marketplace_games(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    provider_id: UUID | None = None,
+    engine_type: str | None = None,
+    volatility: str | None = None,
+    search: str | None = Query(None, max_length=150),
     db: Session = Depends(get_db),
     user=Depends(require_tenant_admin)
 ):
     enforce_kyc_verified(user)
-    return TenantGameService.list_available_market_games(db, user.tenant_id)
+    return TenantGameService.list_available_market_games(
+        db,
+        user.tenant_id,
+        page=page,
+        page_size=page_size,
+        provider_id=provider_id,
+        engine_type=engine_type,
+        volatility=volatility,
+        search=search
+    )
+
+
+@router.get("/search")
+def search_marketplace_games(
+    q: str | None = Query(None, max_length=100),
+    provider_id: UUID | None = None,
+    engine_type: str | None = None,
+    volatility: str | None = None,
+    rtp_band: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user=Depends(require_tenant_admin)
+):
+    enforce_kyc_verified(user)
+    return GameSearchService.search_catalog(
+        db,
+        q=q,
+        tenant_id=user.tenant_id,
+        provider_id=provider_id,
+        engine_type=engine_type,
+        volatility=volatility,
+        rtp_range=rtp_band,
+        limit=limit
+    )
 
 
 @router.post("/toggle")
@@ -30,7 +30,8 @@ def list_my_jackpots(
     user=Depends(require_tenant_admin),
     db: Session = Depends(get_db)
 ):
-    return db.query(Jackpot).filter(Jackpot.tenant_id == user.tenant_id).all()
+    jackpots = db.query(Jackpot).filter(Jackpot.tenant_id == user.tenant_id).all()
+    return JackpotService.with_live_pools(db, jackpots)
 
 
 @router.post("/{jackpot_id}/draw-winner")
@@ -78,6 +79,11 @@ def get_tenant_jackpot_wins(
                 "win_amount": float(win.win_amount),
                 "won_at": win.won_at,
                 "player_id": str(win.player_id),
+                "draw_seed": win.draw_seed,
+                "selection_mode": win.selection_mode,
+                "population_size": win.population_size,
+                "contributions_from": win.contributions_from,
+                "contributions_until": win.contributions_until,
                 "user": {
                     "email": user_email
                 },
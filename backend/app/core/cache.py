@@ -0,0 +1,62 @@
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry.
+
+    Each API worker holds its own copy, so callers must invalidate explicitly
+    on writes; the TTL only bounds how stale another worker's copy can get.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value, ttl_seconds: float | None = None):
+        expires_at = time.monotonic() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        with self._lock:
+            if len(self._data) >= self.max_entries and key not in self._data:
+                self._evict_expired()
+                if len(self._data) >= self.max_entries:
+                    # Drop the entry closest to expiry
+                    oldest = min(self._data, key=lambda k: self._data[k][1])
+                    del self._data[oldest]
+            self._data[key] = (value, expires_at)
+
+    def get_or_set(self, key, factory, ttl_seconds: float | None = None):
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = factory()
+            self.set(key, value, ttl_seconds)
+        return value
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._data.items() if expires_at < now]:
+            del self._data[key]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -15,6 +17,35 @@ class Settings(BaseSettings):
 
     database_url: str
 
+    # Background workers
+    run_background_workers: bool = True
+    jackpot_pool_flush_interval_seconds: float = 2.0
+    jackpot_scheduler_interval_seconds: float = 30.0
+    round_reaper_interval_seconds: float = 15.0
+    partition_maintenance_interval_seconds: float = 3600.0
+    round_archive_interval_seconds: float = 86400.0
+    session_reaper_interval_seconds: float = 60.0
+
+    # Monthly partitions of game_rounds / bets / wallet_transactions
+    partition_months_ahead: int = 3
+    partition_retention_months: int = 0   # 0 keeps every partition attached
+
+    # Player history / wallet dashboard look back this far (keeps reads on recent partitions)
+    history_window_days: int = 90
+
+    # Cold storage: settled rounds older than this move to Parquet under archive_dir (0 disables)
+    archive_after_days: int = 0
+    archive_dir: str = "archive"
+
+    # Interactive rounds (Mines, live Crash): idle time before auto-settlement
+    interactive_round_ttl_seconds: float = 600.0
+
+    # Game sessions with no bet for this long are closed by the session reaper
+    session_idle_timeout_seconds: float = 1800.0
+
+    # Settled round payloads: "packed" (game_rounds.result_blob) or "jsonb" (result_data, for debugging)
+    round_result_encoding: Literal["packed", "jsonb"] = "packed"
+
 
     class Config:
         env_file = ".env"
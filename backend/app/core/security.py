@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
@@ -12,6 +12,10 @@ from app.models.user import User
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# EventSource cannot send headers: streams take a short-lived, single-purpose token in the URL
+STREAM_TOKEN_SCOPE = "stream"
+STREAM_TOKEN_EXPIRE_SECONDS = 60
+
 # ─────────────────────────────
 # Password helpers
 # ─────────────────────────────
@@ -35,15 +39,17 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-):
-    token = credentials.credentials
+def create_stream_token(user_id) -> str:
+    return create_access_token(
+        {"sub": str(user_id), "scope": STREAM_TOKEN_SCOPE},
+        timedelta(seconds=STREAM_TOKEN_EXPIRE_SECONDS),
+    )
+
+def _user_from_token(db: Session, token: str, scope: str | None = None) -> User:
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         user_id: str | None = payload.get("sub")
-        if not user_id:
+        if not user_id or payload.get("scope") != scope:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
@@ -53,6 +59,19 @@ def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
 
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+):
+    return _user_from_token(db, credentials.credentials)
+
+def get_stream_user(
+    token: str = Query(..., description="from POST .../stream-token"),
+    db: Session = Depends(get_db),
+):
+    """ Authenticates EventSource requests by a stream token in the query string """
+    return _user_from_token(db, token, STREAM_TOKEN_SCOPE)
+
 # ─────────────────────────────
 # Role-Based Access Control (RBAC)
 # ─────────────────────────────
@@ -92,3 +111,7 @@ def get_current_player(current_user: User = Depends(get_current_user)):
             detail="PLAYER privileges required"
         )
     return current_user
+
+def get_stream_player(current_user: User = Depends(get_stream_user)):
+    """ get_current_player for EventSource streams """
+    return get_current_player(current_user)
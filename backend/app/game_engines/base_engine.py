@@ -1,9 +1,42 @@
+import copy
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from .batch import OUTCOME_NAMES, BatchResult
+from .rng import secure_rng
+
+
+class EngineConfig(BaseModel):
+    """Base for engine config schemas; unknown keys from older configs are dropped."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
 class BaseGameEngine:
-    def __init__(self, config: dict):
+    # Registry metadata (see registry.EngineRegistry)
+    name: str = ""
+    aliases: tuple[str, ...] = ()
+    config_schema: type[EngineConfig] = EngineConfig
+    batchable = False   # has run_many() for vectorized rounds
+    stateful = False    # played step by step (InteractiveRoundService)
+
+    def __init__(self, config: dict, rng=None):
         """
-        config: The engine_config JSON stored in the database.
+        config: The engine_config JSON stored in the database, validated
+                once into `self.params` (pydantic.ValidationError on bad input).
+        rng: Source of randomness (FairRNG for player rounds); defaults to the
+             calling thread's buffered CSPRNG.
         """
         self.config = config
+        self.params = self.config_schema.model_validate(config or {})
+        self.rng = rng or secure_rng()
+
+    def with_rng(self, rng=None) -> "BaseGameEngine":
+        """Same compiled engine, different randomness (shallow copy, nothing re-parsed)."""
+        clone = copy.copy(self)
+        clone.rng = rng or secure_rng()
+        return clone
 
     def validate_bet(self, bet_amount: float, min_bet: float, max_bet: float):
         if bet_amount < min_bet or bet_amount > max_bet:
@@ -13,4 +46,34 @@ class BaseGameEngine:
         """
         Accepts variable keyword arguments to handle different engine inputs.
         """
-        raise NotImplementedError("Each engine must implement its own run logic")
\ No newline at end of file
+        raise NotImplementedError("Each engine must implement its own run logic")
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """
+        Plays len(bet_amounts) rounds in one call and returns columnar results.
+
+        params: the run() kwargs, each a scalar for every round or a sequence
+                with one value per round.
+        generator: numpy Generator for batchable engines (see batch.batch_generator);
+                   simulations and load tests only, player rounds go through
+                   run() with a FairRNG.
+
+        This fallback loops over run(); batchable engines override it.
+        """
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        params = params or {}
+        per_round = {k: v for k, v in params.items() if isinstance(v, (list, tuple, np.ndarray))}
+
+        outcome = np.empty(len(bets), dtype=np.uint8)
+        win_amount = np.empty(len(bets), dtype=np.float64)
+        result_data = np.empty(len(bets), dtype=object)
+        for i, bet in enumerate(bets):
+            result = self.run(float(bet), **{**params, **{k: v[i] for k, v in per_round.items()}})
+            outcome[i] = OUTCOME_NAMES.index(result["outcome"])
+            win_amount[i] = result["win_amount"]
+            result_data[i] = result["result_data"]
+        return BatchResult(outcome, win_amount, {"result_data": result_data})
+
+    def rtp(self) -> float:
+        """Theoretical return to player; engines with a closed form override this."""
+        raise NotImplementedError
@@ -0,0 +1,66 @@
+import secrets
+
+import numpy as np
+
+
+# Outcome codes used in BatchResult.outcome (VOID: round cancelled, stake returned)
+LOSE, WIN, VOID = 0, 1, 2
+OUTCOME_NAMES = ("LOSE", "WIN", "VOID")
+
+
+def batch_generator(seed: int | None = None) -> np.random.Generator:
+    """PCG64 stream for batch play, seeded from the OS CSPRNG unless a seed is given (replays)."""
+    return np.random.default_rng(secrets.randbits(128) if seed is None else seed)
+
+
+class BatchResult:
+    """
+    Columnar results of run_many: one array entry per round.
+
+    outcome: uint8 codes (LOSE / WIN), win_amount: float64,
+    data: engine-specific arrays (e.g. {"roll": ...}) replacing the
+    per-round result_data dicts.
+    """
+
+    __slots__ = ("outcome", "win_amount", "data")
+
+    def __init__(self, outcome: np.ndarray, win_amount: np.ndarray, data: dict):
+        self.outcome = outcome
+        self.win_amount = win_amount
+        self.data = data
+
+    def __len__(self):
+        return len(self.outcome)
+
+    @property
+    def total_win(self) -> float:
+        return float(self.win_amount.sum())
+
+    def round(self, i: int) -> dict:
+        """Round i in the shape BaseGameEngine.run returns (for storing or display)."""
+        if "result_data" in self.data:
+            # Non-batchable engines keep run()'s dicts (BaseGameEngine.run_many fallback)
+            result_data = self.data["result_data"][i]
+        else:
+            result_data = {key: _scalar(values[i]) for key, values in self.data.items()}
+        return {
+            "result_data": result_data,
+            "outcome": OUTCOME_NAMES[self.outcome[i]],
+            "win_amount": float(self.win_amount[i]),
+        }
+
+
+def as_column(value, n: int, dtype=None) -> np.ndarray:
+    """Broadcast a per-call scalar or per-round sequence to n rounds."""
+    column = np.asarray(value, dtype=dtype)
+    if column.ndim == 0:
+        return np.full(n, column, dtype=column.dtype)
+    if column.shape[0] != n:
+        raise ValueError(f"Expected {n} values, got {column.shape[0]}")
+    return column
+
+
+def _scalar(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value.item() if isinstance(value, np.generic) else value
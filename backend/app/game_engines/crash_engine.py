@@ -1,20 +1,31 @@
-import random
 import math
-from .base_engine import BaseGameEngine
+
+import numpy as np
+from pydantic import Field
+
+from .base_engine import BaseGameEngine, EngineConfig
+from .batch import BatchResult, as_column, batch_generator
+
+
+class CrashConfig(EngineConfig):
+    max_multiplier: float = Field(1000, gt=1)
+    house_edge: float = Field(0.03, ge=0, lt=1)
+    growth_rate: float = Field(0.06, gt=0)
+
 
 class CrashEngine(BaseGameEngine):
+    name = "crash"
+    aliases = ("crash_engine",)
+    config_schema = CrashConfig
+    stateful = True
+    batchable = True
+
     def run(self, bet_amount: float, **kwargs):
         """
         config needs: {"max_multiplier": float, "house_edge": float}
         kwargs needs: {"target_multiplier": float}
         """
-        max_mult = self.config.get("max_multiplier", 1000)
-        house_edge = self.config.get("house_edge", 0.03)
-        
-        # Mathematical crash distribution
-        r = random.random()
-        crash_point = (1 - house_edge) / (1 - r)
-        crash_point = min(max_mult, round(crash_point, 2))
+        crash_point = self.draw_crash_point()
         
         target = kwargs.get("target_multiplier", 1.5)
         is_win = target <= crash_point
@@ -24,4 +35,50 @@ class CrashEngine(BaseGameEngine):
             "result_data": {"crash_at": crash_point, "cashed_out": target},
             "outcome": "WIN" if is_win else "LOSE",
             "win_amount": win_amount
-        }
\ No newline at end of file
+        }
+
+    def draw_crash_point(self) -> float:
+        # Mathematical crash distribution
+        r = self.rng.random()
+        crash_point = (1 - self.params.house_edge) / (1 - r)
+        return min(self.params.max_multiplier, round(crash_point, 2))
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """params: {"target_multiplier": float or one per round}"""
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        gen = generator or batch_generator()
+
+        crash_points = np.minimum(
+            self.params.max_multiplier,
+            np.round((1 - self.params.house_edge) / (1 - gen.random(len(bets))), 2),
+        )
+        target = as_column((params or {}).get("target_multiplier", 1.5), len(bets), dtype=np.float64)
+        is_win = target <= crash_points
+
+        return BatchResult(
+            is_win.astype(np.uint8),
+            np.where(is_win, bets * target, 0.0),
+            {"crash_at": crash_points, "cashed_out": target},
+        )
+
+    # ─────────────────────────────
+    # Interactive rounds
+    # ─────────────────────────────
+    def initial_state(self) -> dict:
+        """Crash point committed when the round opens."""
+        return {"crash_at": self.draw_crash_point()}
+
+    def multiplier_at(self, elapsed_seconds: float) -> float:
+        """
+        Live multiplier after `elapsed_seconds`: e^(growth_rate * t), floored
+        to 2 decimals. config: {"growth_rate": float} (default 0.06/s, ~2x at 11.5s).
+        """
+        return math.floor(math.exp(self.params.growth_rate * max(elapsed_seconds, 0.0)) * 100) / 100
+
+    def seconds_to(self, multiplier: float) -> float:
+        """Inverse of multiplier_at: seconds the live multiplier takes to reach `multiplier`."""
+        return math.log(max(multiplier, 1.0)) / self.params.growth_rate
+
+    def rtp(self) -> float:
+        # P(crash >= target) = (1 - house_edge) / target, so any fixed target returns 1 - house_edge
+        return 1 - self.params.house_edge
@@ -1,27 +1,63 @@
-import random
-from .base_engine import BaseGameEngine
+import numpy as np
+from pydantic import Field
+
+from .base_engine import BaseGameEngine, EngineConfig
+from .batch import BatchResult, as_column, batch_generator
+
+
+class DiceConfig(EngineConfig):
+    multiplier: float = Field(1.98, gt=0)
+    house_edge: float = Field(0.02, ge=0, lt=1)
+
 
 class DiceEngine(BaseGameEngine):
+    name = "dice"
+    aliases = ("dice_engine",)
+    config_schema = DiceConfig
+    batchable = True
+
+    def __init__(self, config: dict, rng=None):
+        super().__init__(config, rng)
+        # Adjusting payout based on house edge if not already baked into multiplier
+        self.adjusted_multiplier = self.params.multiplier * (1 - self.params.house_edge)
+
     def run(self, bet_amount: float, **kwargs):
         """
         config needs: {"multiplier": float, "house_edge": float}
         kwargs needs: {"player_choice": str}  # e.g., "EVEN", "ODD"
         """
-        multiplier = self.config.get("multiplier", 1.98)
-        house_edge = self.config.get("house_edge", 0.02)
-        
-        # Adjusting payout based on house edge if not already baked into multiplier
-        adjusted_multiplier = multiplier * (1 - house_edge)
-        
-        roll = random.randint(1, 6)
+        roll = self.rng.randint(1, 6)
         result_type = "EVEN" if roll % 2 == 0 else "ODD"
         
-        player_choice = kwargs.get("player_choice", "").upper()
+        player_choice = (kwargs.get("player_choice") or "").upper()
         is_win = player_choice == result_type
-        win_amount = bet_amount * adjusted_multiplier if is_win else 0.0
+        win_amount = bet_amount * self.adjusted_multiplier if is_win else 0.0
 
         return {
             "result_data": {"roll": roll, "result": result_type},
             "outcome": "WIN" if is_win else "LOSE",
             "win_amount": round(win_amount, 2)
-        }
\ No newline at end of file
+        }
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """params: {"player_choice": "EVEN" | "ODD" or one per round}"""
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        gen = generator or batch_generator()
+
+        rolls = gen.integers(1, 7, size=len(bets), dtype=np.int8)
+        choice = (params or {}).get("player_choice") or ""
+        if isinstance(choice, str):
+            choice = choice.upper()
+        else:
+            choice = np.char.upper(as_column(choice, len(bets), dtype=str))
+        is_win = np.where(rolls % 2 == 0, choice == "EVEN", choice == "ODD")
+
+        return BatchResult(
+            is_win.astype(np.uint8),
+            np.where(is_win, np.round(bets * self.adjusted_multiplier, 2), 0.0),
+            {"roll": rolls},
+        )
+
+    def rtp(self) -> float:
+        # Even and odd each come up 3 times in 6
+        return 0.5 * self.adjusted_multiplier
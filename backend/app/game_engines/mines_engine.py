@@ -1,16 +1,38 @@
 import math
-from .base_engine import BaseGameEngine
+
+import numpy as np
+from pydantic import Field, model_validator
+
+from .base_engine import BaseGameEngine, EngineConfig
+from .batch import BatchResult, as_column, batch_generator
+
+
+class MinesConfig(EngineConfig):
+    grid_size: int = Field(25, ge=2, le=100)
+    mine_count: int = Field(3, ge=1)
+    multiplier_curve: float = Field(0.97, gt=0)
+
+    @model_validator(mode="after")
+    def _leave_a_safe_cell(self):
+        if self.mine_count >= self.grid_size:
+            raise ValueError("mine_count must be smaller than grid_size")
+        return self
+
 
 class MinesEngine(BaseGameEngine):
+    name = "mines"
+    aliases = ("mines_engine",)
+    config_schema = MinesConfig
+    stateful = True
+    batchable = True
+
     def run(self, bet_amount: float, **kwargs):
         """
         config needs: {"grid_size": int, "mine_count": int, "multiplier_curve": float}
         kwargs needs: {"successful_picks": int}
         """
-        grid_size = self.config.get("grid_size", 25)
-        mines = self.config.get("mine_count", 3)
+        mines = self.params.mine_count
         picks = kwargs.get("successful_picks", 0) # Default to 0
-        curve = self.config.get("multiplier_curve", 0.97)
 
         # 🎯 FIX: If 0 picks, it's a LOSS (Player hit a mine immediately or logic failed)
         if picks == 0:
@@ -21,11 +43,7 @@ class MinesEngine(BaseGameEngine):
                 "multiplier": 0.0
             }
         
-        # Calculate theoretical multiplier: nCr(total, mines) / nCr(remaining, mines)
-        total_combinations = math.comb(grid_size, mines)
-        remaining_combinations = math.comb(grid_size - picks, mines)
-        
-        multiplier = (total_combinations / remaining_combinations) * curve
+        multiplier = self.multiplier_for(picks)
         win_amount = bet_amount * multiplier
 
         return {
@@ -33,4 +51,57 @@ class MinesEngine(BaseGameEngine):
             "outcome": "WIN",
             "win_amount": round(win_amount, 2),
             "multiplier": round(multiplier, 2)
-        }
\ No newline at end of file
+        }
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """
+        params: {"successful_picks": int or one per round}, read here as the
+        number of picks the player cashes out after. Each round draws how many
+        safe cells a random pick order uncovers before the first mine.
+        """
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        gen = generator or batch_generator()
+        grid_size, mines = self.params.grid_size, self.params.mine_count
+
+        target = as_column((params or {}).get("successful_picks", 0), len(bets), dtype=np.int64)
+        if (target > grid_size - mines).any():
+            raise ValueError(f"successful_picks cannot exceed {grid_size - mines} safe cells")
+
+        # survival[k] = P(first k picks are all safe); inverse-CDF draw of the safe run length
+        survival = np.array([
+            math.comb(grid_size - k, mines) / math.comb(grid_size, mines) for k in range(grid_size - mines + 1)
+        ])
+        safe_run = (gen.random(len(bets))[:, None] < survival[1:]).sum(axis=1)
+
+        is_win = (target > 0) & (safe_run >= target)
+        multipliers = np.array([self.multiplier_for(k) if k else 0.0 for k in range(grid_size - mines + 1)])[target]
+        return BatchResult(
+            is_win.astype(np.uint8),
+            np.where(is_win, np.round(bets * multipliers, 2), 0.0),
+            {"picks": np.minimum(safe_run, target), "hit_mine": safe_run < target},
+        )
+
+    # ─────────────────────────────
+    # Interactive rounds
+    # ─────────────────────────────
+    def multiplier_for(self, picks: int) -> float:
+        grid_size, mines = self.params.grid_size, self.params.mine_count
+
+        # Calculate theoretical multiplier: nCr(total, mines) / nCr(remaining, mines)
+        total_combinations = math.comb(grid_size, mines)
+        remaining_combinations = math.comb(grid_size - picks, mines)
+        return (total_combinations / remaining_combinations) * self.params.multiplier_curve
+
+    def initial_state(self) -> dict:
+        """Mine layout committed when the round opens (partial Fisher-Yates)."""
+        grid_size, mines = self.params.grid_size, self.params.mine_count
+
+        cells = list(range(grid_size))
+        for i in range(mines):
+            j = i + self.rng.randbelow(grid_size - i)
+            cells[i], cells[j] = cells[j], cells[i]
+        return {"layout": sorted(cells[:mines])}
+
+    def rtp(self) -> float:
+        # Surviving k picks has probability 1 / (the fair multiplier), so every cash-out point returns the curve
+        return self.params.multiplier_curve
@@ -1,24 +1,178 @@
-import random
-from .base_engine import BaseGameEngine
+import math
+from bisect import bisect_right
+from typing import Literal, Optional
+
+import numpy as np
+from pydantic import Field, field_validator, model_validator
+
+from .base_engine import BaseGameEngine, EngineConfig
+from .batch import BatchResult, batch_generator
+
+
+PLINKO_MIN_ROWS, PLINKO_MAX_ROWS = 8, 16
+
+# Symmetric payout tables (edge bucket first), ~99% RTP each
+PLINKO_MULTIPLIERS = {
+    "low": {
+        8: [5.6, 2.1, 1.1, 1, 0.5],
+        9: [5.6, 2, 1.6, 1, 0.7],
+        10: [8.9, 3, 1.4, 1.1, 1, 0.5],
+        11: [8.4, 3, 1.9, 1.3, 1, 0.7],
+        12: [10, 3, 1.6, 1.4, 1.1, 1, 0.5],
+        13: [8.1, 4, 3, 1.9, 1.2, 0.9, 0.7],
+        14: [7.1, 4, 1.9, 1.4, 1.3, 1.1, 1, 0.5],
+        15: [15, 8, 3, 2, 1.5, 1.1, 1, 0.7],
+        16: [16, 9, 2, 1.4, 1.4, 1.2, 1.1, 1, 0.5],
+    },
+    "medium": {
+        8: [13, 3, 1.3, 0.7, 0.4],
+        9: [18, 4, 1.7, 0.9, 0.5],
+        10: [22, 5, 2, 1.4, 0.6, 0.4],
+        11: [24, 6, 3, 1.8, 0.7, 0.5],
+        12: [33, 11, 4, 2, 1.1, 0.6, 0.3],
+        13: [43, 13, 6, 3, 1.3, 0.7, 0.4],
+        14: [58, 15, 7, 4, 1.9, 1, 0.5, 0.2],
+        15: [88, 18, 11, 5, 3, 1.3, 0.5, 0.3],
+        16: [110, 41, 10, 5, 3, 1.5, 1, 0.5, 0.3],
+    },
+    "high": {
+        8: [29, 4, 1.5, 0.3, 0.2],
+        9: [43, 7, 2, 0.6, 0.2],
+        10: [76, 10, 3, 0.9, 0.3, 0.2],
+        11: [120, 14, 5.2, 1.4, 0.4, 0.2],
+        12: [170, 24, 8.1, 2, 0.7, 0.2, 0.2],
+        13: [260, 37, 11, 4, 1, 0.2, 0.2],
+        14: [420, 56, 18, 5, 1.9, 0.3, 0.2, 0.2],
+        15: [620, 83, 27, 8, 3, 0.5, 0.2, 0.2],
+        16: [1000, 130, 26, 9, 4, 2, 0.2, 0.2, 0.2],
+    },
+}
+
+# cumulative C(rows, k) counts: bucket k owns [CDF[k-1], CDF[k]) of the 2^rows equally likely drops
+_BINOMIAL_CDF = {
+    rows: [sum(math.comb(rows, j) for j in range(k + 1)) for k in range(rows + 1)]
+    for rows in range(PLINKO_MIN_ROWS, PLINKO_MAX_ROWS + 1)
+}
+
+
+def plinko_multipliers(rows: int, risk_level: str) -> list[float]:
+    half = [float(m) for m in PLINKO_MULTIPLIERS[risk_level][rows]]
+    # Even rows have an odd bucket count, so the centre bucket appears once
+    return half + half[::-1][1:] if rows % 2 == 0 else half + half[::-1]
+
+
+def plinko_path(rows: int, bucket: int, offset: int) -> list[int]:
+    """
+    The offset-th (lexicographic) arrangement of `bucket` right bounces
+    over `rows` pegs: 0 = left, 1 = right. Deterministic, so clients can
+    ask for it after the fact without another draw.
+    """
+    path = []
+    rights = bucket
+    for remaining in range(rows, 0, -1):
+        # Arrangements that go left here
+        left_count = math.comb(remaining - 1, rights)
+        if offset < left_count:
+            path.append(0)
+        else:
+            offset -= left_count
+            path.append(1)
+            rights -= 1
+    return path
+
+
+class PlinkoConfig(EngineConfig):
+    rows: int = Field(8, ge=PLINKO_MIN_ROWS, le=PLINKO_MAX_ROWS)
+    risk_level: Literal["low", "medium", "high"] = "medium"
+    # Overrides the risk table; the admin form sends blank entries for unused inputs
+    bucket_multipliers: Optional[list[float]] = None
+
+    @field_validator("risk_level", mode="before")
+    @classmethod
+    def _lowercase(cls, value):
+        return str(value).lower()
+
+    @field_validator("bucket_multipliers", mode="before")
+    @classmethod
+    def _drop_blanks(cls, value):
+        custom = [m for m in value or [] if str(m).strip() != ""]
+        return custom or None
+
+    @model_validator(mode="after")
+    def _one_per_bucket(self):
+        if self.bucket_multipliers and len(self.bucket_multipliers) != self.rows + 1:
+            raise ValueError(
+                f"bucket_multipliers needs {self.rows + 1} entries for {self.rows} rows, "
+                f"got {len(self.bucket_multipliers)}"
+            )
+        return self
+
 
 class PlinkoEngine(BaseGameEngine):
+    name = "plinko"
+    aliases = ("plinko_engine",)
+    config_schema = PlinkoConfig
+    batchable = True
+
+    def __init__(self, config: dict, rng=None):
+        """
+        config: {"rows": 8-16, "risk_level": "low" | "medium" | "high",
+                 "bucket_multipliers": optional list of rows + 1 payouts (overrides the risk table)}
+        """
+        super().__init__(config, rng)
+
+        self.rows = self.params.rows
+        self.risk_level = self.params.risk_level
+        self.multipliers = self.params.bucket_multipliers or plinko_multipliers(self.rows, self.risk_level)
+        self.cdf = _BINOMIAL_CDF[self.rows]
+
     def run(self, bet_amount: float, **kwargs):
         """
-        config needs: {"rows": int, "risk_level": str, "bucket_multipliers": list}
+        kwargs: {"include_path": bool} adds the left/right path for animation.
+        One draw picks one of the 2^rows equally likely drops; the bucket is
+        its CDF interval, so no per-row flips are simulated.
         """
-        rows = self.config.get("rows", 8)
-        # Multipliers are mapped based on the final horizontal index (0 to rows)
-        multipliers = self.config.get("bucket_multipliers", [5, 2, 0.5, 0.2, 0.2, 0.5, 2, 5])
-        
-        # Simulate ball falling: 0 = left, 1 = right
-        path = [random.randint(0, 1) for _ in range(rows)]
-        final_index = sum(path)
-        
-        multiplier = multipliers[final_index]
-        win_amount = bet_amount * multiplier
+        drop = self.rng.randbelow(1 << self.rows)
+        bucket = bisect_right(self.cdf, drop)
+        offset = drop - (self.cdf[bucket - 1] if bucket else 0)
+
+        multiplier = self.multipliers[bucket]
+        result_data = {
+            "bucket": bucket,
+            "drop": offset,
+            "rows": self.rows,
+            "risk_level": self.risk_level,
+            "multiplier": multiplier,
+        }
+        if kwargs.get("include_path"):
+            result_data["path"] = self.path_for(bucket, offset)
 
         return {
-            "result_data": {"path": path, "bucket": final_index},
+            "result_data": result_data,
             "outcome": "WIN" if multiplier >= 1 else "LOSE",
-            "win_amount": win_amount
-        }
\ No newline at end of file
+            "win_amount": round(bet_amount * multiplier, 2),
+        }
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """Same single-draw mapping as run(); paths are left to path_for on demand."""
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        gen = generator or batch_generator()
+
+        cdf = np.asarray(self.cdf, dtype=np.int64)
+        drops = gen.integers(0, 1 << self.rows, size=len(bets), dtype=np.int64)
+        buckets = np.searchsorted(cdf, drops, side="right")
+        offsets = drops - np.where(buckets > 0, cdf[buckets - 1], 0)
+        multipliers = np.asarray(self.multipliers, dtype=np.float64)[buckets]
+
+        return BatchResult(
+            (multipliers >= 1).astype(np.uint8),
+            np.round(bets * multipliers, 2),
+            {"bucket": buckets.astype(np.int8), "drop": offsets, "multiplier": multipliers},
+        )
+
+    def path_for(self, bucket: int, offset: int) -> list[int]:
+        return plinko_path(self.rows, bucket, offset)
+
+    def rtp(self) -> float:
+        """Theoretical return of the configured table."""
+        return sum(math.comb(self.rows, k) * m for k, m in enumerate(self.multipliers)) / (1 << self.rows)
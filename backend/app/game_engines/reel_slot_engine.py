@@ -0,0 +1,258 @@
+import json
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field, model_validator
+
+from .base_engine import BaseGameEngine, EngineConfig
+
+
+# Reference 5x3 with 10 lines (engine checks, benchmark); games must bring their own reels
+DEFAULT_REEL_CONFIG = {
+    "rows": 3,
+    "reel_strips": [
+        ["A", "K", "Q", "J", "10", "W", "A", "K", "Q", "J", "10", "S", "A", "K", "Q", "J", "10", "7"],
+    ] * 5,
+    "paylines": [
+        [1, 1, 1, 1, 1], [0, 0, 0, 0, 0], [2, 2, 2, 2, 2], [0, 1, 2, 1, 0], [2, 1, 0, 1, 2],
+        [0, 0, 1, 2, 2], [2, 2, 1, 0, 0], [1, 0, 0, 0, 1], [1, 2, 2, 2, 1], [0, 1, 1, 1, 0],
+    ],
+    "paytable": {
+        "7": {"3": 20, "4": 100, "5": 500},
+        "A": {"3": 5, "4": 20, "5": 100},
+        "K": {"3": 4, "4": 15, "5": 75},
+        "Q": {"3": 3, "4": 10, "5": 50},
+        "J": {"3": 2, "4": 8, "5": 40},
+        "10": {"3": 1, "4": 5, "5": 25},
+        "W": {"3": 25, "4": 150, "5": 1000},
+    },
+    "wild": "W",
+    "scatter": "S",
+    "scatter_pays": {"3": 2, "4": 10, "5": 50},
+}
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table over integer weights: O(1) weighted draws.
+
+    Built in integer arithmetic (no float rounding), so a FairRNG replay
+    lands on exactly the same outcome everywhere. A draw is one index and
+    one threshold comparison.
+    """
+
+    __slots__ = ("n", "total", "threshold", "alias")
+
+    def __init__(self, weights: list[int]):
+        if not weights or any(not isinstance(w, int) or w < 0 for w in weights) or sum(weights) == 0:
+            raise ValueError("Alias table weights must be non-negative integers with a positive sum")
+
+        n, total = len(weights), sum(weights)
+        # Bucket i holds scaled[i] of its own mass (out of `total`), the rest belongs to alias[i]
+        scaled = [w * n for w in weights]
+        threshold, alias = [total] * n, list(range(n))
+
+        small = [i for i, s in enumerate(scaled) if s < total]
+        large = [i for i, s in enumerate(scaled) if s >= total]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            threshold[s], alias[s] = scaled[s], l
+            scaled[l] -= total - scaled[s]
+            (small if scaled[l] < total else large).append(l)
+
+        self.n, self.total = n, total
+        self.threshold, self.alias = threshold, alias
+
+    def sample(self, rng) -> int:
+        i = rng.randbelow(self.n)
+        return i if rng.randbelow(self.total) < self.threshold[i] else self.alias[i]
+
+
+class CompiledReels:
+    """
+    A reel configuration turned into flat integer lookups.
+
+    Symbols become ints; every strip position maps to its precomputed
+    visible window (so a spin indexes instead of slicing/wrapping); each
+    payline is a tuple of flat grid indices; pays are a [symbol][count]
+    matrix. Built once per distinct config (see compile_reels).
+    """
+
+    __slots__ = (
+        "symbols", "reels", "rows", "windows", "scatter_counts", "stop_tables",
+        "lines", "pays", "wild", "scatter", "scatter_pays",
+    )
+
+    def __init__(self, config: dict):
+        rows = config.get("rows", 3)
+        strips = config.get("reel_strips")
+        if not strips or any(len(strip) < rows for strip in strips):
+            raise ValueError("reel_strips must list at least `rows` symbols per reel")
+        reels = len(strips)
+
+        symbols = sorted({s for strip in strips for s in strip} | set(config.get("paytable", {})))
+        index = {s: i for i, s in enumerate(symbols)}
+        wild = index.get(config.get("wild"), -1)
+        scatter = index.get(config.get("scatter"), -1)
+
+        # Visible window per stop: rows consecutive symbols, wrapping around the strip
+        windows, scatter_counts = [], []
+        for strip in strips:
+            coded = [index[s] for s in strip]
+            reel_windows = [tuple(coded[(stop + k) % len(coded)] for k in range(rows)) for stop in range(len(coded))]
+            windows.append(reel_windows)
+            scatter_counts.append([w.count(scatter) for w in reel_windows])
+
+        stop_weights = config.get("stop_weights")
+        stop_tables = []
+        for r, strip in enumerate(strips):
+            weights = stop_weights[r] if stop_weights else None
+            if weights is not None and len(weights) != len(strip):
+                raise ValueError(f"stop_weights[{r}] must have one weight per strip position")
+            stop_tables.append(AliasTable(weights) if weights else len(strip))
+
+        paylines = config.get("paylines") or [[rows // 2] * reels]
+        lines = []
+        for line in paylines:
+            if len(line) != reels or any(not 0 <= row < rows for row in line):
+                raise ValueError(f"Payline {line} does not fit a {reels}x{rows} grid")
+            # Grid is column-major: cell (reel, row) sits at reel * rows + row
+            lines.append(tuple(reel * rows + row for reel, row in enumerate(line)))
+
+        pays = [[0.0] * (reels + 1) for _ in symbols]
+        for symbol, by_count in config.get("paytable", {}).items():
+            for count, multiplier in by_count.items():
+                pays[index[symbol]][int(count)] = float(multiplier)
+
+        scatter_pays = [0.0] * (reels * rows + 1)
+        for count, multiplier in config.get("scatter_pays", {}).items():
+            scatter_pays[int(count)] = float(multiplier)
+
+        self.symbols, self.reels, self.rows = symbols, reels, rows
+        self.windows, self.scatter_counts, self.stop_tables = windows, scatter_counts, stop_tables
+        self.lines, self.pays = lines, pays
+        self.wild, self.scatter, self.scatter_pays = wild, scatter, scatter_pays
+
+    def spin_stops(self, rng) -> list[int]:
+        return [
+            table.sample(rng) if isinstance(table, AliasTable) else rng.randbelow(table)
+            for table in self.stop_tables
+        ]
+
+    def evaluate(self, stops: list[int]):
+        """(grid, line_wins, scatter_count, total_line_multiplier, scatter_multiplier) for the stops."""
+        grid = ()
+        scatters = 0
+        for reel, stop in enumerate(stops):
+            grid += self.windows[reel][stop]
+            scatters += self.scatter_counts[reel][stop]
+
+        wild, scatter, pays = self.wild, self.scatter, self.pays
+        line_wins = []
+        line_total = 0.0
+        for line_no, cells in enumerate(self.lines):
+            symbol, count, leading_wilds = -1, 0, 0
+            for cell in cells:
+                value = grid[cell]
+                if value == wild:
+                    count += 1
+                    if symbol == -1:
+                        leading_wilds += 1
+                elif symbol == -1 and value != scatter:
+                    symbol = value
+                    count += 1
+                elif value == symbol:
+                    count += 1
+                else:
+                    break
+
+            pay = pays[symbol][count] if symbol != -1 else 0.0
+            # A run of wilds may be worth more on its own than the symbol it completes
+            if leading_wilds and wild != -1 and pays[wild][leading_wilds] > pay:
+                symbol, count, pay = wild, leading_wilds, pays[wild][leading_wilds]
+            if pay:
+                line_total += pay
+                line_wins.append((line_no, symbol, count, pay))
+
+        return grid, line_wins, scatters, line_total, self.scatter_pays[scatters] if scatter != -1 else 0.0
+
+
+@lru_cache(maxsize=256)
+def _compile(config_key: str) -> CompiledReels:
+    return CompiledReels(json.loads(config_key))
+
+
+def compile_reels(config: dict) -> CompiledReels:
+    """Compiled tables for a config, shared by every spin of every game using it."""
+    return _compile(json.dumps(config, sort_keys=True))
+
+
+class ReelSlotConfig(EngineConfig):
+    rows: int = Field(3, ge=1, le=10)
+    reel_strips: list[list[str]] = Field(min_length=1)
+    stop_weights: Optional[list[list[int]]] = None
+    paylines: list[list[int]] = Field(default_factory=list)
+    paytable: dict[str, dict[str, float]] = Field(default_factory=dict)
+    wild: Optional[str] = None
+    scatter: Optional[str] = None
+    scatter_pays: dict[str, float] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _counts_fit_the_grid(self):
+        reels = len(self.reel_strips)
+        for symbol, by_count in self.paytable.items():
+            for count in by_count:
+                if not count.isdigit() or not 1 <= int(count) <= reels:
+                    raise ValueError(f"paytable[{symbol}] count {count} must be between 1 and {reels} (reels)")
+        for count in self.scatter_pays:
+            if not count.isdigit() or not 1 <= int(count) <= reels * self.rows:
+                raise ValueError(f"scatter_pays count {count} must be between 1 and {reels * self.rows} (cells)")
+        return self
+
+
+class ReelSlotEngine(BaseGameEngine):
+    """
+    Reel-strip slot: N reels x M rows, weighted stops, paylines, wild and scatter.
+
+    config: {
+        "rows": int,
+        "reel_strips": [[symbol, ...], ...],        # one strip per reel
+        "stop_weights": [[int, ...], ...],          # optional, per strip position
+        "paylines": [[row per reel], ...],
+        "paytable": {symbol: {count: multiplier}},  # left-to-right, per line bet
+        "wild": symbol, "scatter": symbol,
+        "scatter_pays": {count: multiplier}         # anywhere, times the total bet
+    }
+    The bet is split evenly across paylines.
+    """
+
+    name = "reel_slot"
+    aliases = ("reel_slot_engine",)
+    config_schema = ReelSlotConfig
+
+    def __init__(self, config: dict, rng=None):
+        super().__init__(config, rng)
+        self.compiled = compile_reels(self.params.model_dump(exclude_none=True))
+
+    def run(self, bet_amount: float, **kwargs):
+        compiled = self.compiled
+        stops = compiled.spin_stops(self.rng)
+        grid, line_wins, scatters, line_total, scatter_multiplier = compiled.evaluate(stops)
+
+        line_bet = bet_amount / len(compiled.lines)
+        win_amount = round(line_bet * line_total + bet_amount * scatter_multiplier, 2)
+
+        symbols, rows = compiled.symbols, compiled.rows
+        return {
+            "result_data": {
+                "stops": stops,
+                "grid": [[symbols[s] for s in grid[r * rows:(r + 1) * rows]] for r in range(compiled.reels)],
+                "lines": [
+                    {"line": line_no, "symbol": symbols[symbol], "count": count, "multiplier": pay}
+                    for line_no, symbol, count, pay in line_wins
+                ],
+                "scatters": scatters,
+            },
+            "outcome": "WIN" if win_amount > 0 else "LOSE",
+            "win_amount": win_amount,
+        }
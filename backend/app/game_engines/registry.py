@@ -0,0 +1,146 @@
+import json
+import logging
+import threading
+from importlib.metadata import entry_points
+
+from pydantic import ValidationError
+
+from app.core.cache import TTLCache
+
+from .base_engine import BaseGameEngine
+from .crash_engine import CrashEngine
+from .dice_engine import DiceEngine
+from .mines_engine import MinesEngine
+from .plink_engine import PlinkoEngine
+from .reel_slot_engine import ReelSlotEngine
+from .slot_engine import SlotEngine
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages expose engines as:
+#   [project.entry-points."casino_platform.game_engines"]
+#   wheel = "acme_games.wheel:WheelEngine"
+ENTRY_POINT_GROUP = "casino_platform.game_engines"
+
+BUILTIN_ENGINES = (DiceEngine, SlotEngine, ReelSlotEngine, CrashEngine, MinesEngine, PlinkoEngine)
+
+
+class UnknownEngineError(LookupError):
+    pass
+
+
+class EngineConfigError(ValueError):
+    def __init__(self, engine_type: str, errors: list):
+        self.engine_type = engine_type
+        self.errors = errors
+        super().__init__(f"Invalid {engine_type} config: " + "; ".join(errors))
+
+
+class EngineRegistry:
+    """
+    Name -> engine class, for the built-ins and any installed plugins.
+
+    Engines are validated and compiled once per game config; `engine()`
+    hands out a shallow copy of that prototype bound to the round's rng,
+    so a spin never parses config.
+    """
+
+    def __init__(self, prototype_ttl_seconds: float = 3600.0):
+        self._classes: dict[str, type[BaseGameEngine]] = {}
+        self._aliases: dict[str, str] = {}
+        self._prototypes = TTLCache(ttl_seconds=prototype_ttl_seconds, max_entries=1024)
+        self._plugins_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, engine_cls: type[BaseGameEngine], replace: bool = False):
+        if not issubclass(engine_cls, BaseGameEngine) or not engine_cls.name:
+            raise TypeError(f"{engine_cls!r} must subclass BaseGameEngine and set a name")
+        for key in (engine_cls.name, *engine_cls.aliases):
+            owner = self._aliases.get(key)
+            if owner and owner != engine_cls.name and not replace:
+                raise ValueError(f"Engine name '{key}' is already registered by '{owner}'")
+        self._classes[engine_cls.name] = engine_cls
+        for key in (engine_cls.name, *engine_cls.aliases):
+            self._aliases[key] = engine_cls.name
+        return engine_cls
+
+    def load_entry_points(self):
+        """Register plugin engines once per process; a broken plugin is logged and skipped."""
+        with self._lock:
+            if self._plugins_loaded:
+                return
+            self._plugins_loaded = True
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                try:
+                    self.register(ep.load())
+                except Exception:
+                    logger.exception("Failed to load game engine plugin %s", ep.value)
+
+    # ─────────────────────────────
+    # Lookup
+    # ─────────────────────────────
+    def get(self, engine_type: str) -> type[BaseGameEngine]:
+        self.load_entry_points()
+        name = self._aliases.get(engine_type)
+        if name is None:
+            raise UnknownEngineError(engine_type)
+        return self._classes[name]
+
+    @staticmethod
+    def resolve_type(engine_type: str, config: dict | None) -> str:
+        # Slots configured with reel strips get the reel engine
+        if engine_type in ("slot", "slot_engine") and (config or {}).get("reel_strips"):
+            return ReelSlotEngine.name
+        return engine_type
+
+    def specs(self) -> list[dict]:
+        self.load_entry_points()
+        return [
+            {
+                "name": cls.name,
+                "aliases": list(cls.aliases),
+                "capabilities": {
+                    "batchable": cls.batchable,
+                    "stateful": cls.stateful,
+                    "analytic_rtp": cls.rtp is not BaseGameEngine.rtp,
+                },
+                "config_schema": cls.config_schema.model_json_schema(),
+            }
+            for cls in sorted(self._classes.values(), key=lambda c: c.name)
+        ]
+
+    # ─────────────────────────────
+    # Validation / construction
+    # ─────────────────────────────
+    def validate_config(self, engine_type: str, config: dict | None) -> dict:
+        """Normalized config to store for a game; raises EngineConfigError."""
+        engine = self._build(self.get(self.resolve_type(engine_type, config)), config or {})
+        return engine.params.model_dump(mode="json", exclude_none=True)
+
+    def engine(self, engine_type: str, config: dict | None, rng=None, cache_key=None) -> BaseGameEngine:
+        """
+        A ready engine for one round. `cache_key` should change whenever the
+        config does (e.g. game id + updated_at); without one the config itself is the key.
+        """
+        cls = self.get(self.resolve_type(engine_type, config))
+        key = (cls.name, cache_key if cache_key is not None else json.dumps(config or {}, sort_keys=True, default=str))
+        prototype = self._prototypes.get_or_set(key, lambda: self._build(cls, config or {}))
+        return prototype.with_rng(rng)
+
+    def clear(self):
+        self._prototypes.clear()
+
+    @staticmethod
+    def _build(cls: type[BaseGameEngine], config: dict) -> BaseGameEngine:
+        try:
+            return cls(config)
+        except ValidationError as e:
+            errors = [f"{'.'.join(str(p) for p in err['loc']) or 'config'}: {err['msg']}" for err in e.errors()]
+            raise EngineConfigError(cls.name, errors) from e
+        except (ValueError, TypeError, KeyError) as e:
+            raise EngineConfigError(cls.name, [str(e)]) from e
+
+
+engine_registry = EngineRegistry()
+for _engine_cls in BUILTIN_ENGINES:
+    engine_registry.register(_engine_cls)
@@ -0,0 +1,272 @@
+"""
+Packed encoding of GameRound result payloads (game_rounds.result_blob).
+
+    byte 0   format version (FORMAT_VERSION)
+    byte 1   engine code (ENGINE_CODES, 0 = not engine-specific)
+    byte 2   flags: which derivable fields were dropped
+    ...      the remaining payload as one tagged value
+
+Values use a small tagged binary form: varints, 2-decimal floats as
+integer cents, hex / UUID strings as raw bytes, dict keys from a fixed
+key table. Per-engine hooks drop fields that can be rebuilt from the
+rest (dice parity, plinko path). encode() checks its own output decodes
+to the input and otherwise falls back to plain JSON, so packing is
+never lossy.
+"""
+import json
+import struct
+import uuid
+
+from app.core.config import settings
+
+from .plink_engine import plinko_path
+
+FORMAT_VERSION = 1
+JSON_FORMAT = 0  # version byte of the lossless fallback: JSON text follows
+
+ENGINE_CODES = {"dice": 1, "slot": 2, "crash": 3, "mines": 4, "plinko": 5, "reel_slot": 6}
+
+# Append only: a key's position is its wire code
+KEYS = (
+    "roll", "result", "spin", "crash_at", "cashed_out", "picks", "mines", "message",
+    "bucket", "drop", "rows", "risk_level", "multiplier", "path", "fairness",
+    "server_seed_hash", "client_seed", "nonce", "inputs", "include_path", "player_choice",
+    "target_multiplier", "successful_picks", "interactive", "layout", "revealed", "hit",
+    "auto_cashout", "stops", "grid", "lines", "line", "symbol", "count", "scatters",
+    "table_round_id", "table_round", "status", "crash_point",
+)
+_KEY_CODES = {key: i + 1 for i, key in enumerate(KEYS)}
+
+_NONE, _FALSE, _TRUE, _UINT, _NEGINT, _CENTS, _NEGCENTS, _FLOAT, _STR, _HEX, _UUID, _LIST, _DICT = range(13)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Flags
+_DICE_RESULT = 1
+_PLINKO_PATH = 1
+
+
+# ─────────────────────────────
+# Tagged values
+# ─────────────────────────────
+def _put_uint(out: bytearray, n: int):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_str(out: bytearray, s: str):
+    raw = s.encode()
+    _put_uint(out, len(raw))
+    out += raw
+
+
+def _put_value(out: bytearray, value):
+    if value is None:
+        out.append(_NONE)
+    elif value is True or value is False:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        out.append(_UINT if value >= 0 else _NEGINT)
+        _put_uint(out, abs(value))
+    elif isinstance(value, float):
+        cents = round(value * 100)
+        if cents / 100 == value and abs(cents) < 1 << 53:
+            out.append(_CENTS if cents >= 0 else _NEGCENTS)
+            _put_uint(out, abs(cents))
+        else:
+            out.append(_FLOAT)
+            out += struct.pack("<d", value)
+    elif isinstance(value, str):
+        if len(value) >= 16 and len(value) % 2 == 0 and _HEX_DIGITS.issuperset(value):
+            out.append(_HEX)
+            _put_uint(out, len(value) // 2)
+            out += bytes.fromhex(value)
+        elif len(value) == 36 and value.count("-") == 4 and _is_uuid(value):
+            out.append(_UUID)
+            out += uuid.UUID(value).bytes
+        else:
+            out.append(_STR)
+            _put_str(out, value)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _put_uint(out, len(value))
+        for item in value:
+            _put_value(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _put_uint(out, len(value))
+        for key, item in value.items():
+            code = _KEY_CODES.get(key)
+            if code:
+                _put_uint(out, code)
+            else:
+                out.append(0)
+                _put_str(out, str(key))
+            _put_value(out, item)
+    else:
+        raise TypeError(f"Cannot pack {type(value).__name__}")
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        return str(uuid.UUID(value)) == value
+    except ValueError:
+        return False
+
+
+def _get_uint(buf: bytes, pos: int):
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    n, shift = byte & 0x7F, 7
+    pos += 1
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _get_value(buf: bytes, pos: int):
+    """(value, next position); tags checked roughly by how often they occur."""
+    tag = buf[pos]
+    pos += 1
+    if tag == _UINT:
+        return _get_uint(buf, pos)
+    if tag == _DICT:
+        count, pos = _get_uint(buf, pos)
+        result = {}
+        for _ in range(count):
+            code = buf[pos]
+            if code and code < 0x80:
+                key, pos = KEYS[code - 1], pos + 1
+            elif code:
+                code, pos = _get_uint(buf, pos)
+                key = KEYS[code - 1]
+            else:
+                length, pos = _get_uint(buf, pos + 1)
+                key, pos = buf[pos:pos + length].decode(), pos + length
+            result[key], pos = _get_value(buf, pos)
+        return result, pos
+    if tag == _CENTS:
+        cents, pos = _get_uint(buf, pos)
+        return cents / 100, pos
+    if tag == _LIST:
+        count, pos = _get_uint(buf, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _get_value(buf, pos)
+            items.append(item)
+        return items, pos
+    if tag == _STR:
+        length, pos = _get_uint(buf, pos)
+        return buf[pos:pos + length].decode(), pos + length
+    if tag == _HEX:
+        length, pos = _get_uint(buf, pos)
+        return buf[pos:pos + length].hex(), pos + length
+    if tag == _UUID:
+        return str(uuid.UUID(bytes=buf[pos:pos + 16])), pos + 16
+    if tag == _NEGINT:
+        n, pos = _get_uint(buf, pos)
+        return -n, pos
+    if tag == _NEGCENTS:
+        cents, pos = _get_uint(buf, pos)
+        return -cents / 100, pos
+    if tag == _FLOAT:
+        return struct.unpack_from("<d", buf, pos)[0], pos + 8
+    if tag <= _TRUE:
+        return (None, False, True)[tag], pos
+    raise ValueError(f"Unknown value tag {tag}")
+
+
+# ─────────────────────────────
+# Per-engine derivable fields
+# ─────────────────────────────
+def _strip_dice(data: dict) -> int:
+    roll = data.get("roll")
+    if isinstance(roll, int) and data.get("result") == ("EVEN" if roll % 2 == 0 else "ODD"):
+        del data["result"]
+        return _DICE_RESULT
+    return 0
+
+
+def _restore_dice(data: dict, flags: int):
+    if flags & _DICE_RESULT:
+        data["result"] = "EVEN" if data["roll"] % 2 == 0 else "ODD"
+
+
+def _strip_plinko(data: dict) -> int:
+    path = data.get("path")
+    try:
+        if path is not None and path == plinko_path(data["rows"], data["bucket"], data["drop"]):
+            del data["path"]
+            return _PLINKO_PATH
+    except (KeyError, TypeError, ValueError):
+        pass
+    return 0
+
+
+def _restore_plinko(data: dict, flags: int):
+    if flags & _PLINKO_PATH:
+        data["path"] = plinko_path(data["rows"], data["bucket"], data["drop"])
+
+
+_DERIVED = {
+    ENGINE_CODES["dice"]: (_strip_dice, _restore_dice),
+    ENGINE_CODES["plinko"]: (_strip_plinko, _restore_plinko),
+}
+
+
+# ─────────────────────────────
+# Public API
+# ─────────────────────────────
+def encode(result_data: dict, engine_type: str | None = None) -> bytes:
+    code = ENGINE_CODES.get(engine_type, 0)
+    data = dict(result_data)
+    strip = _DERIVED.get(code)
+    flags = strip[0](data) if strip else 0
+
+    out = bytearray((FORMAT_VERSION, code, flags))
+    try:
+        _put_value(out, data)
+        packed = bytes(out)
+        if decode(packed) == result_data:
+            return packed
+    except (TypeError, ValueError, OverflowError):
+        pass
+    # Anything the packed form cannot reproduce exactly is kept as JSON
+    return bytes((JSON_FORMAT,)) + json.dumps(result_data, separators=(",", ":"), default=str).encode()
+
+
+def decode(blob: bytes) -> dict:
+    if not isinstance(blob, bytes):
+        blob = bytes(blob)  # memoryview from raw driver rows
+    version = blob[0]
+    if version == JSON_FORMAT:
+        return json.loads(blob[1:])
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported result format version {version}")
+
+    code, flags = blob[1], blob[2]
+    data, _ = _get_value(blob, 3)
+    restore = _DERIVED.get(code)
+    if restore:
+        restore[1](data, flags)
+    return data
+
+
+def result_columns(result_data: dict, engine_type: str | None = None) -> dict:
+    """GameRound column values for a settled round, per settings.round_result_encoding."""
+    if settings.round_result_encoding == "jsonb":
+        return {"result_data": result_data, "result_blob": None}
+    return {"result_data": None, "result_blob": encode(result_data, engine_type)}
+
+
+def read_result(result_data: dict | None, result_blob: bytes | None) -> dict | None:
+    """A round's result payload, whichever column holds it."""
+    if result_blob is not None:
+        return decode(result_blob)
+    return result_data
@@ -0,0 +1,179 @@
+import hashlib
+import hmac
+import os
+import threading
+from array import array
+
+
+_INV_2_53 = 1.0 / (1 << 53)
+
+
+def hash_server_seed(server_seed: str) -> str:
+    """Commitment published to the player before the seed is used."""
+    return hashlib.sha256(server_seed.encode()).hexdigest()
+
+
+class _ByteStreamRandom:
+    """
+    random-module style API (random, randint, choice) over a byte source:
+    subclasses define randbytes(n) and everything here draws from it.
+    """
+
+    __slots__ = ()
+
+    def random(self) -> float:
+        # 53 random bits, same resolution as random.random()
+        return (int.from_bytes(self.randbytes(7), "big") >> 3) / (1 << 53)
+
+    def randbelow(self, n: int) -> int:
+        """Unbiased integer in [0, n) by rejection sampling."""
+        if n <= 0:
+            raise ValueError("n must be positive")
+        k = (n - 1).bit_length()
+        if k == 0:
+            return 0
+        nbytes = (k + 7) // 8
+        while True:
+            value = int.from_bytes(self.randbytes(nbytes), "big") >> (nbytes * 8 - k)
+            if value < n:
+                return value
+
+    def randint(self, a: int, b: int) -> int:
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randbelow(len(seq))]
+
+
+class FairRNG(_ByteStreamRandom):
+    """
+    Deterministic random stream for one round.
+
+    Bytes are HMAC-SHA256(server_seed, "client_seed:nonce:cursor") blocks,
+    so anyone holding the revealed server seed can replay the round. It
+    exposes the subset of the `random` module API the engines use
+    (random, randint, choice), and engines accept it in place of `random`.
+    """
+
+    __slots__ = ("client_seed", "nonce", "_keyed", "_buffer", "_cursor")
+
+    def __init__(self, server_seed: str, client_seed: str, nonce: int, keyed=None):
+        self.client_seed = client_seed
+        self.nonce = nonce
+        # Keyed once; each block only copies the prepared inner/outer state
+        self._keyed = keyed or hmac.new(server_seed.encode(), digestmod=hashlib.sha256)
+        self._buffer = b""
+        self._cursor = 0
+
+    @classmethod
+    def for_rounds(cls, server_seed: str, client_seed: str, first_nonce: int, count: int) -> list["FairRNG"]:
+        """Streams for consecutive nonces sharing one keyed HMAC (multi-round requests)."""
+        keyed = hmac.new(server_seed.encode(), digestmod=hashlib.sha256)
+        return [cls(server_seed, client_seed, first_nonce + i, keyed) for i in range(count)]
+
+    def _next_block(self) -> bytes:
+        mac = self._keyed.copy()
+        mac.update(f"{self.client_seed}:{self.nonce}:{self._cursor}".encode())
+        self._cursor += 1
+        return mac.digest()
+
+    def randbytes(self, n: int) -> bytes:
+        while len(self._buffer) < n:
+            self._buffer += self._next_block()
+        out, self._buffer = self._buffer[:n], self._buffer[n:]
+        return out
+
+
+class BufferedSecureRNG(_ByteStreamRandom):
+    """
+    CSPRNG for rounds that need no replay (house-side draws, simulations).
+
+    Pulls 64 KiB blocks from os.urandom and serves draws from them, so a
+    spin costs a list pop instead of a syscall. Integers use rejection
+    sampling (no modulo bias). The *_array methods return numpy vectors for
+    large simulations. Not thread-safe; use secure_rng() for a per-thread
+    instance.
+    """
+
+    __slots__ = ("block_words", "_words")
+
+    def __init__(self, block_words: int = 8192):
+        self.block_words = block_words
+        self._words = []
+
+    def _word(self) -> int:
+        # Pre-unpacked 64-bit words: a draw is a list pop, not a syscall
+        if not self._words:
+            self._words = array("Q", os.urandom(8 * self.block_words)).tolist()
+        return self._words.pop()
+
+    def randbytes(self, n: int) -> bytes:
+        # Large vector draws amortize the syscall on their own
+        return os.urandom(n)
+
+    def random(self) -> float:
+        return (self._word() >> 11) * _INV_2_53
+
+    def randbelow(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("n must be positive")
+        k = (n - 1).bit_length()
+        if k == 0:
+            return 0
+        if k > 64:
+            return super().randbelow(n)
+        shift = 64 - k
+        while True:
+            value = self._word() >> shift
+            if value < n:
+                return value
+
+    # ─────────────────────────────
+    # Vectorized draws (numpy)
+    # ─────────────────────────────
+    def random_array(self, size: int):
+        """`size` floats in [0, 1) with 53-bit resolution."""
+        import numpy as np
+
+        words = np.frombuffer(self.randbytes(8 * size), dtype=np.uint64)
+        return (words >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def integers_array(self, low: int, high: int, size: int):
+        """`size` unbiased integers in [low, high] (inclusive, like randint)."""
+        import numpy as np
+
+        n = high - low + 1
+        if n <= 0:
+            raise ValueError("high must be >= low")
+        k = max(n - 1, 1).bit_length()
+        mask = np.uint64((1 << k) - 1)
+
+        out = np.empty(size, dtype=np.int64)
+        filled = 0
+        while filled < size:
+            # Acceptance rate is > 1/2, so ask for twice what is missing
+            want = 2 * (size - filled) + 8
+            words = np.frombuffer(self.randbytes(8 * want), dtype=np.uint64) & mask
+            accepted = words[words < np.uint64(n)]
+            take = min(len(accepted), size - filled)
+            out[filled:filled + take] = accepted[:take].astype(np.int64)
+            filled += take
+        return out + low
+
+    def choice_array(self, seq, size: int):
+        import numpy as np
+
+        return np.asarray(seq)[self.integers_array(0, len(seq) - 1, size)]
+
+
+_local = threading.local()
+
+
+def secure_rng() -> BufferedSecureRNG:
+    """Buffered CSPRNG owned by the calling thread."""
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = BufferedSecureRNG()
+    return rng
@@ -1,30 +1,109 @@
-import random
-from .base_engine import BaseGameEngine
+from collections import Counter
+
+import numpy as np
+from pydantic import Field, field_validator
+
+from .base_engine import BaseGameEngine, EngineConfig
+from .batch import BatchResult, batch_generator
+
+DEFAULT_SYMBOLS = ["A", "B", "C", "7"]
+
+
+class SlotConfig(EngineConfig):
+    reels: int = Field(3, ge=1, le=10)
+    symbol_map: list[str] = Field(default_factory=lambda: list(DEFAULT_SYMBOLS))
+    paytable: dict[str, float] = Field(default_factory=lambda: {"777": 50, "AAA": 10, "BBB": 5, "CCC": 2})
+
+    @field_validator("symbol_map", mode="before")
+    @classmethod
+    def _drop_blanks(cls, value):
+        # The admin form sends [""] when no symbols were entered
+        symbols = [str(s).strip() for s in value or [] if str(s).strip()]
+        return symbols or list(DEFAULT_SYMBOLS)
+
 
 class SlotEngine(BaseGameEngine):
+    name = "slot"
+    aliases = ("slot_engine",)
+    config_schema = SlotConfig
+    batchable = True
+
+    def __init__(self, config: dict, rng=None):
+        super().__init__(config, rng)
+        # Paying reel sequences as symbol-index rows, for run_many
+        symbols = list(dict.fromkeys(self.params.symbol_map))
+        index = {symbol: i for i, symbol in enumerate(symbols)}
+        sequences, multipliers = [], []
+        for combo, multiplier in self.params.paytable.items():
+            for split in _splits(combo, set(symbols), self.params.reels):
+                sequences.append([index[symbol] for symbol in split])
+                multipliers.append(multiplier)
+        self.batch_symbols = symbols
+        self.batch_weights = np.array([self.params.symbol_map.count(s) for s in symbols], dtype=np.float64)
+        self.paying_sequences = np.array(sequences, dtype=np.int16).reshape(-1, self.params.reels)
+        self.paying_multipliers = np.array(multipliers, dtype=np.float64)
+
     def run(self, bet_amount: float, **kwargs):
         """
         config needs: {
             "reels": int, 
-            "paylines": int, 
             "symbol_map": list, 
             "paytable": dict
         }
         """
-        reels = self.config.get("reels", 3)
-        symbol_map = self.config.get("symbol_map", ["A", "B", "C", "7"])
-        paytable = self.config.get("paytable", {"777": 50, "AAA": 10, "BBB": 5, "CCC": 2})
-        
+        symbol_map = self.params.symbol_map
+
         # Generate spin result (e.g., ['7', 'A', '7'])
-        result = [random.choice(symbol_map) for _ in range(reels)]
+        result = [self.rng.choice(symbol_map) for _ in range(self.params.reels)]
         result_str = "".join(result)
         
         # Check paytable for the combination
-        multiplier = paytable.get(result_str, 0)
+        multiplier = self.params.paytable.get(result_str, 0)
         win_amount = bet_amount * multiplier
 
         return {
             "result_data": {"spin": result},
             "outcome": "WIN" if win_amount > 0 else "LOSE",
             "win_amount": win_amount
-        }
\ No newline at end of file
+        }
+
+    def run_many(self, bet_amounts, params: dict | None = None, generator=None) -> BatchResult:
+        """data["spin"] holds indices into self.batch_symbols, one row per round."""
+        bets = np.asarray(bet_amounts, dtype=np.float64)
+        gen = generator or batch_generator()
+
+        # symbol_map may repeat a symbol to weight it, as rng.choice does in run()
+        spins = gen.choice(
+            len(self.batch_symbols), size=(len(bets), self.params.reels),
+            p=self.batch_weights / self.batch_weights.sum(),
+        ).astype(np.int16)
+        multipliers = np.zeros(len(bets))
+        for sequence, multiplier in zip(self.paying_sequences, self.paying_multipliers):
+            multipliers[(spins == sequence).all(axis=1)] = multiplier
+
+        win_amount = bets * multipliers
+        return BatchResult((win_amount > 0).astype(np.uint8), win_amount, {"spin": spins})
+
+    def rtp(self) -> float:
+        # Every reel sequence is equally likely; count the ones spelling each paying combination
+        symbols = Counter(self.params.symbol_map)
+        outcomes = len(self.params.symbol_map) ** self.params.reels
+        total = 0.0
+        for combo, multiplier in self.params.paytable.items():
+            for split in _splits(combo, set(symbols), self.params.reels):
+                ways = 1
+                for symbol in split:
+                    ways *= symbols[symbol]
+                total += ways * multiplier
+        return total / outcomes
+
+
+def _splits(combo: str, symbols: set, reels: int) -> list[tuple]:
+    """Ways to write `combo` as `reels` consecutive symbols (symbols may be multi-character)."""
+    if reels == 0:
+        return [()] if combo == "" else []
+    return [
+        (symbol,) + rest
+        for symbol in symbols if combo.startswith(symbol)
+        for rest in _splits(combo[len(symbol):], symbols, reels - 1)
+    ]
@@ -1,15 +1,48 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
 from app.api.v1.api import api_router
+from app.core.config import settings
+from app.workers.jackpot_pool_flusher import run_jackpot_pool_flusher
+from app.workers.jackpot_scheduler import run_jackpot_scheduler
+from app.workers.round_reaper import run_round_reaper
+from app.workers.partition_maintainer import run_partition_maintainer
+from app.workers.round_archiver import run_round_archiver
+from app.workers.session_reaper import run_session_reaper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = []
+    if settings.run_background_workers:
+        tasks.append(asyncio.create_task(run_jackpot_pool_flusher()))
+        tasks.append(asyncio.create_task(run_jackpot_scheduler()))
+        tasks.append(asyncio.create_task(run_round_reaper()))
+        tasks.append(asyncio.create_task(run_partition_maintainer()))
+        tasks.append(asyncio.create_task(run_session_reaper()))
+        if settings.archive_after_days > 0:
+            tasks.append(asyncio.create_task(run_round_archiver()))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Casino Platform Backend",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # ───────── CORS ─────────
@@ -35,11 +35,13 @@ from app.models.game_session import GameSession
 from app.models.game_round import GameRound
 from app.models.bet import Bet
 from app.models.bet_tax import BetTax
+from app.models.fairness_seed import FairnessSeed
 
 from app.models.jackpot import Jackpot
 from app.models.jackpot_game import JackpotGame
 from app.models.jackpot_contribution import JackpotContribution
 from app.models.jackpot_win import JackpotWin
+from app.models.jackpot_pool_shard import JackpotPoolShard
 
 
 from app.models.bonus import Bonus
@@ -10,18 +10,17 @@ class Bet(Base):
     __tablename__ = "bets"
 
     __table_args__ = (
-        UniqueConstraint("round_id", name="unique_round_bet"),
+        # Unique constraints on a partitioned table must include the partition key
+        UniqueConstraint("round_id", "placed_at", name="unique_round_bet"),
+        {"postgresql_partition_by": "RANGE (placed_at)"},
     )
 
     bet_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
 
-    round_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("game_rounds.round_id"),
-        nullable=False
-    )
+    # game_rounds is partitioned, so no FK on round_id alone
+    round_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
 
     wallet_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -43,9 +42,9 @@ class Bet(Base):
     )
 
     placed_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP, default=datetime.utcnow
+        TIMESTAMP, primary_key=True, default=datetime.utcnow
     )
     settled_at: Mapped[datetime | None] = mapped_column(TIMESTAMP)
 
     # Relationship back to GameRound
-    round = relationship("GameRound", back_populates="bet")
+    round = relationship("GameRound", primaryjoin="foreign(Bet.round_id) == GameRound.round_id", back_populates="bet")
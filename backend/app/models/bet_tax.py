@@ -1,4 +1,5 @@
 from sqlalchemy import Integer, Numeric, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.models.base import Base
 
@@ -7,8 +8,9 @@ class BetTax(Base):
 
     bet_tax_id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
+    # bets is partitioned, so no FK on bet_id alone
     bet_id: Mapped[str] = mapped_column(
-        ForeignKey("bets.bet_id"), nullable=False
+        UUID(as_uuid=True), nullable=False
     )
 
     tax_rule_id: Mapped[int | None] = mapped_column(
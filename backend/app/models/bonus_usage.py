@@ -1,5 +1,5 @@
 # app/models/bonus_usage.py
-from sqlalchemy import Column, String, Boolean, Numeric, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, Numeric, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -30,3 +30,13 @@ class BonusUsage(Base):
 
     bonus = relationship("Bonus")
 
+    __table_args__ = (
+        # Active wagering of a player; bonus_id included for the join to bonuses
+        Index(
+            "ix_bonus_usage_player_status",
+            "player_id",
+            "status",
+            postgresql_include=["bonus_id"],
+        ),
+    )
+
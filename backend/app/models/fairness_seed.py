@@ -0,0 +1,42 @@
+from sqlalchemy import Column, String, Boolean, BigInteger, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.models.base import Base
+
+
+class FairnessSeed(Base):
+    """
+    Provably fair seed pair of a player.
+
+    The server seed stays secret while active; only its SHA-256 hash is
+    shown. Rotating reveals it so the player can replay every round that
+    used it (nonce 0 .. nonce - 1).
+    """
+    __tablename__ = "fairness_seeds"
+
+    seed_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), nullable=False)
+
+    server_seed = Column(String(64), nullable=False)
+    server_seed_hash = Column(String(64), nullable=False, unique=True)
+    client_seed = Column(String(64), nullable=False)
+
+    # Next unused nonce; one per round
+    nonce = Column(BigInteger, nullable=False, default=0)
+
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    created_at = Column(DateTime, server_default=func.now())
+    revealed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # At most one active pair per player
+        Index(
+            "uq_fairness_seeds_active_player",
+            "player_id",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+    )
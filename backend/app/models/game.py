@@ -2,7 +2,7 @@ import uuid
 import enum
 from datetime import datetime
 
-from sqlalchemy import String, Numeric, TIMESTAMP, ForeignKey
+from sqlalchemy import String, Numeric, TIMESTAMP, ForeignKey, Index, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Enum as PgEnum
@@ -77,3 +77,27 @@ class Game(Base):
     tenant_links = relationship("TenantGame", back_populates="game")
 
 
+# Marketplace name search (case-insensitive prefix LIKE)
+Index(
+    "ix_games_game_name_lower",
+    func.lower(Game.game_name).label("game_name_lower"),
+    postgresql_ops={"game_name_lower": "text_pattern_ops"},
+)
+
+# Full-text search document (name + code). Queried with
+# to_tsquery('simple', 'term:*') for prefix matches; the expression must stay
+# identical to the index definition for the planner to use it.
+GAME_SEARCH_VECTOR = func.to_tsvector(
+    literal_column("'simple'"),
+    Game.game_name + " " + Game.game_code
+)
+
+Index("ix_games_search_vector", GAME_SEARCH_VECTOR, postgresql_using="gin")
+
+# Substring name matching (ILIKE '%term%'), needs the pg_trgm extension
+Index(
+    "ix_games_game_name_trgm",
+    Game.game_name,
+    postgresql_using="gin",
+    postgresql_ops={"game_name": "gin_trgm_ops"},
+)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import ForeignKey, Integer, Numeric, TIMESTAMP, String
+from sqlalchemy import ForeignKey, Integer, Numeric, TIMESTAMP, String, Index, LargeBinary, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from sqlalchemy.dialects.postgresql import UUID, JSONB  # 👈 Added JSONB herefrom sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -10,6 +10,14 @@ from app.models.base import Base
 
 class GameRound(Base):
     __tablename__ = "game_rounds"
+    __table_args__ = (
+        # Interactive rounds awaiting their next step (round reaper)
+        Index("ix_game_rounds_open", "started_at", postgresql_where=text("ended_at IS NULL")),
+        # Rounds of a session in order
+        Index("ix_game_rounds_session_round", "session_id", "round_number"),
+        # Monthly range partitions (PartitionService); the key is part of the primary key
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
 
     round_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -24,7 +32,7 @@ class GameRound(Base):
     round_number: Mapped[int] = mapped_column(Integer, nullable=False)
 
     started_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP, default=datetime.utcnow
+        TIMESTAMP, primary_key=True, default=datetime.utcnow
     )
     ended_at: Mapped[datetime | None] = mapped_column(TIMESTAMP)
 
@@ -35,13 +43,21 @@ class GameRound(Base):
     win_amount: Mapped[float | None] = mapped_column(Numeric(18, 2))
 
     result_data: Mapped[dict | None] = mapped_column(JSONB)
-
-    # 1:1 Relationship with Bet
-    bet = relationship("Bet", back_populates="round", uselist=False)
+    # Settled payload in the packed format (game_engines/result_codec); result_data is then NULL
+    result_blob: Mapped[bytes | None] = mapped_column(LargeBinary)
+
+    # 1:1 Relationship with Bet (no FK: round_id alone is not unique across partitions)
+    bet = relationship(
+        "Bet",
+        primaryjoin="GameRound.round_id == foreign(Bet.round_id)",
+        back_populates="round",
+        uselist=False,
+    )
 
      # 🔥 NEW reverse relation
     wallet_transactions = relationship(
         "WalletTransaction",
+        primaryjoin="GameRound.round_id == foreign(WalletTransaction.reference_id)",
         back_populates="game_round",
         cascade="all, delete-orphan",
     )
@@ -1,11 +1,28 @@
 import uuid
-from sqlalchemy import String, TIMESTAMP, ForeignKey
+from datetime import datetime
+from sqlalchemy import Integer, String, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base import Base
 
 class GameSession(Base):
     __tablename__ = "game_sessions"
+    __table_args__ = (
+        # Per-bet lookup of the player's open session for a game
+        Index(
+            "ix_game_sessions_player_game_active",
+            "player_id",
+            "game_id",
+            "tenant_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Session reaper: open sessions by idle time
+        Index(
+            "ix_game_sessions_idle",
+            "last_activity_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
 
     session_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -25,8 +42,13 @@ class GameSession(Base):
 
     started_at: Mapped[str] = mapped_column(TIMESTAMP)
     ended_at: Mapped[str | None] = mapped_column(TIMESTAMP)
+    # Bumped with round_count on every bet; idle sessions are closed at this time
+    last_activity_at: Mapped[datetime | None] = mapped_column(TIMESTAMP, default=datetime.now)
 
     status: Mapped[str] = mapped_column(String(20), default="active")
 
+    # Last round_number handed out (GameSessionService.reserve_round_numbers)
+    round_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
+
     ip_address: Mapped[str | None] = mapped_column(String(45))
     device_info: Mapped[str | None] = mapped_column(String)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Integer, Numeric, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Boolean, Integer, Numeric, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -29,9 +29,16 @@ class Jackpot(Base):
     contribution_percentage = Column(Numeric(5, 2), default=0)
     opt_in_required = Column(Boolean, default=False)
 
+    # How SPONSORED / PROGRESSIVE winners are drawn from the contributors
+    winner_selection = Column(String(20), nullable=False, default="UNIFORM", server_default="UNIFORM")
+
     deadline = Column(DateTime, nullable=True)
     last_won_at = Column(DateTime, nullable=True)
 
+    # Scheduled draws that failed in a row; the next attempt waits until next_draw_at
+    draw_failures = Column(Integer, nullable=False, default=0, server_default="0")
+    next_draw_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -49,4 +56,10 @@ class Jackpot(Base):
             "reset_cycle IN ('DAILY', 'WEEKLY', 'MONTHLY', 'NEVER') OR reset_cycle IS NULL", 
             name="reset_cycle_check"
         ),
+        CheckConstraint(
+            "winner_selection IN ('UNIFORM', 'WEIGHTED')",
+            name="jackpot_winner_selection_check"
+        ),
+        # Scheduler scans ACTIVE jackpots in deadline order
+        Index("ix_jackpots_status_deadline", "status", "deadline"),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Numeric, DateTime
+from sqlalchemy import Column, ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -24,9 +24,9 @@ class JackpotContribution(Base):
     )
 
     # Can be NULL for sponsored voluntary contributions
+    # bets is partitioned, so no FK on bet_id alone
     bet_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("bets.bet_id"),
         nullable=True
     )
 
@@ -36,3 +36,13 @@ class JackpotContribution(Base):
         DateTime,
         server_default=func.now()
     )
+
+    __table_args__ = (
+        # Draws group contributions per player for one jackpot (index-only scan)
+        Index(
+            "ix_jackpot_contributions_draw",
+            "jackpot_id",
+            "player_id",
+            postgresql_include=["amount"],
+        ),
+    )
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, ForeignKey, Numeric, SmallInteger, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.models.base import Base
+
+
+class JackpotPoolShard(Base):
+    """
+    Pending (not yet applied) contributions to a jackpot pool.
+
+    Opted-in bets add to one of N shard rows instead of updating the single
+    jackpots row, so concurrent bets only contend when they hit the same
+    shard. A periodic flush moves the shard totals into
+    jackpots.current_amount in one aggregated update.
+    """
+    __tablename__ = "jackpot_pool_shards"
+
+    jackpot_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("jackpots.jackpot_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    shard_no = Column(SmallInteger, primary_key=True)
+
+    pending_amount = Column(Numeric(18, 2), nullable=False, default=0)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
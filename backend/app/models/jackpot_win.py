@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Numeric, DateTime
+from sqlalchemy import Column, ForeignKey, Numeric, DateTime, String, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -25,9 +25,9 @@ class JackpotWin(Base):
     )
 
     # Can be NULL for FIXED / SPONSORED random draws
+    # bets is partitioned, so no FK on bet_id alone
     bet_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("bets.bet_id"),
         nullable=True
     )
 
@@ -38,6 +38,14 @@ class JackpotWin(Base):
         server_default=func.now()
     )
 
+    # Draw audit trail: HMAC seed, selection mode and the population it ran over
+    draw_seed = Column(String(64), nullable=True)
+    selection_mode = Column(String(20), nullable=True)
+    population_size = Column(Integer, nullable=True)
+    # Contributor draws: contributions with contributed_at in (from, until] formed the population
+    contributions_from = Column(DateTime, nullable=True)
+    contributions_until = Column(DateTime, nullable=True)
+
     player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), nullable=False)
     # 🎯 ADD THESE RELATIONSHIPS
     jackpot = relationship("Jackpot")
@@ -1,16 +1,35 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, TIMESTAMP, ForeignKey, Boolean, Integer, text
+from sqlalchemy import String, TIMESTAMP, ForeignKey, Boolean, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 
 
+# Statuses that put a document in the super admin review queue
+REVIEW_QUEUE_STATUSES = ("submitted", "re-submitted")
+
+
 class KYCDocument(Base):
     __tablename__ = "kyc_documents"
 
+    __table_args__ = (
+        # Review queue: only active documents awaiting review are indexed, in
+        # keyset order (uploaded_at, document_id). verification_status and
+        # user_id ride along so per-status counts are index-only scans.
+        Index(
+            "ix_kyc_documents_review_queue",
+            "uploaded_at",
+            "document_id",
+            postgresql_include=["verification_status", "user_id"],
+            postgresql_where=text(
+                "is_active = true AND verification_status IN ('submitted', 're-submitted')"
+            ),
+        ),
+    )
+
     document_id: Mapped[int] = mapped_column(primary_key=True)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,5 +1,5 @@
 # app/models/player_limit.py
-from sqlalchemy import Column, String, Boolean, Numeric, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, Numeric, Integer, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -13,6 +13,17 @@ player = relationship(Player, backref="limits")
 class PlayerLimit(Base):
     """Responsible Gaming Limits set by players."""
     __tablename__ = "player_limits"
+    __table_args__ = (
+        # Limit checks on every bet / deposit
+        Index(
+            "ix_player_limits_lookup",
+            "player_id",
+            "tenant_id",
+            "limit_type",
+            "period",
+            "status",
+        ),
+    )
 
     limit_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
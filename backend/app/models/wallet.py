@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Numeric, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Numeric, Boolean, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
@@ -25,3 +25,21 @@ class Wallet(Base):
     deposits = relationship("Deposit", back_populates="wallet")
     wallet_type = relationship("WalletType", back_populates="wallets")
 
+    __table_args__ = (
+        # FIXED jackpot draws walk the distinct players of one casino
+        Index(
+            "ix_wallets_tenant_player_active",
+            "tenant_id",
+            "player_id",
+            postgresql_where=text("is_active = true"),
+        ),
+        # Per-bet cash / bonus wallet lookup
+        Index(
+            "ix_wallets_player_tenant_type_active",
+            "player_id",
+            "tenant_id",
+            "wallet_type_id",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
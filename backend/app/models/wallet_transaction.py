@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Numeric, String, TIMESTAMP, ForeignKey, CheckConstraint
+from sqlalchemy import Numeric, String, TIMESTAMP, ForeignKey, CheckConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base import Base
@@ -27,20 +27,14 @@ class WalletTransaction(Base):
     balance_after: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
 
     reference_type: Mapped[str | None] = mapped_column(String(30))
-    reference_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
-
-    # 🔥 FK added here to match DB
-    reference_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("game_rounds.round_id", ondelete="CASCADE"),
-        nullable=True,
-    )
+    # Round, deposit or withdrawal id depending on reference_type (game_rounds is partitioned: no FK)
+    reference_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     # ORM relationship to GameRound
     game_round = relationship(
         "GameRound",
+        primaryjoin="foreign(WalletTransaction.reference_id) == GameRound.round_id",
         back_populates="wallet_transactions",
-        foreign_keys=[reference_id],
     )
 
     status: Mapped[str] = mapped_column(
@@ -51,6 +45,7 @@ class WalletTransaction(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP,
+        primary_key=True,
         default=datetime.utcnow
     )
 
@@ -59,4 +54,15 @@ class WalletTransaction(Base):
             "status IN ('pending','success','failed','reversed')",
             name="wallet_transactions_status_check"
         ),
+        # Wallet statement, newest first
+        Index("ix_wallet_transactions_wallet_created", "wallet_id", "created_at"),
+        # Round -> its bet / win postings (history, archival)
+        Index(
+            "ix_wallet_transactions_reference",
+            "reference_id",
+            "created_at",
+            postgresql_include=["balance_after"],
+            postgresql_where=text("reference_id IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from uuid import UUID
+
+
+class FairnessRotateRequest(BaseModel):
+    # Keep the current client seed when omitted
+    client_seed: Optional[str] = Field(None, min_length=1, max_length=64)
+
+
+class FairnessVerifyRequest(BaseModel):
+    round_id: UUID
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 import uuid
 from typing import Optional
@@ -11,6 +11,7 @@ class PlayRequest(BaseModel):
     player_choice: Optional[str] = None
     target_multiplier: Optional[float] = None
     successful_picks: Optional[int] = None
+    include_path: Optional[bool] = None  # Plinko: return the ball path for animation
     
    
     opt_in: bool = False 
@@ -20,4 +21,27 @@ class PlayGameResponse(BaseModel):
     bet_amount: float
     win_amount: float
     outcome: dict
-    new_balance: float
\ No newline at end of file
+    new_balance: float
+
+
+# ─────────────────────────────
+# Interactive rounds (Mines, live Crash)
+# ─────────────────────────────
+class RoundStartRequest(BaseModel):
+    game_id: UUID
+    tenant_id: UUID
+    bet_amount: float
+    opt_in: bool = False
+    # Crash only: cash out automatically once the multiplier reaches this
+    auto_cashout: Optional[float] = Field(None, ge=1.01)
+
+
+class RoundRevealRequest(BaseModel):
+    cell: int = Field(..., ge=0)
+
+
+class CrashTableBetRequest(BaseModel):
+    tenant_id: UUID
+    bet_amount: float = Field(..., gt=0)
+    auto_cashout: Optional[float] = Field(None, ge=1.01)
+    opt_in: bool = False
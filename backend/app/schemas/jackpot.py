@@ -22,5 +22,8 @@ class JackpotCreate(BaseModel):
     contribution_percentage: Optional[float] = Field(0, ge=0)
     opt_in_required: Optional[bool] = False
 
+    # SPONSORED / PROGRESSIVE: even odds per contributor, or odds by amount contributed
+    winner_selection: Literal["UNIFORM", "WEIGHTED"] = "UNIFORM"
+
 class JackpotContribution(BaseModel):
     amount: float = Field(..., gt=0)
\ No newline at end of file
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, Literal, List
+
+
+class KYCBulkReviewRequest(BaseModel):
+    document_ids: List[int] = Field(..., min_length=1, max_length=10000)
+    status: Literal["verified", "rejected"]
+    reason: Optional[str] = Field(None, max_length=500)
+
+    @model_validator(mode="after")
+    def validate_rejection_reason(self):
+        # Reason only makes sense on rejections, same as the single-document endpoint
+        if self.status != "rejected":
+            self.reason = None
+        return self
+
+
+class KYCBulkReviewResponse(BaseModel):
+    status: str
+    updated_count: int
+    affected_users: int
+    missing_document_ids: List[int]
@@ -81,6 +81,74 @@ class AnalyticsService:
 
         db.execute(player_stmt)
 
+    @staticmethod
+    def update_bet_stats_bulk(
+        db: Session,
+        tenant_id: uuid.UUID,
+        game_id: uuid.UUID,
+        provider_id: uuid.UUID,
+        results: list[tuple[uuid.UUID, float, float]],
+    ):
+        """
+        update_bet_stats for a whole round of (player_id, bet_amount, win_amount)
+        in two statements: one snapshot upsert, one multi-row player upsert.
+        Expects at most one entry per player.
+        """
+        if not results:
+            return
+        today = date.today()
+
+        rows = [(player_id, Decimal(str(bet)), Decimal(str(win))) for player_id, bet, win in results]
+        total_bets = sum(bet for _, bet, _ in rows)
+        total_wins = sum(win for _, _, win in rows)
+
+        stmt = insert(AnalyticsSnapshot).values(
+            snapshot_date=today,
+            tenant_id=tenant_id,
+            game_id=game_id,
+            provider_id=provider_id,
+            total_bets=total_bets,
+            total_wins=total_wins,
+            ggr=total_bets - total_wins,
+        ).on_conflict_do_update(
+            index_elements=["snapshot_date", "tenant_id", "game_id"],
+            set_={
+                "total_bets": AnalyticsSnapshot.total_bets + total_bets,
+                "total_wins": AnalyticsSnapshot.total_wins + total_wins,
+                "ggr": AnalyticsSnapshot.ggr + (total_bets - total_wins),
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+        player_stmt = insert(PlayerStatsSummary).values([
+            {
+                "player_id": player_id,
+                "total_wagered": bet,
+                "total_won": win,
+                "net_pnl": win - bet,
+                "win_count": 1 if win > 0 else 0,
+                "loss_count": 1 if win == 0 else 0,
+                "favorite_game_id": game_id,
+                "total_sessions": 1,
+                "last_played_at": func.now(),
+            }
+            for player_id, bet, win in rows
+        ])
+        player_stmt = player_stmt.on_conflict_do_update(
+            index_elements=["player_id"],
+            set_={
+                "total_wagered": PlayerStatsSummary.total_wagered + player_stmt.excluded.total_wagered,
+                "total_won": PlayerStatsSummary.total_won + player_stmt.excluded.total_won,
+                "net_pnl": PlayerStatsSummary.net_pnl + player_stmt.excluded.net_pnl,
+                "win_count": PlayerStatsSummary.win_count + player_stmt.excluded.win_count,
+                "loss_count": PlayerStatsSummary.loss_count + player_stmt.excluded.loss_count,
+                "last_played_at": func.now(),
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(player_stmt)
+
     # ─────────────────────────────────────
     #  FINANCIAL ANALYTICS
     # ─────────────────────────────────────
@@ -0,0 +1,447 @@
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.game_engines.result_codec import read_result
+from app.models.bet import Bet
+from app.models.game_round import GameRound
+from app.models.game_session import GameSession
+from app.models.wallet_transaction import WalletTransaction
+from app.services.partition_service import add_months, month_start
+
+
+ARCHIVE_BATCH_SIZE = 10_000
+MANIFEST_NAME = "manifest.json"
+
+# Bets / wallet rows are written around their round's start; interactive
+# wins land minutes later. Bounds the partitions those lookups touch.
+_RELATED_SLACK = timedelta(days=1)
+
+_MONEY = pa.decimal128(18, 2)
+_TS = pa.timestamp("us")
+
+SCHEMAS = {
+    "rounds": pa.schema([
+        ("round_id", pa.string()),
+        ("session_id", pa.string()),
+        ("tenant_id", pa.string()),
+        ("player_id", pa.string()),
+        ("game_id", pa.string()),
+        ("round_number", pa.int32()),
+        ("started_at", _TS),
+        ("ended_at", _TS),
+        ("outcome", pa.string()),
+        ("bet_amount", _MONEY),
+        ("win_amount", _MONEY),
+        ("result", pa.string()),  # decoded result payload as JSON text
+    ]),
+    "bets": pa.schema([
+        ("bet_id", pa.string()),
+        ("round_id", pa.string()),
+        ("wallet_id", pa.string()),
+        ("bet_amount", _MONEY),
+        ("win_amount", _MONEY),
+        ("bet_currency_id", pa.int32()),
+        ("bet_status", pa.string()),
+        ("placed_at", _TS),
+        ("settled_at", _TS),
+    ]),
+    "wallet_transactions": pa.schema([
+        ("transaction_id", pa.string()),
+        ("wallet_id", pa.string()),
+        ("transaction_type_id", pa.int32()),
+        ("amount", _MONEY),
+        ("balance_before", _MONEY),
+        ("balance_after", _MONEY),
+        ("reference_type", pa.string()),
+        ("reference_id", pa.string()),
+        ("status", pa.string()),
+        ("created_at", _TS),
+    ]),
+}
+
+# Per file: the id column checked on read-back
+_ID_COLUMNS = {"rounds": "round_id", "bets": "bet_id", "wallet_transactions": "transaction_id"}
+
+
+class ArchiveVerificationError(RuntimeError):
+    pass
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _str(value) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _lock_key(tenant_id, month: datetime) -> int:
+    """Signed 64-bit advisory lock key for one tenant-month's archive directory."""
+    digest = hashlib.sha256(f"archive:{tenant_id}:{month:%Y-%m}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def _write_json(path: Path, payload: dict):
+    # Write-then-rename so a reader never sees a half-written manifest
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, indent=2))
+    os.replace(tmp, path)
+
+
+class ArchiveService:
+    """
+    Cold storage for settled rounds.
+
+    Rounds older than the hot window are exported with their bets and
+    wallet transactions to Parquet under
+    <archive_dir>/tenant_id=<id>/month=<YYYY-MM>/, one file per table per
+    batch, listed in that directory's manifest.json with row counts and
+    sha256. Rows are deleted from Postgres only after every file has been
+    read back and matched its manifest entry.
+
+    A batch is recorded in the manifest before its rows are deleted, so a
+    failed delete leaves the rows in both places and the next run exports
+    them again; readers de-duplicate by id. Each batch holds a
+    transaction-scoped advisory lock on its tenant-month from the select
+    to the delete, so archivers in several processes take turns.
+    """
+
+    # ─────────────────────────────
+    # Layout
+    # ─────────────────────────────
+    @staticmethod
+    def root() -> Path:
+        return Path(settings.archive_dir)
+
+    @staticmethod
+    def partition_dir(tenant_id, month: datetime) -> Path:
+        return ArchiveService.root() / f"tenant_id={tenant_id}" / f"month={month:%Y-%m}"
+
+    @staticmethod
+    def read_manifest(directory: Path) -> dict | None:
+        path = directory / MANIFEST_NAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    @staticmethod
+    def _partition_dirs(tenant_id=None, since: datetime | None = None, until: datetime | None = None) -> list[Path]:
+        """Archived (tenant, month) directories overlapping [since, until), newest month first."""
+        root = ArchiveService.root()
+        if not root.exists():
+            return []
+        tenants = [root / f"tenant_id={tenant_id}"] if tenant_id else sorted(root.glob("tenant_id=*"))
+        first = month_start(since) if since else None
+
+        dirs = []
+        for tenant_dir in tenants:
+            for directory in tenant_dir.glob("month=*"):
+                month = datetime.strptime(directory.name.split("=", 1)[1], "%Y-%m")
+                if (first is None or month >= first) and (until is None or month < until):
+                    dirs.append((month, directory))
+        return [directory for _, directory in sorted(dirs, key=lambda d: d[0], reverse=True)]
+
+    # ─────────────────────────────
+    # Export
+    # ─────────────────────────────
+    @staticmethod
+    def archive_settled(db: Session, older_than_days: int, now: datetime | None = None,
+                        batch_size: int = ARCHIVE_BATCH_SIZE) -> list[dict]:
+        """Archive and delete every settled round started more than `older_than_days` ago. Returns the manifest entries written."""
+        cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+
+        groups = (
+            db.query(GameSession.tenant_id, func.date_trunc("month", GameRound.started_at).label("month"))
+            .join(GameSession, GameSession.session_id == GameRound.session_id)
+            .filter(GameRound.started_at < cutoff, GameRound.ended_at.isnot(None))
+            .distinct()
+            .all()
+        )
+        db.rollback()
+
+        batches = []
+        for tenant_id, month in sorted(groups, key=lambda g: (g.month, str(g.tenant_id))):
+            while True:
+                entry = ArchiveService.archive_batch(db, tenant_id, month, cutoff, batch_size)
+                if entry is None:
+                    break
+                batches.append(entry)
+        return batches
+
+    @staticmethod
+    def archive_batch(db: Session, tenant_id: uuid.UUID, month: datetime, cutoff: datetime,
+                      batch_size: int = ARCHIVE_BATCH_SIZE) -> dict | None:
+        """Export, verify and delete up to `batch_size` settled rounds of one tenant-month. None when nothing is left."""
+        lower = month_start(month)
+        upper = min(add_months(lower, 1), cutoff)
+
+        # Every API process runs the archiver: one exporter per tenant-month at a
+        # time, held until the delete commits, so two never export the same rows
+        # or lose each other's manifest entries. The loser then sees what is left.
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _lock_key(tenant_id, lower)})
+
+        rounds = (
+            db.query(GameRound, GameSession.tenant_id, GameSession.player_id, GameSession.game_id)
+            .join(GameSession, GameSession.session_id == GameRound.session_id)
+            .filter(
+                GameSession.tenant_id == tenant_id,
+                GameRound.started_at >= lower,
+                GameRound.started_at < upper,
+                GameRound.ended_at.isnot(None),
+            )
+            .order_by(GameRound.started_at)
+            .limit(batch_size)
+            .all()
+        )
+        if not rounds:
+            db.rollback()
+            return None
+
+        round_ids = [r.GameRound.round_id for r in rounds]
+        started = [r.GameRound.started_at for r in rounds]
+        related_from, related_to = min(started) - _RELATED_SLACK, max(started) + _RELATED_SLACK
+
+        bets = db.query(Bet).filter(
+            Bet.round_id.in_(round_ids),
+            Bet.placed_at >= related_from,
+            Bet.placed_at < related_to,
+        ).all()
+        transactions = db.query(WalletTransaction).filter(
+            WalletTransaction.reference_id.in_(round_ids),
+            WalletTransaction.reference_type == "bet",
+            WalletTransaction.created_at >= related_from,
+            WalletTransaction.created_at < related_to,
+        ).all()
+
+        tables = {
+            "rounds": ArchiveService._rounds_table(rounds),
+            "bets": ArchiveService._bets_table(bets),
+            "wallet_transactions": ArchiveService._transactions_table(transactions),
+        }
+
+        directory = ArchiveService.partition_dir(tenant_id, lower)
+        directory.mkdir(parents=True, exist_ok=True)
+        batch_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+        files = {}
+        try:
+            for name, table in tables.items():
+                files[name] = ArchiveService._write_file(directory, f"{name}-{batch_id}.parquet", table)
+            ArchiveService.verify_files(directory, files, {
+                name: {str(v) for v in table.column(_ID_COLUMNS[name]).to_pylist()}
+                for name, table in tables.items()
+            })
+        except Exception:
+            db.rollback()
+            for name in tables:
+                (directory / f"{name}-{batch_id}.parquet").unlink(missing_ok=True)
+            raise
+
+        entry = {
+            "batch_id": batch_id,
+            "archived_at": datetime.utcnow().isoformat(),
+            "started_at_min": min(started).isoformat(),
+            "started_at_max": max(started).isoformat(),
+            "files": files,
+        }
+        manifest = ArchiveService.read_manifest(directory) or {
+            "tenant_id": str(tenant_id),
+            "month": f"{lower:%Y-%m}",
+            "batches": [],
+        }
+        manifest["batches"].append(entry)
+        _write_json(directory / MANIFEST_NAME, manifest)
+
+        # Files are durable and verified: drop the hot copies, partition key bounded so only these months are touched
+        try:
+            db.query(WalletTransaction).filter(
+                WalletTransaction.transaction_id.in_([t.transaction_id for t in transactions]),
+                WalletTransaction.created_at >= related_from,
+                WalletTransaction.created_at < related_to,
+            ).delete(synchronize_session=False)
+            db.query(Bet).filter(
+                Bet.bet_id.in_([b.bet_id for b in bets]),
+                Bet.placed_at >= related_from,
+                Bet.placed_at < related_to,
+            ).delete(synchronize_session=False)
+            db.query(GameRound).filter(
+                GameRound.round_id.in_(round_ids),
+                GameRound.started_at >= lower,
+                GameRound.started_at < upper,
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return entry
+
+    @staticmethod
+    def _write_file(directory: Path, filename: str, table: pa.Table) -> dict:
+        path = directory / filename
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp, compression="zstd")
+        with open(tmp, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return {"path": filename, "rows": table.num_rows, "sha256": _sha256(path)}
+
+    @staticmethod
+    def verify_files(directory: Path, files: dict, expected_ids: dict | None = None):
+        """Re-read each file and match it against its manifest record; raises ArchiveVerificationError."""
+        for name, record in files.items():
+            path = directory / record["path"]
+            if not path.exists():
+                raise ArchiveVerificationError(f"{path} is missing")
+            if _sha256(path) != record["sha256"]:
+                raise ArchiveVerificationError(f"{path} does not match its checksum")
+            table = pq.read_table(path)
+            if table.num_rows != record["rows"]:
+                raise ArchiveVerificationError(f"{path} has {table.num_rows} rows, expected {record['rows']}")
+            if expected_ids is not None and set(table.column(_ID_COLUMNS[name]).to_pylist()) != expected_ids[name]:
+                raise ArchiveVerificationError(f"{path} does not contain the exported rows")
+
+    @staticmethod
+    def _rounds_table(rows) -> pa.Table:
+        # Sorted by player so per-player reads skip row groups by their min/max statistics
+        rows = sorted(rows, key=lambda r: (str(r.player_id), r.GameRound.started_at))
+        return pa.Table.from_pylist([
+            {
+                "round_id": str(r.GameRound.round_id),
+                "session_id": str(r.GameRound.session_id),
+                "tenant_id": str(r.tenant_id),
+                "player_id": str(r.player_id),
+                "game_id": str(r.game_id),
+                "round_number": r.GameRound.round_number,
+                "started_at": r.GameRound.started_at,
+                "ended_at": r.GameRound.ended_at,
+                "outcome": r.GameRound.outcome,
+                "bet_amount": r.GameRound.bet_amount,
+                "win_amount": r.GameRound.win_amount,
+                "result": json.dumps(
+                    read_result(r.GameRound.result_data, r.GameRound.result_blob),
+                    separators=(",", ":"), default=str,
+                ),
+            }
+            for r in rows
+        ], schema=SCHEMAS["rounds"])
+
+    @staticmethod
+    def _bets_table(bets) -> pa.Table:
+        return pa.Table.from_pylist([
+            {
+                "bet_id": str(b.bet_id),
+                "round_id": str(b.round_id),
+                "wallet_id": str(b.wallet_id),
+                "bet_amount": b.bet_amount,
+                "win_amount": b.win_amount,
+                "bet_currency_id": b.bet_currency_id,
+                "bet_status": b.bet_status,
+                "placed_at": b.placed_at,
+                "settled_at": b.settled_at,
+            }
+            for b in bets
+        ], schema=SCHEMAS["bets"])
+
+    @staticmethod
+    def _transactions_table(transactions) -> pa.Table:
+        return pa.Table.from_pylist([
+            {
+                "transaction_id": str(t.transaction_id),
+                "wallet_id": _str(t.wallet_id),
+                "transaction_type_id": t.transaction_type_id,
+                "amount": t.amount,
+                "balance_before": t.balance_before,
+                "balance_after": t.balance_after,
+                "reference_type": t.reference_type,
+                "reference_id": _str(t.reference_id),
+                "status": t.status,
+                "created_at": t.created_at,
+            }
+            for t in transactions
+        ], schema=SCHEMAS["wallet_transactions"])
+
+    # ─────────────────────────────
+    # Read path
+    # ─────────────────────────────
+    @staticmethod
+    def _read(directory: Path, name: str, filters=None, columns=None) -> list[dict]:
+        manifest = ArchiveService.read_manifest(directory)
+        if not manifest:
+            return []
+        rows = []
+        for batch in manifest["batches"]:
+            record = batch["files"][name]
+            if not record["rows"]:
+                continue
+            rows += pq.read_table(directory / record["path"], columns=columns, filters=filters).to_pylist()
+        return rows
+
+    @staticmethod
+    def _unique(rows: list[dict], key: str) -> list[dict]:
+        seen = set()
+        unique = []
+        for row in rows:
+            if row[key] not in seen:
+                seen.add(row[key])
+                unique.append(row)
+        return unique
+
+    @staticmethod
+    def player_rounds(player_id: uuid.UUID, since: datetime | None = None, until: datetime | None = None,
+                      tenant_id: uuid.UUID | None = None) -> list[dict]:
+        """Archived rounds of one player started in [since, until), newest first, with `balance_after` attached."""
+        filters = [("player_id", "=", str(player_id))]
+        if since:
+            filters.append(("started_at", ">=", since))
+        if until:
+            filters.append(("started_at", "<", until))
+
+        rounds = []
+        for directory in ArchiveService._partition_dirs(tenant_id, since, until):
+            found = ArchiveService._read(directory, "rounds", filters)
+            if not found:
+                continue
+            balances = {
+                t["reference_id"]: t["balance_after"]
+                for t in sorted(
+                    ArchiveService._read(
+                        directory, "wallet_transactions",
+                        [("reference_id", "in", [r["round_id"] for r in found])],
+                        ["reference_id", "balance_after", "created_at"],
+                    ),
+                    key=lambda t: t["created_at"],
+                )
+            }
+            for row in found:
+                row["balance_after"] = balances.get(row["round_id"])
+            rounds += found
+
+        rounds = ArchiveService._unique(rounds, "round_id")
+        return sorted(rounds, key=lambda r: r["started_at"], reverse=True)
+
+    @staticmethod
+    def find_round(round_id: uuid.UUID, player_id: uuid.UUID | None = None,
+                   tenant_id: uuid.UUID | None = None) -> dict | None:
+        """An archived round by id (audit lookups); scans the manifests newest month first."""
+        filters = [("round_id", "=", str(round_id))]
+        if player_id:
+            filters.append(("player_id", "=", str(player_id)))
+        for directory in ArchiveService._partition_dirs(tenant_id):
+            found = ArchiveService._read(directory, "rounds", filters)
+            if found:
+                return found[0]
+        return None
@@ -0,0 +1,760 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+from sqlalchemy import update, insert, values, column, cast, LargeBinary, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+from app.game_engines.registry import engine_registry
+from app.game_engines.result_codec import result_columns
+from app.models.bet import Bet
+from app.models.bonus import Bonus
+from app.models.bonus_usage import BonusUsage
+from app.models.game import Game
+from app.models.game_round import GameRound
+from app.models.game_session import GameSession
+from app.models.player_limit import PlayerLimit
+from app.models.tenant_game import TenantGame
+from app.models.transaction_type import TransactionType
+from app.models.wallet import Wallet
+from app.models.wallet_transaction import WalletTransaction
+from app.services.analytics_service import AnalyticsService
+from app.services.bonus_service import BonusService
+from app.services.game_session_service import GameSessionService
+from app.services.gameplay_service import GameplayService
+from app.services.jackpot_service import JackpotService
+from app.services.responsible_gaming_service import ResponsibleGamingService
+from app.services.wallet_service import WalletService
+
+
+logger = logging.getLogger(__name__)
+
+CRASH_BETTING_WINDOW_SECONDS = 8.0
+CRASH_TICK_SECONDS = 0.1
+# Pause after a crash so clients can show the result before the next window
+CRASH_INTERMISSION_SECONDS = 3.0
+SUBSCRIBER_QUEUE_SIZE = 64
+# Settlement attempts before the table moves on and leaves the rounds to the reaper
+CRASH_SETTLE_ATTEMPTS = 3
+# A table round still open this long after its crash point is stranded (see recover_stranded)
+CRASH_TABLE_RECOVERY_GRACE_SECONDS = 60.0
+
+BETTING, LOCKED, RUNNING, CRASHED = "BETTING", "LOCKED", "RUNNING", "CRASHED"
+
+
+def _frame(payload: dict) -> str:
+    return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+def _values(name: str, rows: list[tuple], **types):
+    """VALUES list usable as a table in UPDATE ... FROM (one statement for N rows)."""
+    return values(*(column(col, type_) for col, type_ in types.items()), name=name).data(rows)
+
+
+class CrashTableBet:
+    __slots__ = (
+        "player_id", "wallet_id", "currency_id", "amount", "auto_cashout", "opt_in",
+        "game_stake", "cashed_out_at", "accepted", "round_id", "bet_id",
+    )
+
+    def __init__(self, player_id, wallet_id, currency_id, amount: float, auto_cashout: float | None,
+                 opt_in: bool = False):
+        self.player_id = player_id
+        self.wallet_id = wallet_id
+        self.currency_id = currency_id
+        self.amount = amount
+        self.auto_cashout = auto_cashout
+        self.opt_in = opt_in
+        # What the multiplier pays on: the amount less any jackpot contribution (set at open)
+        self.game_stake = amount
+        self.cashed_out_at: float | None = None
+        self.accepted = False
+        self.round_id = None
+        self.bet_id = None
+
+    def multiplier(self, crash_point: float) -> float:
+        """Paid multiplier: the earlier of a manual and a reached automatic cash-out."""
+        reached = [m for m in (self.cashed_out_at, self.auto_cashout) if m is not None and m <= crash_point]
+        return min(reached) if reached else 0.0
+
+
+class CrashTable:
+    __slots__ = (
+        "tenant_id", "game_id", "provider_id", "engine", "min_bet", "max_bet",
+        "phase", "table_round_id", "round_no", "bets", "crash_point",
+        "betting_closes_at", "running_since", "subscribers", "task",
+    )
+
+    def __init__(self, tenant_id, game_id, provider_id, engine_config: dict, min_bet, max_bet):
+        self.tenant_id = tenant_id
+        self.game_id = game_id
+        self.provider_id = provider_id
+        self.engine = engine_registry.engine("crash", engine_config)
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+        self.phase = CRASHED
+        self.table_round_id = None
+        self.round_no = 0
+        self.bets: dict = {}
+        self.crash_point: float | None = None
+        self.betting_closes_at = 0.0
+        self.running_since = 0.0
+        self.subscribers: set[asyncio.Queue] = set()
+        self.task: asyncio.Task | None = None
+
+    def current_multiplier(self) -> float:
+        return self.engine.multiplier_at(time.monotonic() - self.running_since)
+
+
+class CrashTableService:
+    """
+    Shared crash rounds: one table per (tenant, game) runs a round every
+    few seconds for everybody seated at it.
+
+    BETTING  bets are validated and held in memory.
+    LOCKED   one crash point is drawn; one UPDATE debits every wallet and
+             one multi-row INSERT each records the sessions, rounds, bets
+             and wallet transactions.
+    RUNNING  the multiplier is streamed each tick; cash-outs only touch
+             the in-memory bet.
+    CRASHED  one UPDATE each settles the rounds and bets, one UPDATE
+             credits the winners, and analytics go in as one upsert.
+
+    Each round row is written at LOCKED with status OPEN, the crash point,
+    the auto cash-out and a settle_by deadline. If settlement fails or the
+    process dies, recover_stranded (run by the round reaper) settles the
+    round from that record instead of leaving the stake debited.
+
+    All table state is owned by the event loop (endpoints are async and
+    run DB work through asyncio.to_thread), so it needs no locks. Tables
+    live in the API process that hosts them: run a single worker or route
+    a game's traffic to one worker.
+    """
+
+    _tables: dict = {}
+    _txn_types: dict = {}
+
+    # ─────────────────────────────
+    # Tables / subscriptions
+    # ─────────────────────────────
+    @staticmethod
+    def _load_table(tenant_id, game_id) -> CrashTable:
+        db = SessionLocal()
+        try:
+            row = db.query(Game, TenantGame).join(
+                TenantGame, TenantGame.game_id == Game.game_id
+            ).filter(
+                Game.game_id == game_id,
+                Game.status == "active",
+                TenantGame.tenant_id == tenant_id,
+                TenantGame.is_active == True
+            ).first()
+            if not row:
+                raise HTTPException(status_code=404, detail="Game not available")
+            game, tenant_game = row
+            if game.engine_type not in ["crash", "crash_engine"]:
+                raise HTTPException(status_code=400, detail="Game is not a crash game")
+
+            return CrashTable(
+                tenant_id, game_id, game.provider_id, game.engine_config or {},
+                float(tenant_game.min_bet or game.min_bet or 0),
+                float(tenant_game.max_bet or game.max_bet or 0) or None,
+            )
+        finally:
+            db.close()
+
+    @staticmethod
+    async def get_table(tenant_id, game_id) -> CrashTable:
+        key = (tenant_id, game_id)
+        table = CrashTableService._tables.get(key)
+        if table is None:
+            loaded = await asyncio.to_thread(CrashTableService._load_table, tenant_id, game_id)
+            # Another request may have seated the table while we were loading
+            table = CrashTableService._tables.setdefault(key, loaded)
+
+        if table.task is None or table.task.done():
+            CrashTableService._tables[key] = table
+            CrashTableService._begin_betting(table)
+            table.task = asyncio.create_task(CrashTableService._run(table))
+        return table
+
+    @staticmethod
+    async def subscribe(tenant_id, game_id) -> tuple[CrashTable, asyncio.Queue]:
+        table = await CrashTableService.get_table(tenant_id, game_id)
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        queue.put_nowait(_frame(CrashTableService.snapshot(table)))
+        table.subscribers.add(queue)
+        return table, queue
+
+    @staticmethod
+    def unsubscribe(table: CrashTable, queue: asyncio.Queue):
+        table.subscribers.discard(queue)
+
+    @staticmethod
+    def _broadcast(table: CrashTable, payload: dict):
+        frame = _frame(payload)
+        for queue in table.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+    @staticmethod
+    def snapshot(table: CrashTable, player_id=None) -> dict:
+        state = {
+            "phase": table.phase,
+            "round": table.round_no,
+            "players": len(table.bets),
+        }
+        if table.phase == BETTING:
+            state["closes_in"] = round(max(0.0, table.betting_closes_at - time.monotonic()), 2)
+        elif table.phase == RUNNING:
+            state["multiplier"] = table.current_multiplier()
+        elif table.phase == CRASHED:
+            state["crash_point"] = table.crash_point
+
+        bet = table.bets.get(player_id) if player_id else None
+        if bet:
+            state["your_bet"] = {
+                "amount": bet.amount,
+                "auto_cashout": bet.auto_cashout,
+                "cashed_out_at": bet.cashed_out_at,
+                "accepted": bet.accepted,
+            }
+        return state
+
+    # ─────────────────────────────
+    # Player actions
+    # ─────────────────────────────
+    @staticmethod
+    def _validate_bet(db: Session, table: CrashTable, player_id, amount: float) -> tuple:
+        """Read-only checks done at bet time; the debit itself happens when betting closes."""
+        try:
+            if amount < table.min_bet or (table.max_bet and amount > table.max_bet):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Bet amount {amount} is outside allowed range ({table.min_bet}-{table.max_bet})"
+                )
+
+            wallet = WalletService.get_wallet(db, player_id, "CASH", table.tenant_id)
+            if float(wallet.balance) < amount:
+                raise HTTPException(status_code=400, detail="Insufficient balance")
+
+            for limit_type in ("WAGER", "LOSS"):
+                check = ResponsibleGamingService.check_limit(
+                    db=db,
+                    player_id=player_id,
+                    tenant_id=table.tenant_id,
+                    limit_type=limit_type,
+                    amount=amount,
+                    period="DAILY"
+                )
+                if not check.within_limit:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"{limit_type.title()} limit exceeded. Your daily {limit_type.lower()} limit is ${check.limit_value:.2f}."
+                    )
+
+            session = db.query(GameSession).filter(
+                GameSession.player_id == player_id,
+                GameSession.game_id == table.game_id,
+                GameSession.status == "active"
+            ).first()
+            GameplayService.enforce_session_limit(db, player_id, table.tenant_id, session)
+            return wallet.wallet_id, wallet.currency_id
+        finally:
+            db.rollback()  # release the wallet row lock
+
+    @staticmethod
+    async def place_bet(db: Session, player_id, tenant_id, game_id, amount: float,
+                        auto_cashout: float | None = None, opt_in: bool = False):
+        table = await CrashTableService.get_table(tenant_id, game_id)
+        if table.phase != BETTING:
+            raise HTTPException(status_code=409, detail="Betting is closed for this round")
+        if player_id in table.bets:
+            raise HTTPException(status_code=409, detail="You already have a bet in this round")
+
+        wallet_id, currency_id = await asyncio.to_thread(
+            CrashTableService._validate_bet, db, table, player_id, amount
+        )
+        # The window may have closed during validation
+        if table.phase != BETTING or player_id in table.bets:
+            raise HTTPException(status_code=409, detail="Betting is closed for this round")
+
+        table.bets[player_id] = CrashTableBet(player_id, wallet_id, currency_id, amount, auto_cashout, opt_in)
+        return CrashTableService.snapshot(table, player_id)
+
+    @staticmethod
+    async def cash_out(player_id, tenant_id, game_id):
+        table = CrashTableService._tables.get((tenant_id, game_id))
+        bet = table.bets.get(player_id) if table else None
+        if bet is None or not bet.accepted:
+            raise HTTPException(status_code=404, detail="No active bet in this round")
+        if table.phase != RUNNING:
+            raise HTTPException(status_code=409, detail="Round is not running")
+        if bet.cashed_out_at is not None:
+            raise HTTPException(status_code=409, detail="Already cashed out")
+
+        multiplier = table.current_multiplier()
+        if multiplier >= table.crash_point:
+            # Crashed between two ticks
+            raise HTTPException(status_code=409, detail="Round already crashed")
+
+        bet.cashed_out_at = multiplier
+        paid = bet.multiplier(table.crash_point)
+        return {"round": table.round_no, "multiplier": paid, "win_amount": round(bet.game_stake * paid, 2)}
+
+    # ─────────────────────────────
+    # Round loop
+    # ─────────────────────────────
+    @staticmethod
+    def _begin_betting(table: CrashTable):
+        table.phase = BETTING
+        table.round_no += 1
+        table.table_round_id = uuid.uuid4()
+        table.bets = {}
+        table.crash_point = None
+        table.betting_closes_at = time.monotonic() + CRASH_BETTING_WINDOW_SECONDS
+        CrashTableService._broadcast(table, CrashTableService.snapshot(table))
+
+    @staticmethod
+    async def _run(table: CrashTable):
+        key = (table.tenant_id, table.game_id)
+        try:
+            while True:
+                if table.phase != BETTING:
+                    CrashTableService._begin_betting(table)
+                await asyncio.sleep(max(0.0, table.betting_closes_at - time.monotonic()))
+
+                # One draw for everybody at the table
+                table.phase = LOCKED
+                table.crash_point = table.engine.draw_crash_point()
+                bets = list(table.bets.values())
+
+                if bets:
+                    try:
+                        accepted = await asyncio.to_thread(CrashTableService.open_round, table, bets)
+                    except Exception:
+                        logger.exception("Crash table %s could not open round %s", key, table.round_no)
+                        accepted = set()
+                    for bet in bets:
+                        if bet.player_id not in accepted:
+                            table.bets.pop(bet.player_id, None)
+                        else:
+                            bet.accepted = True
+
+                table.phase = RUNNING
+                table.running_since = time.monotonic()
+                while True:
+                    multiplier = table.current_multiplier()
+                    if multiplier >= table.crash_point:
+                        break
+                    CrashTableService._broadcast(table, {
+                        "phase": RUNNING,
+                        "round": table.round_no,
+                        "multiplier": multiplier,
+                        "cashed_out": sum(1 for b in table.bets.values() if b.multiplier(multiplier) > 0),
+                    })
+                    await asyncio.sleep(CRASH_TICK_SECONDS)
+
+                table.phase = CRASHED
+                CrashTableService._broadcast(table, CrashTableService.snapshot(table))
+
+                settled = [b for b in table.bets.values() if b.accepted]
+                for attempt in range(1, CRASH_SETTLE_ATTEMPTS + 1 if settled else 0):
+                    try:
+                        await asyncio.to_thread(CrashTableService.settle_round, table, settled)
+                        break
+                    except Exception:
+                        logger.exception("Crash table %s could not settle round %s (attempt %s/%s)",
+                                         key, table.round_no, attempt, CRASH_SETTLE_ATTEMPTS)
+                        await asyncio.sleep(attempt)
+
+                await asyncio.sleep(CRASH_INTERMISSION_SECONDS)
+                if not table.subscribers:
+                    break
+        finally:
+            if CrashTableService._tables.get(key) is table:
+                del CrashTableService._tables[key]
+
+    # ─────────────────────────────
+    # Bulk writes
+    # ─────────────────────────────
+    @staticmethod
+    def _txn_type_ids(db: Session) -> dict:
+        if not CrashTableService._txn_types:
+            rows = db.query(TransactionType.transaction_code, TransactionType.transaction_type_id).filter(
+                TransactionType.transaction_code.in_(["bet", "win"])
+            ).all()
+            CrashTableService._txn_types = {code: type_id for code, type_id in rows}
+        return CrashTableService._txn_types
+
+    @staticmethod
+    def _players_with(db: Session, tenant_id, player_ids: list, limit_type: str) -> set:
+        rows = db.query(PlayerLimit.player_id).filter(
+            PlayerLimit.player_id.in_(player_ids),
+            PlayerLimit.tenant_id == tenant_id,
+            PlayerLimit.limit_type == limit_type,
+            PlayerLimit.status == "ACTIVE"
+        ).all()
+        return {row.player_id for row in rows}
+
+    @staticmethod
+    def _players_wagering(db: Session, tenant_id, player_ids: list) -> set:
+        rows = db.query(BonusUsage.player_id).join(
+            Bonus, BonusUsage.bonus_id == Bonus.bonus_id
+        ).filter(
+            BonusUsage.player_id.in_(player_ids),
+            BonusUsage.status == "active",
+            Bonus.tenant_id == tenant_id
+        ).all()
+        return {row.player_id for row in rows}
+
+    @staticmethod
+    def _update_usage(db: Session, tenant_id, player_id, limit_type: str, amount: float):
+        # Limits were checked when the bet was taken; a concurrent overrun must
+        # not fail the round for every other player at the table
+        try:
+            with db.begin_nested():
+                ResponsibleGamingService.update_usage(
+                    db=db, player_id=player_id, tenant_id=tenant_id,
+                    limit_type=limit_type, amount=amount, period="DAILY"
+                )
+        except HTTPException:
+            logger.warning("%s usage for player %s exceeds the limit", limit_type, player_id)
+
+    @staticmethod
+    def _move_funds(db: Session, bets: list[CrashTableBet], amounts: list[Decimal], debit: bool) -> dict:
+        """One UPDATE for all wallets; debits skip wallets that can no longer cover the bet."""
+        moves = _values(
+            "moves", [(b.wallet_id, a) for b, a in zip(bets, amounts)],
+            wallet_id=PG_UUID(as_uuid=True), amount=Numeric(18, 2),
+        )
+        stmt = update(Wallet).where(Wallet.wallet_id == moves.c.wallet_id)
+        if debit:
+            stmt = stmt.where(Wallet.balance >= moves.c.amount).values(balance=Wallet.balance - moves.c.amount)
+        else:
+            stmt = stmt.values(balance=Wallet.balance + moves.c.amount)
+
+        rows = db.execute(stmt.returning(Wallet.wallet_id, Wallet.balance)).all()
+        return {row.wallet_id: row.balance for row in rows}
+
+    @staticmethod
+    def _insert_transactions(db: Session, code: str, bets, amounts, balances: dict):
+        type_id = CrashTableService._txn_type_ids(db)[code]
+        sign = -1 if code == "bet" else 1
+        db.execute(insert(WalletTransaction), [
+            {
+                "transaction_id": uuid.uuid4(),
+                "wallet_id": bet.wallet_id,
+                "transaction_type_id": type_id,
+                "amount": sign * amount,
+                "balance_before": balances[bet.wallet_id] - sign * amount,
+                "balance_after": balances[bet.wallet_id],
+                "reference_type": "bet",
+                "reference_id": bet.round_id,
+                "status": "success",
+                "created_at": datetime.utcnow(),
+            }
+            for bet, amount in zip(bets, amounts)
+        ])
+
+    @staticmethod
+    def _open_sessions(db: Session, table: CrashTable, player_ids: list, sessions: dict):
+        """Insert an active session for each player in one statement, recording it in `sessions`."""
+        if not player_ids:
+            return
+        new_sessions = [
+            {"session_id": uuid.uuid4(), "player_id": pid, "game_id": table.game_id,
+             "tenant_id": table.tenant_id, "status": "active", "started_at": datetime.now()}
+            for pid in player_ids
+        ]
+        db.execute(insert(GameSession), new_sessions)
+        sessions.update({s["player_id"]: s["session_id"] for s in new_sessions})
+
+    @staticmethod
+    def open_round(table: CrashTable, bets: list[CrashTableBet]) -> set:
+        """Debit every bet and record it; returns the player ids whose debit went through."""
+        db = SessionLocal()
+        try:
+            amounts = [Decimal(str(b.amount)) for b in bets]
+            balances = CrashTableService._move_funds(db, bets, amounts, debit=True)
+            accepted = [(b, a) for b, a in zip(bets, amounts) if b.wallet_id in balances]
+            if not accepted:
+                db.rollback()
+                return set()
+            bets, amounts = [b for b, _ in accepted], [a for _, a in accepted]
+            player_ids = [b.player_id for b in bets]
+            now = datetime.utcnow()
+
+            # Sessions: reuse each player's active one, create the rest in one insert
+            sessions = dict(db.query(GameSession.player_id, GameSession.session_id).filter(
+                GameSession.player_id.in_(player_ids),
+                GameSession.game_id == table.game_id,
+                GameSession.status == "active"
+            ).all())
+            CrashTableService._open_sessions(db, table, [pid for pid in player_ids if pid not in sessions], sessions)
+            round_numbers = GameSessionService.reserve_round_numbers(db, list(sessions.values()))
+
+            # Sessions the reaper expired while we waited on their row lock start over
+            expired = [pid for pid, sid in sessions.items() if sid not in round_numbers]
+            if expired:
+                CrashTableService._open_sessions(db, table, expired, sessions)
+                round_numbers.update(GameSessionService.reserve_round_numbers(
+                    db, [sessions[pid] for pid in expired]
+                ))
+
+            for bet in bets:
+                bet.round_id, bet.bet_id = uuid.uuid4(), uuid.uuid4()
+                if bet.opt_in:
+                    # Same split as single-player rounds: the contribution goes to the progressive pool
+                    bet.game_stake = JackpotService.process_progressive_bet(
+                        db, bet.player_id, table.tenant_id, bet.amount, bet_id=bet.bet_id
+                    )
+
+            # Enough for recover_stranded to settle the round without this process
+            settle_by = time.time() + table.engine.seconds_to(table.crash_point) + CRASH_TABLE_RECOVERY_GRACE_SECONDS
+            db.execute(insert(GameRound), [
+                {
+                    "round_id": bet.round_id,
+                    "session_id": sessions[bet.player_id],
+                    "round_number": round_numbers[sessions[bet.player_id]],
+                    "started_at": now,
+                    "bet_amount": amount,
+                    "result_data": {
+                        "status": "OPEN",
+                        "table_round_id": str(table.table_round_id),
+                        "table_round": table.round_no,
+                        "crash_at": table.crash_point,
+                        "auto_cashout": bet.auto_cashout,
+                        "game_stake": bet.game_stake,
+                        "opt_in": bet.opt_in,
+                        "settle_by": settle_by,
+                    },
+                }
+                for bet, amount in zip(bets, amounts)
+            ])
+            db.execute(insert(Bet), [
+                {
+                    "bet_id": bet.bet_id,
+                    "round_id": bet.round_id,
+                    "wallet_id": bet.wallet_id,
+                    "bet_amount": amount,
+                    "win_amount": 0,
+                    "bet_currency_id": bet.currency_id,
+                    "bet_status": "placed",
+                    "placed_at": now,
+                }
+                for bet, amount in zip(bets, amounts)
+            ])
+            CrashTableService._insert_transactions(db, "bet", bets, amounts, balances)
+
+            # Per-player bookkeeping only for players who actually have a limit;
+            # bonus wagering waits for settlement, since a stranded round may be voided
+            limited = CrashTableService._players_with(db, table.tenant_id, player_ids, "WAGER")
+            for bet in bets:
+                if bet.player_id in limited:
+                    CrashTableService._update_usage(db, table.tenant_id, bet.player_id, "WAGER", bet.amount)
+
+            db.commit()
+            return set(player_ids)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def settle_round(table: CrashTable, bets: list[CrashTableBet]):
+        db = SessionLocal()
+        try:
+            crash_point = table.crash_point
+            settlements = []
+            for bet in bets:
+                paid = bet.multiplier(crash_point)
+                win = Decimal(str(round(bet.game_stake * paid, 2)))
+                settlements.append((bet, win, "WIN" if win > 0 else "LOSE", {
+                    "crash_at": crash_point,
+                    "cashed_out": paid or None,
+                    "auto_cashout": bet.auto_cashout,
+                    "table_round_id": str(table.table_round_id),
+                    "table_round": table.round_no,
+                }))
+
+            # Table rounds settle seconds after they open: only the newest partitions can hold them
+            opened_after = datetime.utcnow() - timedelta(hours=1)
+            CrashTableService._settle(db, table.tenant_id, table.game_id, table.provider_id, settlements, opened_after)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _settle(db: Session, tenant_id, game_id, provider_id, settlements: list[tuple], opened_after: datetime) -> int:
+        """
+        Settle (bet, win, outcome, result_data) tuples of one game whose rounds
+        opened after `opened_after` (partition pruning). Only rounds still open
+        are touched, so the table loop and recover_stranded never both pay a
+        round. Returns how many settled; does not commit.
+        """
+        now = datetime.utcnow()
+        outcomes = _values(
+            "outcomes",
+            [
+                (
+                    bet.round_id, win, outcome,
+                    json.dumps(result["result_data"]) if result["result_data"] is not None else None,
+                    result["result_blob"],
+                )
+                for bet, win, outcome, result_data in settlements
+                for result in [result_columns(result_data, "crash")]
+            ],
+            round_id=PG_UUID(as_uuid=True), win_amount=Numeric(18, 2),
+            outcome=String(50), result_data=String(), result_blob=LargeBinary(),
+        )
+        settled_ids = {row.round_id for row in db.execute(
+            update(GameRound).where(
+                GameRound.round_id == outcomes.c.round_id,
+                GameRound.started_at >= opened_after,
+                GameRound.ended_at.is_(None)
+            ).values(
+                win_amount=outcomes.c.win_amount,
+                outcome=outcomes.c.outcome,
+                result_data=cast(outcomes.c.result_data, GameRound.result_data.type),
+                result_blob=outcomes.c.result_blob,
+                ended_at=now,
+            ).returning(GameRound.round_id)
+        ).all()}
+        settlements = [s for s in settlements if s[0].round_id in settled_ids]
+        if not settlements:
+            return 0
+
+        db.execute(
+            update(Bet).where(
+                Bet.round_id == outcomes.c.round_id,
+                Bet.round_id.in_(settled_ids),
+                Bet.placed_at >= opened_after
+            ).values(
+                win_amount=outcomes.c.win_amount,
+                bet_status="settled",
+                settled_at=now,
+            )
+        )
+
+        winners = [(bet, win) for bet, win, _, _ in settlements if win > 0]
+        if winners:
+            winning_bets, win_amounts = [b for b, _ in winners], [w for _, w in winners]
+            balances = CrashTableService._move_funds(db, winning_bets, win_amounts, debit=False)
+            CrashTableService._insert_transactions(db, "win", winning_bets, win_amounts, balances)
+
+        losers = CrashTableService._players_with(
+            db, tenant_id, [bet.player_id for bet, _, _, _ in settlements], "LOSS"
+        )
+        for bet, win, _, _ in settlements:
+            net_loss = float(Decimal(str(bet.amount)) - win)
+            if bet.player_id in losers and net_loss > 0:
+                CrashTableService._update_usage(db, tenant_id, bet.player_id, "LOSS", net_loss)
+
+        # A VOID handed the stake back: it was no wager and no win
+        played = [(bet, win) for bet, win, outcome, _ in settlements if outcome != "VOID"]
+        wagering = CrashTableService._players_wagering(db, tenant_id, [bet.player_id for bet, _ in played])
+        for bet, _ in played:
+            if bet.player_id in wagering:
+                BonusService.apply_wagering(db, player_id=bet.player_id, bet_amount=bet.game_stake, tenant_id=tenant_id)
+
+        AnalyticsService.update_bet_stats_bulk(
+            db, tenant_id, game_id, provider_id,
+            [(bet.player_id, bet.amount, float(win)) for bet, win in played],
+        )
+        return len(settlements)
+
+    # ─────────────────────────────
+    # Recovery (round reaper)
+    # ─────────────────────────────
+    @staticmethod
+    def recover_stranded(db: Session, now: float | None = None, limit: int = 500) -> int:
+        """
+        Settle table rounds whose table never did: settlement kept failing or
+        the hosting process went away. Manual cash-outs lived only in that
+        process, so a round pays its auto cash-out when the crash point
+        reached it and is otherwise VOID with the stake returned. Commits;
+        returns how many rounds settled.
+        """
+        now = now or time.time()
+        rows = db.query(
+            GameRound.round_id, GameRound.started_at, GameRound.bet_amount, GameRound.result_data,
+            Bet.bet_id, Bet.wallet_id, Bet.bet_currency_id,
+            GameSession.player_id, GameSession.tenant_id, GameSession.game_id, Game.provider_id
+        ).join(
+            Bet, Bet.round_id == GameRound.round_id
+        ).join(
+            GameSession, GameSession.session_id == GameRound.session_id
+        ).join(
+            Game, Game.game_id == GameSession.game_id
+        ).filter(
+            GameRound.ended_at.is_(None),
+            GameRound.result_data["status"].astext == "OPEN",
+            GameRound.result_data.has_key("table_round_id"),
+            GameRound.result_data["settle_by"].as_float() < now
+        ).order_by(GameRound.started_at).limit(limit).with_for_update(of=GameRound, skip_locked=True).all()
+
+        table_rounds: dict = {}
+        voided = []
+        for row in rows:
+            data = row.result_data
+            bet = CrashTableBet(
+                row.player_id, row.wallet_id, row.bet_currency_id, float(row.bet_amount),
+                data.get("auto_cashout"), data.get("opt_in", False)
+            )
+            bet.round_id, bet.bet_id = row.round_id, row.bet_id
+            bet.game_stake = data.get("game_stake", bet.amount)
+
+            paid = bet.multiplier(data["crash_at"])
+            win = Decimal(str(round(bet.game_stake * paid, 2))) if paid else Decimal(str(bet.amount))
+            result_data = {
+                "crash_at": data["crash_at"],
+                "cashed_out": paid or None,
+                "auto_cashout": bet.auto_cashout,
+                "table_round_id": data["table_round_id"],
+                "table_round": data["table_round"],
+                "recovered": True,
+            }
+            # Settled per table round: one bet per player, so one wallet row per UPDATE
+            table_rounds.setdefault((row.tenant_id, row.game_id, row.provider_id, data["table_round_id"]), []).append(
+                (bet, win, "WIN" if paid else "VOID", result_data)
+            )
+            if not paid:
+                voided.append((row, bet))
+
+        try:
+            # A VOID returns the whole bet (the rows are locked, so every one settles):
+            # its jackpot contribution and WAGER usage are taken back
+            contributions = [bet.bet_id for _, bet in voided if bet.opt_in]
+            if contributions:
+                JackpotService.reverse_contributions(db, contributions)
+            for row, bet in voided:
+                ResponsibleGamingService.release_usage(
+                    db, bet.player_id, row.tenant_id, "WAGER", bet.amount,
+                    since=row.started_at.replace(tzinfo=timezone.utc).timestamp()
+                )
+
+            opened_after = min((row.started_at for row in rows), default=None)
+            settled = sum(
+                CrashTableService._settle(db, tenant_id, game_id, provider_id, settlements, opened_after)
+                for (tenant_id, game_id, provider_id, _), settlements in table_rounds.items()
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        if settled:
+            logger.warning("Recovered %s stranded crash table rounds", settled)
+        return settled
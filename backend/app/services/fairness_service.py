@@ -0,0 +1,200 @@
+import json
+import secrets
+import uuid
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+from sqlalchemy import update, text
+from sqlalchemy.dialects.postgresql import insert
+from fastapi import HTTPException
+
+from app.game_engines.result_codec import read_result
+from app.game_engines.rng import FairRNG, hash_server_seed
+from app.models.fairness_seed import FairnessSeed
+from app.models.game import Game
+from app.models.game_round import GameRound
+from app.models.game_session import GameSession
+from app.services.archive_service import ArchiveService
+
+
+class FairnessService:
+
+    # ─────────────────────────────
+    # Seeds
+    # ─────────────────────────────
+    @staticmethod
+    def _create_seed(db: Session, player_id: uuid.UUID, client_seed: str | None = None):
+        server_seed = secrets.token_hex(32)
+        # A concurrent first round may have created the pair already
+        db.execute(
+            insert(FairnessSeed).values(
+                seed_id=uuid.uuid4(),
+                player_id=player_id,
+                server_seed=server_seed,
+                server_seed_hash=hash_server_seed(server_seed),
+                client_seed=client_seed or secrets.token_hex(8),
+                nonce=0,
+                is_active=True,
+            ).on_conflict_do_nothing(
+                index_elements=["player_id"],
+                index_where=text("is_active = true"),
+            )
+        )
+
+    @staticmethod
+    def get_active_seed(db: Session, player_id: uuid.UUID) -> FairnessSeed:
+        seed = db.query(FairnessSeed).filter(
+            FairnessSeed.player_id == player_id,
+            FairnessSeed.is_active == True
+        ).first()
+
+        if not seed:
+            FairnessService._create_seed(db, player_id)
+            db.commit()
+            seed = db.query(FairnessSeed).filter(
+                FairnessSeed.player_id == player_id,
+                FairnessSeed.is_active == True
+            ).one()
+        return seed
+
+    @staticmethod
+    def public_view(seed: FairnessSeed) -> dict:
+        return {
+            "server_seed_hash": seed.server_seed_hash,
+            "client_seed": seed.client_seed,
+            "nonce": seed.nonce,
+        }
+
+    # ─────────────────────────────
+    # Per-round randomness
+    # ─────────────────────────────
+    @staticmethod
+    def reserve_rounds(db: Session, player_id: uuid.UUID, count: int = 1) -> list[tuple[FairRNG, dict]]:
+        """
+        Claim `count` consecutive nonces with one UPDATE ... RETURNING and
+        build their streams from a single keyed HMAC. Returns (rng, fairness)
+        pairs; `fairness` is what gets stored on the round. Does not commit.
+        """
+        stmt = update(FairnessSeed).where(
+            FairnessSeed.player_id == player_id,
+            FairnessSeed.is_active == True
+        ).values(
+            nonce=FairnessSeed.nonce + count
+        ).returning(
+            FairnessSeed.server_seed,
+            FairnessSeed.server_seed_hash,
+            FairnessSeed.client_seed,
+            FairnessSeed.nonce,
+        ).execution_options(synchronize_session=False)
+
+        row = db.execute(stmt).first()
+        if row is None:
+            FairnessService._create_seed(db, player_id)
+            row = db.execute(stmt).one()
+
+        first_nonce = row.nonce - count
+        return [
+            (rng, {
+                "server_seed_hash": row.server_seed_hash,
+                "client_seed": row.client_seed,
+                "nonce": rng.nonce,
+            })
+            for rng in FairRNG.for_rounds(row.server_seed, row.client_seed, first_nonce, count)
+        ]
+
+    # ─────────────────────────────
+    # Rotation / reveal
+    # ─────────────────────────────
+    @staticmethod
+    def rotate_seed(db: Session, player_id: uuid.UUID, client_seed: str | None = None):
+        """Retire and reveal the active server seed, then start a fresh pair."""
+        current = db.query(FairnessSeed).filter(
+            FairnessSeed.player_id == player_id,
+            FairnessSeed.is_active == True
+        ).with_for_update().first()
+
+        revealed = None
+        if current:
+            current.is_active = False
+            current.revealed_at = datetime.utcnow()
+            db.flush()
+            revealed = {
+                "server_seed": current.server_seed,
+                "server_seed_hash": current.server_seed_hash,
+                "client_seed": current.client_seed,
+                "rounds_played": current.nonce,
+            }
+            client_seed = client_seed or current.client_seed
+
+        FairnessService._create_seed(db, player_id, client_seed)
+        db.commit()
+
+        return {
+            "revealed": revealed,
+            "active": FairnessService.public_view(FairnessService.get_active_seed(db, player_id)),
+        }
+
+    # ─────────────────────────────
+    # Verification
+    # ─────────────────────────────
+    @staticmethod
+    def verify_round(db: Session, player_id: uuid.UUID, round_id: uuid.UUID):
+        """Replay a round from its revealed seed and compare with what was recorded."""
+        from app.services.gameplay_service import GameplayService
+
+        row = db.query(GameRound, Game).join(
+            GameSession, GameSession.session_id == GameRound.session_id
+        ).join(
+            Game, Game.game_id == GameSession.game_id
+        ).filter(
+            GameRound.round_id == round_id,
+            GameSession.player_id == player_id
+        ).first()
+
+        if row:
+            round_obj, game = row
+            bet_amount = round_obj.bet_amount
+            recorded = dict(read_result(round_obj.result_data, round_obj.result_blob) or {})
+        else:
+            # Rounds past the hot window are audited from the Parquet archive
+            archived = ArchiveService.find_round(round_id, player_id=player_id)
+            game = db.query(Game).filter(Game.game_id == uuid.UUID(archived["game_id"])).first() if archived else None
+            if not game:
+                raise HTTPException(status_code=404, detail="Round not found")
+            bet_amount = archived["bet_amount"]
+            recorded = dict(json.loads(archived["result"]) or {})
+
+        fairness = recorded.pop("fairness", None)
+        if not fairness:
+            raise HTTPException(status_code=400, detail="Round was not played with a provably fair seed")
+        if recorded.get("status") == "OPEN":
+            raise HTTPException(status_code=400, detail="Round is still in progress")
+
+        seed = db.query(FairnessSeed).filter(
+            FairnessSeed.server_seed_hash == fairness["server_seed_hash"]
+        ).first()
+        if not seed or seed.is_active:
+            raise HTTPException(status_code=400, detail="Rotate your seed to reveal the server seed for this round")
+
+        engine = GameplayService.get_engine(
+            game, rng=FairRNG(seed.server_seed, fairness["client_seed"], fairness["nonce"])
+        )
+        if recorded.get("interactive"):
+            # Interactive rounds: the player drove the steps, the seed only drew
+            # what was committed at start (mine layout / crash point)
+            result_data = {**recorded, **engine.initial_state()}
+        else:
+            result_data = engine.run(float(bet_amount or 0), **fairness.get("inputs", {}))["result_data"]
+        # Same JSON round trip the recorded data went through
+        replayed = json.loads(json.dumps(result_data, default=str))
+
+        return {
+            "round_id": round_id,
+            "verified": replayed == recorded and hash_server_seed(seed.server_seed) == seed.server_seed_hash,
+            "server_seed": seed.server_seed,
+            "server_seed_hash": seed.server_seed_hash,
+            "client_seed": fairness["client_seed"],
+            "nonce": fairness["nonce"],
+            "recorded": recorded,
+            "replayed": replayed,
+        }
@@ -0,0 +1,261 @@
+import re
+from collections import Counter
+
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, func, case, tuple_, literal_column
+
+from app.models.game import Game, GameStatusEnum, GAME_SEARCH_VECTOR
+from app.models.game_provider import GameProvider
+from app.models.tenant_game import TenantGame
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Longest prefix stored in the in-memory index; longer terms are verified
+# against the candidate's tokens after the posting lookup.
+MAX_PREFIX_LENGTH = 16
+
+FACET_FIELDS = ("provider_name", "engine_type", "volatility", "rtp_band")
+
+
+def tokenize(text) -> list[str]:
+    return TOKEN_RE.findall(str(text or "").lower())
+
+
+def rtp_band(rtp) -> str:
+    if rtp is None:
+        return "unknown"
+    rtp = float(rtp)
+    if rtp < 94:
+        return "<94"
+    if rtp < 96:
+        return "94-96"
+    if rtp < 97:
+        return "96-97"
+    if rtp < 98:
+        return "97-98"
+    return "98+"
+
+
+def _rtp_band_expr(column):
+    # SQL twin of rtp_band(); keep the two in sync
+    return case(
+        (column.is_(None), "unknown"),
+        (column < 94, "<94"),
+        (column < 96, "94-96"),
+        (column < 97, "96-97"),
+        (column < 98, "97-98"),
+        else_="98+",
+    )
+
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class LobbySearchIndex:
+    """
+    In-memory inverted index over one tenant's lobby snapshot.
+
+    Every token of a game's name, code, provider, engine type and volatility
+    is stored under all of its prefixes, so typeahead is a dict lookup per
+    query term plus a set intersection.
+    """
+
+    def __init__(self, games: list[dict]):
+        self.games = games
+        self._postings: dict[str, set[int]] = {}
+        self._tokens: list[set[str]] = []
+        self._facets: list[dict] = []
+
+        for position, game in enumerate(games):
+            tokens = set()
+            for field in ("game_name", "game_code", "provider_name", "engine_type", "volatility"):
+                tokens.update(tokenize(game.get(field)))
+
+            for token in tokens:
+                for end in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                    self._postings.setdefault(token[:end], set()).add(position)
+
+            self._tokens.append(tokens)
+            self._facets.append({
+                "provider_name": game.get("provider_name"),
+                "engine_type": game.get("engine_type"),
+                "volatility": game.get("volatility"),
+                "rtp_band": rtp_band(game.get("rtp_percentage")),
+            })
+
+    def _match_term(self, term: str) -> set[int]:
+        positions = self._postings.get(term[:MAX_PREFIX_LENGTH], set())
+        if len(term) <= MAX_PREFIX_LENGTH:
+            return positions
+        return {
+            p for p in positions
+            if any(token.startswith(term) for token in self._tokens[p])
+        }
+
+    def search(self, q: str | None = None, filters: dict | None = None, limit: int = 20):
+        candidates = None
+        for term in tokenize(q):
+            matched = self._match_term(term)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = set(range(len(self.games)))
+
+        filters = {k: v for k, v in (filters or {}).items() if v}
+        if filters:
+            candidates = {
+                p for p in candidates
+                if all(self._facets[p][field] == value for field, value in filters.items())
+            }
+
+        facets = {field: Counter() for field in FACET_FIELDS}
+        for p in candidates:
+            for field in FACET_FIELDS:
+                value = self._facets[p][field]
+                if value is not None:
+                    facets[field][value] += 1
+
+        # Snapshot rows are already ordered by name
+        ordered = sorted(candidates)
+        return {
+            "items": [self.games[p] for p in ordered[:limit]],
+            "total": len(ordered),
+            "facets": {field: dict(counts) for field, counts in facets.items()},
+        }
+
+
+class GameSearchService:
+
+    @staticmethod
+    def search_catalog(
+        db: Session,
+        q: str | None = None,
+        tenant_id=None,
+        provider_id=None,
+        engine_type: str | None = None,
+        volatility: str | None = None,
+        rtp_range: str | None = None,
+        limit: int = 20
+    ):
+        """
+        Search active games in the global catalog (marketplace).
+
+        Prefix terms go through the GIN tsvector index on name + code;
+        substring matches on the name go through the pg_trgm index. Facet
+        counts for provider, engine, volatility and RTP band come from a
+        single GROUPING SETS query over the same filtered set.
+        """
+        band = _rtp_band_expr(Game.rtp_percentage)
+
+        filters = [Game.status == GameStatusEnum.ACTIVE]
+        if provider_id:
+            filters.append(Game.provider_id == provider_id)
+        if engine_type:
+            filters.append(Game.engine_type == engine_type)
+        if volatility:
+            filters.append(Game.volatility == volatility.lower())
+        if rtp_range:
+            filters.append(band == rtp_range)
+
+        terms = tokenize(q)
+        rank = None
+        if terms:
+            ts_query = func.to_tsquery(
+                literal_column("'simple'"),
+                " & ".join(f"{term}:*" for term in terms)
+            )
+            substring = f"%{_like_escape(q.strip())}%"
+            filters.append(or_(
+                GAME_SEARCH_VECTOR.op("@@")(ts_query),
+                Game.game_name.ilike(substring, escape="\\"),
+                GameProvider.provider_name.ilike(substring, escape="\\"),
+            ))
+            rank = func.ts_rank(GAME_SEARCH_VECTOR, ts_query)
+
+        columns = [
+            Game.game_id,
+            Game.game_name,
+            Game.game_code,
+            GameProvider.provider_name,
+            Game.engine_type,
+            Game.volatility,
+            Game.rtp_percentage,
+            Game.min_bet,
+            Game.max_bet,
+        ]
+        query = db.query(*columns).join(GameProvider, GameProvider.provider_id == Game.provider_id)
+
+        if tenant_id:
+            query = query.add_columns(TenantGame.game_id.isnot(None).label("is_enabled")).outerjoin(
+                TenantGame,
+                and_(
+                    TenantGame.game_id == Game.game_id,
+                    TenantGame.tenant_id == tenant_id,
+                    TenantGame.is_active == True
+                )
+            )
+
+        query = query.filter(*filters)
+        order = [Game.game_name, Game.game_id] if rank is None else [rank.desc(), Game.game_name, Game.game_id]
+        rows = query.order_by(*order).limit(limit).all()
+
+        facet_rows = (
+            db.query(
+                GameProvider.provider_name,
+                Game.engine_type,
+                Game.volatility,
+                band,
+                func.grouping(GameProvider.provider_name),
+                func.grouping(Game.engine_type),
+                func.grouping(Game.volatility),
+                func.grouping(band),
+                func.count(),
+            )
+            .join(GameProvider, GameProvider.provider_id == Game.provider_id)
+            .filter(*filters)
+            .group_by(func.grouping_sets(
+                tuple_(GameProvider.provider_name),
+                tuple_(Game.engine_type),
+                tuple_(Game.volatility),
+                tuple_(band),
+            ))
+            .all()
+        )
+
+        facets = {field: {} for field in FACET_FIELDS}
+        total = 0
+        for provider, engine, vol, rtp, g_provider, g_engine, g_vol, g_rtp, count in facet_rows:
+            # grouping() == 0 marks the column this grouping set is keyed on
+            if g_provider == 0:
+                facets["provider_name"][provider] = count
+                total += count
+            elif g_engine == 0:
+                facets["engine_type"][engine] = count
+            elif g_vol == 0 and vol is not None:
+                facets["volatility"][vol] = count
+            elif g_rtp == 0:
+                facets["rtp_band"][rtp] = count
+
+        return {
+            "items": [
+                {
+                    "game_id": row.game_id,
+                    "game_name": row.game_name,
+                    "game_code": row.game_code,
+                    "provider_name": row.provider_name,
+                    "engine_type": row.engine_type,
+                    "volatility": row.volatility,
+                    "rtp_percentage": float(row.rtp_percentage) if row.rtp_percentage is not None else None,
+                    "min_bet": float(row.min_bet) if row.min_bet is not None else None,
+                    "max_bet": float(row.max_bet) if row.max_bet is not None else None,
+                    **({"is_enabled": row.is_enabled} if tenant_id else {}),
+                }
+                for row in rows
+            ],
+            "total": total,
+            "facets": facets,
+        }
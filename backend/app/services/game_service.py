@@ -3,9 +3,11 @@ from fastapi import HTTPException, status
 from datetime import datetime, timezone
 import uuid
 
+from app.game_engines.registry import EngineConfigError, UnknownEngineError, engine_registry
 from app.models.game import Game, GameStatusEnum
 from app.models.game_provider import GameProvider
 from app.models.game_category import GameCategory
+from app.services.lobby_service import LobbyService
 
 
 class GameService:
@@ -43,6 +45,20 @@ class GameService:
                 detail="Game code already exists"
             )
 
+        # Validate the engine config once here; play time only reuses the compiled engine
+        try:
+            engine_config = engine_registry.validate_config(payload.engine_type, payload.engine_config)
+        except UnknownEngineError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported engine type '{payload.engine_type}'"
+            )
+        except EngineConfigError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"message": "Invalid engine config", "errors": e.errors}
+            )
+
         # Create game with Engine Configuration
         game = Game(
             provider_id=provider_id,
@@ -56,7 +72,7 @@ class GameService:
 
             # Engine Fields
             engine_type=payload.engine_type,
-            engine_config=payload.engine_config,
+            engine_config=engine_config,
 
             status=GameStatusEnum.PENDING,
             created_at=datetime.now(timezone.utc),
@@ -89,6 +105,7 @@ class GameService:
 
         db.commit()
         db.refresh(game)
+        LobbyService.invalidate()
         return game
 
     @staticmethod
@@ -110,6 +127,7 @@ class GameService:
 
         db.commit()
         db.refresh(game)
+        LobbyService.invalidate()
         return game
 
     @staticmethod
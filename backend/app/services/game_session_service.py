@@ -0,0 +1,140 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import update, text, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Session
+
+from app.models.game_session import GameSession
+
+
+# Closing is one statement: the targeted sessions are ended and their
+# played time is added to SESSION limits and player stats, aggregated per
+# player. {target} selects (and locks) session ids; {ended_at} is the
+# end time written for each.
+_CLOSE_SESSIONS_SQL = """
+    WITH target AS (
+        {target}
+    ),
+    closed AS (
+        UPDATE game_sessions AS s
+        SET status = :status, ended_at = {ended_at}
+        FROM target
+        WHERE s.session_id = target.session_id
+        RETURNING s.player_id, s.tenant_id,
+                  greatest(coalesce(extract(epoch FROM s.ended_at - s.started_at), 0), 0) AS seconds
+    ),
+    limits AS (
+        UPDATE player_limits AS l
+        SET current_usage = CASE WHEN l.period_start + interval '1 day' < :now THEN 0 ELSE coalesce(l.current_usage, 0) END
+                            + round(played.seconds / 60.0, 2),
+            period_start = CASE WHEN l.period_start + interval '1 day' < :now THEN :now ELSE l.period_start END,
+            updated_at = :now
+        FROM (SELECT player_id, tenant_id, sum(seconds) AS seconds FROM closed GROUP BY player_id, tenant_id) played
+        WHERE l.player_id = played.player_id AND l.tenant_id = played.tenant_id
+          AND l.limit_type = 'SESSION' AND l.period = 'DAILY' AND l.status = 'ACTIVE'
+    ),
+    stats AS (
+        UPDATE player_stats_summary AS p
+        SET total_play_time_seconds = coalesce(p.total_play_time_seconds, 0) + floor(played.seconds)::int,
+            updated_at = :now
+        FROM (SELECT player_id, sum(seconds) AS seconds FROM closed GROUP BY player_id) played
+        WHERE p.player_id = played.player_id
+    )
+    SELECT count(*) FROM closed
+"""
+
+_END_SESSIONS_SQL = text(_CLOSE_SESSIONS_SQL.format(
+    target="""
+        SELECT session_id FROM game_sessions
+        WHERE session_id = ANY(:session_ids) AND status = 'active'
+        FOR UPDATE
+    """,
+    ended_at=":now",
+)).bindparams(bindparam("session_ids", type_=ARRAY(UUID(as_uuid=True))))
+
+# Idle sessions end at their last bet, so time spent away is not counted
+_CLOSE_IDLE_SQL = text(_CLOSE_SESSIONS_SQL.format(
+    target="""
+        SELECT session_id FROM game_sessions
+        WHERE status = 'active' AND last_activity_at < :cutoff
+        ORDER BY last_activity_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    """,
+    ended_at="s.last_activity_at",
+))
+
+
+class GameSessionService:
+    """
+    Game session lifecycle.
+
+    Every bet bumps the session's round counter and last_activity_at in the
+    same UPDATE, so activity tracking adds no query. Played time is
+    accounted to SESSION limits and player stats only when a session
+    closes: on /end-session, when a session limit is hit, or when the
+    session reaper finds it idle.
+    """
+
+    # ─────────────────────────────
+    # Round numbering
+    # ─────────────────────────────
+    @staticmethod
+    def reserve_round_numbers(db: Session, session_ids: list[uuid.UUID], count: int = 1) -> dict[uuid.UUID, int]:
+        """
+        Claim `count` consecutive round numbers in each session with one
+        UPDATE ... RETURNING on its counter; returns session_id -> first
+        number. The row lock serialises concurrent bets on a session, so
+        numbers are gap-free and never repeat. Sessions that are no longer
+        active (e.g. the reaper expired one while this waited on its lock)
+        are left out; callers open a new session for those. Does not commit.
+        """
+        rows = db.execute(
+            update(GameSession)
+            .where(GameSession.session_id.in_(session_ids), GameSession.status == "active")
+            .values(round_count=GameSession.round_count + count, last_activity_at=datetime.now())
+            .returning(GameSession.session_id, GameSession.round_count)
+            .execution_options(synchronize_session=False)
+        ).all()
+        return {row.session_id: row.round_count - count + 1 for row in rows}
+
+    @staticmethod
+    def next_round_number(db: Session, session_id: uuid.UUID) -> int | None:
+        """The session's next round number, or None once it is no longer active."""
+        return GameSessionService.reserve_round_numbers(db, [session_id]).get(session_id)
+
+    # ─────────────────────────────
+    # Time played
+    # ─────────────────────────────
+    @staticmethod
+    def elapsed_minutes(session: GameSession, now: datetime | None = None) -> float:
+        if not session.started_at:
+            return 0.0
+        return max((now or datetime.now()) - session.started_at, timedelta(0)).total_seconds() / 60.0
+
+    # ─────────────────────────────
+    # Closing
+    # ─────────────────────────────
+    @staticmethod
+    def end_sessions(db: Session, session_ids: list[uuid.UUID], status: str = "completed",
+                     now: datetime | None = None) -> int:
+        """End active sessions now and account their time. Returns how many were ended; does not commit."""
+        return db.execute(_END_SESSIONS_SQL, {
+            "session_ids": list(session_ids),
+            "status": status,
+            "now": now or datetime.now(),
+        }).scalar()
+
+    @staticmethod
+    def close_idle(db: Session, idle_seconds: float, limit: int = 1000, now: datetime | None = None) -> int:
+        """Expire up to `limit` sessions with no bet for `idle_seconds`. Commits; returns how many closed."""
+        now = now or datetime.now()
+        closed = db.execute(_CLOSE_IDLE_SQL, {
+            "cutoff": now - timedelta(seconds=idle_seconds),
+            "limit": limit,
+            "status": "expired",
+            "now": now,
+        }).scalar()
+        db.commit()
+        return closed
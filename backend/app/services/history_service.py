@@ -1,17 +1,27 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
+from datetime import datetime, timedelta
+import json
 import uuid
 
+from app.core.config import settings
+
 from app.models.game_round import GameRound
 from app.models.game_session import GameSession
 from app.models.game import Game
 from app.models.wallet_transaction import WalletTransaction
+from app.game_engines.result_codec import read_result
+from app.services.archive_service import ArchiveService
 
 
 class HistoryService:
 
     @staticmethod
-    def get_player_dashboard(db: Session, player_id: uuid.UUID, game_name: str = None, status: str = None, limit: int = 50):
+    def get_player_dashboard(db: Session, player_id: uuid.UUID, game_name: str = None, status: str = None, limit: int = 50,
+                             days: int | None = None):
+        # Bounded look-back: every query below only touches the partitions in the window
+        since = datetime.utcnow() - timedelta(days=days or settings.history_window_days)
+
         stats = (
             db.query(
                 func.sum(GameRound.bet_amount).label("total_wagered"),
@@ -19,7 +29,7 @@ class HistoryService:
                 func.max(GameRound.win_amount).label("biggest_hit"),
             )
             .join(GameSession, GameRound.session_id == GameSession.session_id)
-            .filter(GameSession.player_id == player_id)
+            .filter(GameSession.player_id == player_id, GameRound.started_at >= since)
             .first()
         )
 
@@ -30,13 +40,17 @@ class HistoryService:
                 GameRound.bet_amount,
                 GameRound.win_amount,
                 GameRound.result_data,
+                GameRound.result_blob,
                 GameRound.started_at,
                 WalletTransaction.balance_after,
             )
             .join(GameSession, GameRound.session_id == GameSession.session_id)
             .join(Game, GameSession.game_id == Game.game_id)
-            .outerjoin(WalletTransaction, WalletTransaction.reference_id == GameRound.round_id)
-            .filter(GameSession.player_id == player_id)
+            .outerjoin(
+                WalletTransaction,
+                (WalletTransaction.reference_id == GameRound.round_id) & (WalletTransaction.created_at >= since)
+            )
+            .filter(GameSession.player_id == player_id, GameRound.started_at >= since)
         )
         if game_name and game_name != 'all':
             query = query.filter(Game.game_name == game_name)
@@ -48,23 +62,80 @@ class HistoryService:
 
         history_results = query.order_by(desc(GameRound.started_at)).limit(limit).all()
 
-        return {
-            "summary": {
-                "wagered": float(stats.total_wagered or 0),
-                "won": float(stats.total_won or 0),
-                "max_win": float(stats.biggest_hit or 0),
-                "profit": float((stats.total_won or 0) - (stats.total_wagered or 0)),
-            },
-            "history": [
+        summary = {
+            "wagered": stats.total_wagered or 0,
+            "won": stats.total_won or 0,
+            "max_win": stats.biggest_hit or 0,
+        }
+        history = [
+            (
+                row.started_at,
                 {
                     "round_id": str(row.round_id),
                     "game_name": row.game_name,
                     "bet_amount": float(row.bet_amount or 0),
                     "win_amount": float(row.win_amount or 0),
-                    "result_data": row.result_data,
+                    # An open interactive round's checkpoint holds its mine layout / crash point
+                    "result_data": {"status": "OPEN"} if (row.result_data or {}).get("status") == "OPEN" else read_result(row.result_data, row.result_blob),
                     "date": row.started_at.isoformat() if row.started_at else None,
                     "balance_after": float(row.balance_after) if row.balance_after is not None else None,
-                }
-                for row in history_results
-            ],
+                },
+            )
+            for row in history_results
+        ]
+
+        # Windows reaching past the hot retention fall through to the Parquet archive
+        if settings.archive_after_days > 0 and since < datetime.utcnow() - timedelta(days=settings.archive_after_days):
+            HistoryService._add_archived(db, player_id, since, game_name, status, summary, history)
+
+        history.sort(key=lambda item: item[0] or datetime.min, reverse=True)
+        return {
+            "since": since.isoformat(),
+            "summary": {
+                "wagered": float(summary["wagered"]),
+                "won": float(summary["won"]),
+                "max_win": float(summary["max_win"]),
+                "profit": float(summary["won"] - summary["wagered"]),
+            },
+            "history": [entry for _, entry in history[:limit]],
         }
+
+    @staticmethod
+    def _add_archived(db: Session, player_id: uuid.UUID, since: datetime, game_name: str | None, status: str | None,
+                      summary: dict, history: list):
+        rounds = ArchiveService.player_rounds(player_id, since=since)
+        if not rounds:
+            return
+        # A round whose delete has not committed yet is in both places
+        seen = {entry["round_id"] for _, entry in history}
+        game_names = dict(
+            db.query(Game.game_id, Game.game_name)
+            .filter(Game.game_id.in_({uuid.UUID(r["game_id"]) for r in rounds}))
+            .all()
+        )
+
+        for r in rounds:
+            if r["round_id"] in seen:
+                continue
+            bet_amount, win_amount = r["bet_amount"] or 0, r["win_amount"] or 0
+            summary["wagered"] += bet_amount
+            summary["won"] += win_amount
+            summary["max_win"] = max(summary["max_win"], win_amount)
+
+            name = game_names.get(uuid.UUID(r["game_id"]))
+            if game_name and game_name != 'all' and name != game_name:
+                continue
+            if (status == 'wins' and win_amount <= 0) or (status == 'losses' and win_amount > 0):
+                continue
+            history.append((
+                r["started_at"],
+                {
+                    "round_id": r["round_id"],
+                    "game_name": name,
+                    "bet_amount": float(bet_amount),
+                    "win_amount": float(win_amount),
+                    "result_data": json.loads(r["result"]),
+                    "date": r["started_at"].isoformat() if r["started_at"] else None,
+                    "balance_after": float(r["balance_after"]) if r["balance_after"] is not None else None,
+                },
+            ))
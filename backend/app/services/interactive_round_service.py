@@ -0,0 +1,434 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+from sqlalchemy import update
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.game_engines.crash_engine import CrashEngine
+from app.game_engines.registry import engine_registry
+from app.models.bet import Bet
+from app.models.game import Game
+from app.models.game_round import GameRound
+from app.models.game_session import GameSession
+from app.services.bonus_service import BonusService
+from app.services.fairness_service import FairnessService
+from app.services.gameplay_service import GameplayService, OpenRound
+from app.services.jackpot_service import JackpotService
+from app.services.responsible_gaming_service import ResponsibleGamingService
+from app.services.round_state_store import RoundState, RoundStateStore
+from app.services.wallet_service import WalletService
+
+
+# engine_type -> interactive kind
+INTERACTIVE_ENGINES = {
+    "mines": "mines", "mines_engine": "mines",
+    "crash": "crash", "crash_engine": "crash",
+}
+
+# A resolved crash round is left to its player this long before the reaper settles it
+CRASH_SETTLE_GRACE_SECONDS = 5.0
+
+
+class StaleRoundError(HTTPException):
+    """The cached state is behind the round's checkpoint (another server moved it)."""
+
+    def __init__(self):
+        super().__init__(status_code=409, detail="Round changed on another server; reload it")
+
+
+class InteractiveRoundService:
+    """
+    Multi-step rounds whose outcome is committed server-side at start.
+
+    start()   places the bet and draws the mine layout / crash point from
+              the player's fair seed, checkpointed in result_data.
+    reveal()  opens one Mines cell; a mine settles the round as a loss.
+    cashout() settles at the current Mines or Crash multiplier.
+
+    Steps work on the in-memory RoundState (one dict lookup, a per-round
+    lock) and persist with a single conditional UPDATE on the round row;
+    game, session and wallet rows are only read again at settlement.
+    """
+
+    _store = RoundStateStore(ttl_seconds=settings.interactive_round_ttl_seconds)
+
+    # ─────────────────────────────
+    # Start
+    # ─────────────────────────────
+    @staticmethod
+    def start(
+        db: Session,
+        player_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        game_id: uuid.UUID,
+        bet_amount: float,
+        opt_in: bool = False,
+        auto_cashout: float | None = None
+    ):
+        try:
+            # Bonus wagering counts at settlement: a VOID round must not count at all
+            opened = GameplayService.open_round(
+                db, player_id, tenant_id, game_id, bet_amount, opt_in, count_wagering=False
+            )
+
+            kind = INTERACTIVE_ENGINES.get(opened.game.engine_type)
+            if kind is None:
+                raise HTTPException(status_code=400, detail="Game does not support interactive rounds")
+
+            rng, fairness = FairnessService.reserve_rounds(db, player_id)[0]
+            engine = GameplayService.get_engine(opened.game, rng)
+
+            progress = {"revealed": []} if kind == "mines" else {"auto_cashout": auto_cashout}
+            state = RoundState(
+                round_id=opened.round.round_id,
+                player_id=player_id,
+                tenant_id=tenant_id,
+                game_id=game_id,
+                engine_type=kind,
+                config=opened.game.engine_config or {},
+                bet_amount=bet_amount,
+                game_stake=opened.game_stake,
+                opt_in=opt_in,
+                secret=engine.initial_state(),
+                progress=progress,
+                fairness=fairness,
+                started_at=time.time(),
+            )
+            opened.round.result_data = state.checkpoint()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise e
+
+        InteractiveRoundService._store.put(state)
+        return {**InteractiveRoundService._view(state), "balance": float(opened.wallet.balance)}
+
+    # ─────────────────────────────
+    # Steps
+    # ─────────────────────────────
+    @staticmethod
+    def reveal(db: Session, player_id: uuid.UUID, round_id: uuid.UUID, cell: int):
+        return InteractiveRoundService._step(
+            db, player_id, round_id, lambda state: InteractiveRoundService._reveal(db, state, cell)
+        )
+
+    @staticmethod
+    def _reveal(db: Session, state: RoundState, cell: int):
+        if state.engine_type != "mines":
+            raise HTTPException(status_code=400, detail="Only Mines rounds have cells to reveal")
+
+        InteractiveRoundService._ensure_open(state)
+        engine = engine_registry.engine("mines", state.config)
+        grid_size = engine.params.grid_size
+        revealed = state.progress["revealed"]
+
+        if not 0 <= cell < grid_size:
+            raise HTTPException(status_code=400, detail=f"Cell must be between 0 and {grid_size - 1}")
+        if cell in revealed:
+            raise HTTPException(status_code=400, detail="Cell already revealed")
+
+        if cell in state.secret["layout"]:
+            return InteractiveRoundService._settle(db, state, engine, hit=cell)
+
+        revealed.append(cell)
+        if len(revealed) == grid_size - len(state.secret["layout"]):
+            # Every safe cell found: nothing left to risk
+            return InteractiveRoundService._settle(db, state, engine)
+
+        InteractiveRoundService._checkpoint(db, state)
+        return InteractiveRoundService._view(state, engine)
+
+    @staticmethod
+    def cashout(db: Session, player_id: uuid.UUID, round_id: uuid.UUID):
+        return InteractiveRoundService._step(
+            db, player_id, round_id, lambda state: InteractiveRoundService._cashout(db, state)
+        )
+
+    @staticmethod
+    def _cashout(db: Session, state: RoundState):
+        InteractiveRoundService._ensure_open(state)
+        engine = engine_registry.engine(state.engine_type, state.config)
+        if state.engine_type == "mines" and not state.progress["revealed"]:
+            raise HTTPException(status_code=400, detail="Reveal at least one cell before cashing out")
+        return InteractiveRoundService._settle(db, state, engine)
+
+    @staticmethod
+    def get_state(db: Session, player_id: uuid.UUID, round_id: uuid.UUID):
+        return InteractiveRoundService._step(
+            db, player_id, round_id, lambda state: InteractiveRoundService._get_state(db, state)
+        )
+
+    @staticmethod
+    def _get_state(db: Session, state: RoundState):
+        InteractiveRoundService._ensure_open(state)
+        engine = engine_registry.engine(state.engine_type, state.config)
+        # A crash round that already busted (or hit its auto cash-out) settles on sight
+        if state.engine_type == "crash" and InteractiveRoundService._crash_resolved(state, engine):
+            return InteractiveRoundService._settle(db, state, engine)
+        return InteractiveRoundService._view(state, engine)
+
+    # ─────────────────────────────
+    # Abandoned rounds (reaper)
+    # ─────────────────────────────
+    @staticmethod
+    def open_round_ids(db: Session, limit: int = 500) -> list:
+        """Open interactive rounds, oldest first (partial index ix_game_rounds_open)."""
+        rows = db.query(GameRound.round_id).filter(
+            GameRound.ended_at.is_(None),
+            GameRound.result_data["status"].astext == "OPEN",
+            # Shared crash table rounds are recovered by CrashTableService
+            ~GameRound.result_data.has_key("table_round_id")
+        ).order_by(GameRound.started_at).limit(limit).all()
+        return [row.round_id for row in rows]
+
+    @staticmethod
+    def settle_if_abandoned(db: Session, round_id: uuid.UUID, now: float | None = None):
+        """
+        Settle a round nobody is driving any more: Mines after
+        interactive_round_ttl_seconds idle (cashed out at its revealed cells,
+        VOID with the whole bet returned when none), Crash once its outcome
+        is decided.
+        Returns the settlement, or None when the round is still live.
+        """
+        now = now or time.time()
+        state = InteractiveRoundService._load(db, round_id)
+
+        with state.lock:
+            if state.step < 0:
+                return None
+            engine = engine_registry.engine(state.engine_type, state.config)
+
+            if state.engine_type == "crash":
+                due = (
+                    InteractiveRoundService._crash_resolved(state, engine, now)
+                    and now - state.updated_at >= CRASH_SETTLE_GRACE_SECONDS
+                ) or now - state.updated_at >= settings.interactive_round_ttl_seconds
+            else:
+                due = now - state.updated_at >= settings.interactive_round_ttl_seconds
+
+            if not due:
+                return None
+            return InteractiveRoundService._settle(db, state, engine, now=now, abandoned=True)
+
+    # ─────────────────────────────
+    # Internals
+    # ─────────────────────────────
+    @staticmethod
+    def _load(db: Session, round_id: uuid.UUID, player_id: uuid.UUID | None = None) -> RoundState:
+        state = InteractiveRoundService._store.get(round_id)
+
+        if state is None:
+            # Cache miss (restart, other worker, evicted): rebuild from the checkpoint
+            row = db.query(GameRound.bet_amount, GameRound.result_data, Game.engine_config).join(
+                GameSession, GameSession.session_id == GameRound.session_id
+            ).join(
+                Game, Game.game_id == GameSession.game_id
+            ).filter(
+                GameRound.round_id == round_id,
+                GameRound.ended_at.is_(None)
+            ).first()
+            db.rollback()  # don't hold the read transaction between steps
+
+            if not row or (row.result_data or {}).get("status") != "OPEN":
+                raise HTTPException(status_code=404, detail="Open round not found")
+
+            state = RoundState.from_checkpoint(
+                round_id, float(row.bet_amount), row.engine_config or {}, row.result_data
+            )
+            InteractiveRoundService._store.put(state)
+
+        if player_id is not None and state.player_id != player_id:
+            raise HTTPException(status_code=404, detail="Open round not found")
+        return state
+
+    @staticmethod
+    def _step(db: Session, player_id: uuid.UUID, round_id: uuid.UUID, step):
+        """
+        Run step(state) under the round's lock. When the cached state turns
+        out stale, the step is retried once on the checkpointed state so the
+        player's click is not lost to another server having moved the round.
+        """
+        for attempt in range(2):
+            state = InteractiveRoundService._load(db, round_id, player_id)
+            with state.lock:
+                try:
+                    return step(state)
+                except StaleRoundError:
+                    if attempt:
+                        raise
+
+    @staticmethod
+    def _ensure_open(state: RoundState):
+        if state.step < 0:
+            raise HTTPException(status_code=409, detail="Round already settled")
+
+    @staticmethod
+    def _stale(state: RoundState):
+        # The next _load rebuilds the state from the checkpoint
+        InteractiveRoundService._store.discard(state.round_id)
+        raise StaleRoundError()
+
+    @staticmethod
+    def _started_after(state: RoundState) -> datetime:
+        """Lower bound on the round's started_at / placed_at (UTC) so lookups prune to its partition."""
+        return datetime.utcfromtimestamp(state.started_at) - timedelta(hours=1)
+
+    @staticmethod
+    def _checkpoint(db: Session, state: RoundState):
+        """Persist the step only if nobody else moved the round since we read it."""
+        expected = state.step
+        state.step += 1
+        state.updated_at = time.time()
+
+        result = db.execute(
+            update(GameRound).where(
+                GameRound.round_id == state.round_id,
+                GameRound.started_at >= InteractiveRoundService._started_after(state),
+                GameRound.ended_at.is_(None),
+                GameRound.result_data["step"].as_integer() == expected
+            ).values(
+                result_data=state.checkpoint()
+            ).execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            db.rollback()
+            InteractiveRoundService._stale(state)
+        db.commit()
+
+    @staticmethod
+    def _crash_resolved(state: RoundState, engine: CrashEngine, now: float | None = None) -> bool:
+        current = engine.multiplier_at((now or time.time()) - state.started_at)
+        auto = state.progress.get("auto_cashout")
+        return current >= state.secret["crash_at"] or (auto is not None and current >= auto)
+
+    @staticmethod
+    def _outcome(state: RoundState, engine, hit: int | None, now: float, abandoned: bool) -> dict:
+        """engine.run()-shaped result for the round as it stands."""
+        if state.engine_type == "mines":
+            revealed = state.progress["revealed"]
+            picks = len(revealed)
+            multiplier = engine.multiplier_for(picks) if picks and hit is None else 0.0
+            result_data = {
+                "picks": picks,
+                "mines": len(state.secret["layout"]),
+                "layout": state.secret["layout"],
+                "revealed": revealed,
+                "hit": hit,
+            }
+
+            if abandoned and not picks:
+                # Walked away without revealing anything: the round is void and
+                # the whole bet goes back (the jackpot split is reversed in _settle)
+                return {
+                    "result_data": {**result_data, "message": "Abandoned"},
+                    "outcome": "VOID",
+                    "win_amount": state.bet_amount,
+                }
+            outcome = "WIN" if multiplier else "LOSE"
+        else:
+            crash_at = state.secret["crash_at"]
+            auto = state.progress.get("auto_cashout")
+            current = engine.multiplier_at(now - state.started_at)
+
+            if auto is not None and auto <= crash_at and current >= auto:
+                multiplier = auto
+            elif current < crash_at and not abandoned:
+                multiplier = current
+            else:
+                multiplier = 0.0
+            result_data = {"crash_at": crash_at, "cashed_out": multiplier or None, "auto_cashout": auto}
+            outcome = "WIN" if multiplier else "LOSE"
+
+        return {
+            "result_data": {**result_data, "multiplier": round(multiplier, 2)},
+            "outcome": outcome,
+            "win_amount": round(state.game_stake * multiplier, 2),
+        }
+
+    @staticmethod
+    def _settle(db: Session, state: RoundState, engine, hit: int | None = None,
+                now: float | None = None, abandoned: bool = False):
+        result = InteractiveRoundService._outcome(state, engine, hit, now or time.time(), abandoned)
+        result["result_data"] = {**result["result_data"], "interactive": True, "fairness": state.fairness}
+
+        try:
+            started_after = InteractiveRoundService._started_after(state)
+            round_obj = db.query(GameRound).filter(
+                GameRound.round_id == state.round_id,
+                GameRound.started_at >= started_after,
+                GameRound.ended_at.is_(None)
+            ).with_for_update().first()
+            if round_obj is None or (round_obj.result_data or {}).get("step") != state.step:
+                db.rollback()
+                InteractiveRoundService._stale(state)
+
+            game = db.get(Game, state.game_id)
+            opened = OpenRound(
+                game=game,
+                wallet=WalletService.get_wallet(db, state.player_id, "CASH", state.tenant_id),
+                session=None,
+                round=round_obj,
+                bet=db.query(Bet).filter(Bet.round_id == state.round_id, Bet.placed_at >= started_after).one(),
+                player_id=state.player_id,
+                tenant_id=state.tenant_id,
+                bet_amount=state.bet_amount,
+                game_stake=state.game_stake,
+                opt_in=state.opt_in,
+            )
+            if result["outcome"] == "VOID":
+                # The whole bet goes back, so it never counted as a wager
+                if state.opt_in:
+                    JackpotService.reverse_contributions(db, [opened.bet.bet_id])
+                ResponsibleGamingService.release_usage(
+                    db, state.player_id, state.tenant_id, "WAGER", state.bet_amount, since=state.started_at
+                )
+            else:
+                BonusService.apply_wagering(
+                    db, player_id=state.player_id, bet_amount=state.game_stake, tenant_id=state.tenant_id
+                )
+
+            # The stake was checked against the loss limit when the round opened;
+            # a VOID refunds the full bet, so it records no loss usage either
+            response = GameplayService.settle_round(db, opened, result, enforce_loss_limit=False)
+        except Exception as e:
+            db.rollback()
+            raise e
+
+        state.step = -1
+        InteractiveRoundService._store.discard(state.round_id)
+        return {**response, "status": "SETTLED"}
+
+    @staticmethod
+    def _view(state: RoundState, engine=None) -> dict:
+        engine = engine or engine_registry.engine(state.engine_type, state.config)
+        view = {
+            "round_id": state.round_id,
+            "engine_type": state.engine_type,
+            "status": "OPEN",
+            "step": state.step,
+            "bet_amount": state.bet_amount,
+        }
+
+        if state.engine_type == "mines":
+            picks = len(state.progress["revealed"])
+            safe_cells = engine.params.grid_size - len(state.secret["layout"])
+            view.update({
+                "grid_size": engine.params.grid_size,
+                "mine_count": len(state.secret["layout"]),
+                "revealed": state.progress["revealed"],
+                "multiplier": round(engine.multiplier_for(picks), 2) if picks else 0.0,
+                "next_multiplier": round(engine.multiplier_for(picks + 1), 2) if picks < safe_cells else None,
+            })
+        else:
+            now = time.time()
+            view.update({
+                "started_at": state.started_at,
+                "server_time": now,
+                "growth_rate": engine.params.growth_rate,
+                "multiplier": engine.multiplier_at(now - state.started_at),
+                "auto_cashout": state.progress.get("auto_cashout"),
+            })
+        return view
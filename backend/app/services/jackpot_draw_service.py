@@ -0,0 +1,110 @@
+import hashlib
+import hmac
+import secrets
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, literal
+
+from app.models.jackpot_contribution import JackpotContribution
+from app.models.wallet import Wallet
+
+
+SELECTION_UNIFORM = "UNIFORM"
+SELECTION_WEIGHTED = "WEIGHTED"
+
+# 2^64: the draw fraction comes from the first 8 bytes of the HMAC
+_FRACTION_SCALE = Decimal(2 ** 64)
+
+
+def new_draw_seed() -> str:
+    return secrets.token_hex(32)
+
+
+def draw_fraction(seed: str, jackpot_id) -> Decimal:
+    """
+    Uniform fraction in [0, 1) derived from the stored seed.
+
+    Anyone holding the seed and the jackpot id can recompute it, and with
+    the recorded contribution window re-run the selection query to audit a draw.
+    """
+    digest = hmac.new(bytes.fromhex(seed), str(jackpot_id).encode(), hashlib.sha256).digest()
+    return Decimal(int.from_bytes(digest[:8], "big")) / _FRACTION_SCALE
+
+
+class JackpotDrawService:
+    """
+    Winner selection executed inside PostgreSQL.
+
+    The population is never loaded into Python: uniform draws skip to a
+    seeded offset in the ordered distinct-player set, weighted draws walk a
+    running SUM of per-player contributions until it passes a seeded point.
+    Both are single statements, so the count and the pick see the same
+    snapshot.
+    """
+
+    @staticmethod
+    def _pick_uniform(db: Session, population, fraction: Decimal):
+        size = select(func.count()).select_from(population).scalar_subquery()
+
+        row = db.execute(
+            select(population.c.player_id, size.label("population_size"))
+            .order_by(population.c.player_id)
+            .offset(func.floor(literal(fraction) * size))
+            .limit(1)
+        ).first()
+
+        return (row.player_id, row.population_size) if row else (None, 0)
+
+    @staticmethod
+    def pick_casino_player(db: Session, tenant_id, fraction: Decimal):
+        """Uniform over every player holding an active wallet in the casino (FIXED jackpots)."""
+        population = select(Wallet.player_id).where(
+            Wallet.tenant_id == tenant_id,
+            Wallet.is_active == True
+        ).distinct().subquery()
+
+        return JackpotDrawService._pick_uniform(db, population, fraction)
+
+    @staticmethod
+    def pick_contributor(db: Session, jackpot_id, fraction: Decimal, mode: str = SELECTION_UNIFORM,
+                         since: datetime | None = None, until: datetime | None = None):
+        """
+        Uniform: every distinct contributor has the same chance.
+        Weighted: chance proportional to the player's total contribution.
+
+        Only contributions with contributed_at in (since, until] count: the
+        current cycle of a recurring pool, up to the draw's watermark.
+        """
+        window = [JackpotContribution.jackpot_id == jackpot_id]
+        if since is not None:
+            window.append(JackpotContribution.contributed_at > since)
+        if until is not None:
+            window.append(JackpotContribution.contributed_at <= until)
+
+        weights = select(
+            JackpotContribution.player_id,
+            func.sum(JackpotContribution.amount).label("weight")
+        ).where(*window).group_by(JackpotContribution.player_id).subquery()
+
+        if mode == SELECTION_WEIGHTED:
+            total = select(func.sum(weights.c.weight)).scalar_subquery()
+            size = select(func.count()).select_from(weights).scalar_subquery()
+            cumulative = select(
+                weights.c.player_id,
+                func.sum(weights.c.weight).over(order_by=weights.c.player_id).label("cumulative")
+            ).subquery()
+
+            row = db.execute(
+                select(cumulative.c.player_id, size.label("population_size"))
+                .where(cumulative.c.cumulative > literal(fraction) * total)
+                .order_by(cumulative.c.player_id)
+                .limit(1)
+            ).first()
+
+            if row:
+                return row.player_id, row.population_size
+            # Only zero-weight contributors: fall back to an even draw
+
+        return JackpotDrawService._pick_uniform(db, weights, fraction)
@@ -0,0 +1,180 @@
+from decimal import Decimal
+import uuid
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, text, bindparam
+from sqlalchemy.dialects.postgresql import insert, ARRAY, UUID
+
+from app.models.jackpot import Jackpot
+from app.models.jackpot_pool_shard import JackpotPoolShard
+
+
+# More shards = less lock contention between concurrent opted-in bets,
+# at the cost of a slightly wider SUM when the pool is displayed.
+JACKPOT_POOL_SHARDS = 16
+
+# Pools that still pay out. Deltas buffered for a COMPLETED jackpot (bets
+# that read the cached active progressive just before its final draw) are
+# never applied; JackpotService.refund_late_contributions returns them.
+LIVE_STATUSES = ("ACTIVE", "PAUSED")
+
+# Zeroes locked shard rows; {apply} turns the drained totals into the result.
+# Callers must already hold the jackpot row locks (see flush).
+_TAKE_SHARDS_SQL = """
+    WITH locked AS (
+        SELECT jackpot_id, shard_no, pending_amount
+        FROM jackpot_pool_shards
+        WHERE jackpot_id = ANY(:jackpot_ids) AND pending_amount <> 0
+        FOR UPDATE
+    ),
+    drained AS (
+        UPDATE jackpot_pool_shards AS s
+        SET pending_amount = s.pending_amount - locked.pending_amount,
+            updated_at = now()
+        FROM locked
+        WHERE s.jackpot_id = locked.jackpot_id AND s.shard_no = locked.shard_no
+        RETURNING locked.jackpot_id, locked.pending_amount
+    ),
+    totals AS (
+        SELECT jackpot_id, SUM(pending_amount) AS amount
+        FROM drained
+        GROUP BY jackpot_id
+    )
+    {apply}
+"""
+
+# Drains the shards and adds their totals to jackpots.current_amount in one statement
+_DRAIN_SHARDS_SQL = text(_TAKE_SHARDS_SQL.format(apply="""
+    UPDATE jackpots AS j
+    SET current_amount = j.current_amount + totals.amount,
+        updated_at = now()
+    FROM totals
+    WHERE j.jackpot_id = totals.jackpot_id
+    RETURNING j.jackpot_id, totals.amount
+""")).bindparams(bindparam("jackpot_ids", type_=ARRAY(UUID(as_uuid=True))))
+
+# Drains the shards without touching the jackpots
+_DISCARD_SHARDS_SQL = text(_TAKE_SHARDS_SQL.format(
+    apply="SELECT jackpot_id, amount FROM totals"
+)).bindparams(bindparam("jackpot_ids", type_=ARRAY(UUID(as_uuid=True))))
+
+
+class JackpotPoolAccumulator:
+
+    # ─────────────────────────────
+    # Write path (per bet)
+    # ─────────────────────────────
+    @staticmethod
+    def add(db: Session, jackpot_id: uuid.UUID, amount: Decimal, shard_key: uuid.UUID | None = None):
+        """
+        Buffer a contribution on one shard; commits with the caller's
+        transaction. A negative amount takes a reversed contribution back out.
+        """
+        if not amount:
+            return
+
+        shard_key = shard_key or uuid.uuid4()
+        stmt = insert(JackpotPoolShard).values(
+            jackpot_id=jackpot_id,
+            shard_no=shard_key.int % JACKPOT_POOL_SHARDS,
+            pending_amount=amount,
+        ).on_conflict_do_update(
+            index_elements=["jackpot_id", "shard_no"],
+            set_={
+                "pending_amount": JackpotPoolShard.pending_amount + amount,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    # ─────────────────────────────
+    # Read path (display)
+    # ─────────────────────────────
+    @staticmethod
+    def pending_totals(db: Session, jackpot_ids) -> dict:
+        jackpot_ids = list(jackpot_ids)
+        if not jackpot_ids:
+            return {}
+
+        rows = db.query(
+            JackpotPoolShard.jackpot_id,
+            func.sum(JackpotPoolShard.pending_amount)
+        ).filter(
+            JackpotPoolShard.jackpot_id.in_(jackpot_ids)
+        ).group_by(JackpotPoolShard.jackpot_id).all()
+
+        return {jackpot_id: total or Decimal("0") for jackpot_id, total in rows}
+
+    @staticmethod
+    def display_amounts(db: Session, jackpots) -> dict:
+        """Applied pool plus the deltas still waiting in shards, per jackpot id."""
+        pending = JackpotPoolAccumulator.pending_totals(db, [j.jackpot_id for j in jackpots])
+        return {
+            j.jackpot_id: (j.current_amount or Decimal("0")) + pending.get(j.jackpot_id, Decimal("0"))
+            for j in jackpots
+        }
+
+    # ─────────────────────────────
+    # Flush (periodic / before draw)
+    # ─────────────────────────────
+    @staticmethod
+    def flush(db: Session, jackpot_ids=None) -> dict:
+        """
+        Move pending shard totals of live (ACTIVE / PAUSED) jackpots into
+        jackpots.current_amount; other jackpots' deltas stay in their shards.
+
+        Jackpot rows are locked first (in id order) and shard rows second,
+        the same order draw_winner uses, so a flush and a draw never
+        deadlock. The status is checked under the lock, so a draw that
+        completes a pool meanwhile keeps its deltas out. Does not commit.
+        """
+        if jackpot_ids is None:
+            jackpot_ids = JackpotPoolAccumulator.pending_jackpot_ids(db, LIVE_STATUSES)
+        jackpot_ids = JackpotPoolAccumulator.lock_jackpots(db, jackpot_ids, LIVE_STATUSES)
+        if not jackpot_ids:
+            return {}
+
+        rows = db.execute(_DRAIN_SHARDS_SQL, {"jackpot_ids": jackpot_ids}).all()
+
+        # Keep ORM instances already loaded in this session in sync
+        for jackpot_id, _ in rows:
+            jackpot = db.get(Jackpot, jackpot_id)
+            if jackpot is not None:
+                db.refresh(jackpot)
+
+        return {jackpot_id: amount for jackpot_id, amount in rows}
+
+    @staticmethod
+    def discard(db: Session, jackpot_ids) -> dict:
+        """
+        Zero the pending shard totals of jackpots without applying them;
+        returns the amounts taken, per jackpot. Caller holds the jackpot
+        locks (lock_jackpots). Does not commit.
+        """
+        if not jackpot_ids:
+            return {}
+        rows = db.execute(_DISCARD_SHARDS_SQL, {"jackpot_ids": list(jackpot_ids)}).all()
+        return {jackpot_id: amount for jackpot_id, amount in rows}
+
+    # ─────────────────────────────
+    # Helpers
+    # ─────────────────────────────
+    @staticmethod
+    def pending_jackpot_ids(db: Session, statuses=None, exclude: bool = False) -> list:
+        """Jackpots with undrained shard deltas, optionally by status (or all but `statuses`)."""
+        query = db.query(JackpotPoolShard.jackpot_id).filter(JackpotPoolShard.pending_amount != 0)
+        if statuses is not None:
+            status = Jackpot.status.notin_(statuses) if exclude else Jackpot.status.in_(statuses)
+            query = query.join(Jackpot, Jackpot.jackpot_id == JackpotPoolShard.jackpot_id).filter(status)
+        return [row[0] for row in query.distinct().all()]
+
+    @staticmethod
+    def lock_jackpots(db: Session, jackpot_ids, statuses, exclude: bool = False) -> list:
+        """Lock the jackpot rows in id order; returns the ids whose status (now final) matches."""
+        jackpot_ids = sorted(set(jackpot_ids), key=str)
+        if not jackpot_ids:
+            return []
+        rows = db.query(Jackpot.jackpot_id, Jackpot.status).filter(
+            Jackpot.jackpot_id.in_(jackpot_ids)
+        ).order_by(Jackpot.jackpot_id).with_for_update().all()
+        return [jackpot_id for jackpot_id, status in rows if (status in statuses) != exclude]
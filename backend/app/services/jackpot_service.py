@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import func, update, or_, tuple_
 from decimal import Decimal
 from app.models.jackpot import Jackpot
 from app.models.player import Player
@@ -6,19 +7,59 @@ from app.models.user import User
 from app.models.bet import Bet
 from app.models.jackpot_win import JackpotWin
 from app.models.jackpot_contribution import JackpotContribution as ContributionModel
+from app.core.cache import TTLCache
 from app.services.wallet_service import WalletService
+from app.services.jackpot_pool_accumulator import JackpotPoolAccumulator, LIVE_STATUSES
+from app.services.jackpot_ticker import JackpotTicker
+from app.services.jackpot_draw_service import (
+    JackpotDrawService,
+    SELECTION_UNIFORM,
+    new_draw_seed,
+    draw_fraction,
+)
 from fastapi import HTTPException
-from datetime import datetime
+from datetime import datetime, timedelta
+import calendar
+import logging
 import uuid
-import random
 
 from app.schemas.jackpot import JackpotCreate
 from app.models.wallet import Wallet
 from app.models.wallet_type import WalletType
 
 
+logger = logging.getLogger(__name__)
+
+RECURRING_CYCLES = ("DAILY", "WEEKLY", "MONTHLY")
+
+
+def next_cycle_deadline(deadline: datetime, reset_cycle: str, now: datetime) -> datetime:
+    """First deadline of the recurring cycle that lies after `now`."""
+    while deadline <= now:
+        if reset_cycle == "MONTHLY":
+            year = deadline.year + deadline.month // 12
+            month = deadline.month % 12 + 1
+            day = min(deadline.day, calendar.monthrange(year, month)[1])
+            deadline = deadline.replace(year=year, month=month, day=day)
+        else:
+            deadline += timedelta(days=1 if reset_cycle == "DAILY" else 7)
+    return deadline
+
+
+# Short, since a stale entry on another worker routes contributions to a
+# jackpot that was just drawn there.
+ACTIVE_PROGRESSIVE_TTL_SECONDS = 10
+
+# A failing scheduled draw is retried after 1, 2, 4, 8 minutes, then the
+# jackpot is PAUSED for an operator instead of failing on every pass
+DRAW_RETRY_BASE_SECONDS = 60
+MAX_DRAW_FAILURES = 5
+
+
 class JackpotService:
 
+    _active_progressive = TTLCache(ttl_seconds=ACTIVE_PROGRESSIVE_TTL_SECONDS)
+
     @staticmethod
     def create_jackpot(db: Session, tenant_id: uuid.UUID, payload: JackpotCreate):
         new_jackpot = Jackpot(
@@ -32,13 +73,28 @@ class JackpotService:
             deadline=payload.deadline,
             contribution_percentage=payload.contribution_percentage,
             opt_in_required=payload.opt_in_required,
+            winner_selection=payload.winner_selection,
             status="ACTIVE"
         )
         db.add(new_jackpot)
         db.commit()
         db.refresh(new_jackpot)
+
+        JackpotService.invalidate_active_progressive(tenant_id)
         return new_jackpot
 
+    @staticmethod
+    def with_live_pools(db: Session, jackpots):
+        """Serialize jackpots with current_amount including unflushed shard deltas."""
+        amounts = JackpotPoolAccumulator.display_amounts(db, jackpots)
+        return [
+            {
+                **{c.key: getattr(j, c.key) for c in Jackpot.__table__.columns},
+                "current_amount": amounts[j.jackpot_id],
+            }
+            for j in jackpots
+        ]
+
     @staticmethod
     def contribute_to_sponsored(
         db: Session,
@@ -55,12 +111,30 @@ class JackpotService:
         if jackpot.jackpot_type != "SPONSORED" or jackpot.status != "ACTIVE":
             raise HTTPException(400, "This jackpot is not open for contributions")
         
+        # Rejected from the plain read above; no row lock is taken for late attempts
         now_local = datetime.now()
-        if now_local > jackpot.deadline:
+        if jackpot.deadline and now_local > jackpot.deadline:
             raise HTTPException(400, "The deadline for this jackpot has passed")
 
         amount_dec = Decimal(str(amount))
 
+        # Guarded increment: a draw or deadline that landed since the read makes this a no-op
+        new_pool_total = db.execute(
+            update(Jackpot)
+            .where(
+                Jackpot.jackpot_id == jackpot_id,
+                Jackpot.status == "ACTIVE",
+                or_(Jackpot.deadline.is_(None), Jackpot.deadline >= now_local)
+            )
+            .values(current_amount=Jackpot.current_amount + amount_dec)
+            .returning(Jackpot.current_amount)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+
+        if new_pool_total is None:
+            db.rollback()
+            raise HTTPException(400, "This jackpot is not open for contributions")
+
         wallet = WalletService.get_wallet(db, player_id, "CASH", tenant_id)
         
         WalletService.apply_transaction(
@@ -78,45 +152,55 @@ class JackpotService:
             amount=amount_dec
         )
         db.add(contribution)
-
-        jackpot.current_amount += amount_dec
         
         db.commit()
         return {
             "message": "Contribution successful",
-            "new_pool_total": float(jackpot.current_amount)
+            "new_pool_total": float(new_pool_total)
         }
 
     @staticmethod
     def draw_winner(db: Session, jackpot_id: uuid.UUID):
-        jackpot = db.query(Jackpot).filter(Jackpot.jackpot_id == jackpot_id).first()
+        # Lock first, then fold in pending shard contributions so the payout is exact
+        jackpot = db.query(Jackpot).filter(Jackpot.jackpot_id == jackpot_id).with_for_update().first()
         
-        if not jackpot or jackpot.status != "ACTIVE":
+        # PAUSED: the scheduler gave up after repeated failures; an operator's manual draw resumes it
+        if not jackpot or jackpot.status not in ("ACTIVE", "PAUSED"):
             raise HTTPException(status_code=400, detail="Jackpot is not active or not found")
 
+        JackpotPoolAccumulator.flush(db, [jackpot_id])
+
         winner_id = None
         win_amount = jackpot.current_amount
-        
+        contributions_from = contributions_until = None
+
+        # Recorded on the win so the draw can be re-derived and audited
+        draw_seed = new_draw_seed()
+        fraction = draw_fraction(draw_seed, jackpot_id)
+        selection_mode = SELECTION_UNIFORM
+
         if jackpot.jackpot_type == "FIXED":
-            players_in_casino = db.query(Wallet.player_id).filter(
-                Wallet.tenant_id == jackpot.tenant_id,
-                Wallet.is_active == True
-            ).distinct().all()
+            winner_id, population_size = JackpotDrawService.pick_casino_player(
+                db, jackpot.tenant_id, fraction
+            )
 
-            if not players_in_casino:
+            if not winner_id:
                 raise HTTPException(status_code=404, detail="No players found.")
             
-            winner_id = random.choice(players_in_casino)[0]
-            
         elif jackpot.jackpot_type in ["SPONSORED", "PROGRESSIVE"]:
-            contributors = db.query(ContributionModel.player_id).filter(
-                ContributionModel.jackpot_id == jackpot_id
-            ).distinct().all()
+            selection_mode = jackpot.winner_selection or SELECTION_UNIFORM
+            # This cycle's contributions: after the previous draw's watermark, up to now (DB clock,
+            # the one contributed_at is stamped with)
+            contributions_from = db.query(func.max(JackpotWin.contributions_until)).filter(
+                JackpotWin.jackpot_id == jackpot_id
+            ).scalar()
+            contributions_until = db.query(func.localtimestamp()).scalar()
+            winner_id, population_size = JackpotDrawService.pick_contributor(
+                db, jackpot_id, fraction, selection_mode, since=contributions_from, until=contributions_until
+            )
             
-            if not contributors:
+            if not winner_id:
                 raise HTTPException(status_code=404, detail="No contributors found.")
-            
-            winner_id = random.choice(contributors)[0]
 
         if winner_id:
             try:
@@ -124,7 +208,12 @@ class JackpotService:
                     jackpot_id=jackpot_id,
                     player_id=winner_id,
                     win_amount=win_amount,
-                    won_at=datetime.now()
+                    won_at=datetime.now(),
+                    draw_seed=draw_seed,
+                    selection_mode=selection_mode,
+                    population_size=population_size,
+                    contributions_from=contributions_from,
+                    contributions_until=contributions_until
                 )
                 db.add(new_win)
 
@@ -139,16 +228,30 @@ class JackpotService:
                 )
 
                 jackpot.last_won_at = datetime.now()
-                
-                if jackpot.jackpot_type == "PROGRESSIVE":
+                jackpot.draw_failures = 0
+                jackpot.next_draw_at = None
+
+                if jackpot.jackpot_type == "SPONSORED" or jackpot.reset_cycle == "NEVER":
                     jackpot.status = "COMPLETED"
-                elif jackpot.jackpot_type == "SPONSORED" or jackpot.reset_cycle == "NEVER":
+                elif jackpot.jackpot_type == "PROGRESSIVE" and jackpot.reset_cycle not in RECURRING_CYCLES:
                     jackpot.status = "COMPLETED"
                 else:
+                    # Recurring pools start the next cycle from their seed; contributions
+                    # after this draw's watermark already count towards it
                     jackpot.current_amount = jackpot.seed_amount
                     jackpot.status = "ACTIVE"
+                    if jackpot.deadline and jackpot.reset_cycle in RECURRING_CYCLES:
+                        jackpot.deadline = next_cycle_deadline(jackpot.deadline, jackpot.reset_cycle, datetime.now())
 
+                JackpotTicker.notify_win(db, jackpot.tenant_id, {
+                    "jackpot_id": str(jackpot_id),
+                    "jackpot_name": jackpot.jackpot_name,
+                    "win_amount": float(win_amount),
+                    "won_at": new_win.won_at,
+                })
                 db.commit()
+
+                JackpotService.invalidate_active_progressive(jackpot.tenant_id)
                 return {"winner_id": str(winner_id), "amount": float(win_amount)}
 
             except Exception:
@@ -157,6 +260,127 @@ class JackpotService:
 
         raise HTTPException(status_code=404, detail="Winner selection criteria not met")
 
+    # ─────────────────────────────
+    # Scheduled draws (deadline reached)
+    # ─────────────────────────────
+    @staticmethod
+    def due_jackpots(db: Session, now: datetime, after=None, limit: int = 100):
+        """
+        (deadline, jackpot_id) of ACTIVE jackpots past their deadline, across
+        all tenants, skipping those backing off after a failed draw.
+        """
+        query = db.query(Jackpot.deadline, Jackpot.jackpot_id).filter(
+            Jackpot.status == "ACTIVE",
+            Jackpot.deadline <= now,
+            or_(Jackpot.next_draw_at.is_(None), Jackpot.next_draw_at <= now)
+        )
+        if after is not None:
+            query = query.filter(tuple_(Jackpot.deadline, Jackpot.jackpot_id) > tuple_(*after))
+
+        return [tuple(row) for row in query.order_by(Jackpot.deadline, Jackpot.jackpot_id).limit(limit).all()]
+
+    @staticmethod
+    def run_scheduled_draw(db: Session, jackpot_id: uuid.UUID, now: datetime):
+        """
+        Draw and pay one due jackpot. Pools nobody can win are closed, or
+        moved to their next cycle when recurring. Returns None when another
+        scheduler already holds the row or the jackpot is no longer due.
+        """
+        claimed = db.query(Jackpot.jackpot_id).filter(
+            Jackpot.jackpot_id == jackpot_id,
+            Jackpot.status == "ACTIVE",
+            Jackpot.deadline <= now
+        ).with_for_update(skip_locked=True).first()
+
+        if not claimed:
+            db.rollback()
+            return None
+
+        try:
+            return JackpotService.draw_winner(db, jackpot_id)
+        except HTTPException as e:
+            db.rollback()
+            if e.status_code != 404:
+                JackpotService._record_draw_failure(db, jackpot_id, now)
+                raise
+        except Exception:
+            db.rollback()
+            JackpotService._record_draw_failure(db, jackpot_id, now)
+            raise
+
+        return JackpotService._expire_without_winner(db, jackpot_id, now)
+
+    @staticmethod
+    def _record_draw_failure(db: Session, jackpot_id: uuid.UUID, now: datetime):
+        """Back the jackpot off exponentially; pause it after MAX_DRAW_FAILURES in a row."""
+        jackpot = db.query(Jackpot).filter(
+            Jackpot.jackpot_id == jackpot_id,
+            Jackpot.status == "ACTIVE"
+        ).with_for_update().first()
+        if not jackpot:
+            db.rollback()
+            return
+
+        jackpot.draw_failures = (jackpot.draw_failures or 0) + 1
+        if jackpot.draw_failures >= MAX_DRAW_FAILURES:
+            jackpot.status = "PAUSED"
+            jackpot.next_draw_at = None
+        else:
+            jackpot.next_draw_at = now + timedelta(seconds=DRAW_RETRY_BASE_SECONDS * 2 ** (jackpot.draw_failures - 1))
+        db.commit()
+        JackpotService.invalidate_active_progressive(jackpot.tenant_id)
+
+    @staticmethod
+    def _expire_without_winner(db: Session, jackpot_id: uuid.UUID, now: datetime):
+        jackpot = db.query(Jackpot).filter(
+            Jackpot.jackpot_id == jackpot_id,
+            Jackpot.status == "ACTIVE"
+        ).with_for_update(skip_locked=True).first()
+
+        if not jackpot:
+            db.rollback()
+            return None
+
+        if jackpot.jackpot_type in ("FIXED", "PROGRESSIVE") and jackpot.reset_cycle in RECURRING_CYCLES:
+            # Nobody to draw this cycle: a progressive keeps its pool for the next one
+            jackpot.deadline = next_cycle_deadline(jackpot.deadline, jackpot.reset_cycle, now)
+        else:
+            jackpot.status = "COMPLETED"
+
+        JackpotTicker.notify_pools_changed(db, [jackpot_id])
+        db.commit()
+        JackpotService.invalidate_active_progressive(jackpot.tenant_id)
+        return {"jackpot_id": str(jackpot_id), "status": jackpot.status, "deadline": jackpot.deadline}
+
+    # ─────────────────────────────
+    # Active progressive lookup (cached)
+    # ─────────────────────────────
+    @staticmethod
+    def get_active_progressive(db: Session, tenant_id: uuid.UUID):
+        """
+        (jackpot_id, contribution_percentage, deadline) of the tenant's active
+        progressive, or None. Only create_jackpot / draw_winner change the answer, and both
+        invalidate; the TTL bounds staleness on other API workers.
+        """
+        cached = JackpotService._active_progressive.get(tenant_id)
+        if cached is not None:
+            return cached or None
+
+        row = db.query(Jackpot.jackpot_id, Jackpot.contribution_percentage, Jackpot.deadline).filter(
+            Jackpot.tenant_id == tenant_id,
+            Jackpot.jackpot_type == 'PROGRESSIVE',
+            Jackpot.status == 'ACTIVE'
+        ).order_by(Jackpot.created_at).first()
+
+        # An empty tuple caches "no active progressive" as well
+        value = (row.jackpot_id, Decimal(str(row.contribution_percentage or 0)), row.deadline) if row else ()
+        JackpotService._active_progressive.set(tenant_id, value)
+        return value or None
+
+    @staticmethod
+    def invalidate_active_progressive(tenant_id: uuid.UUID):
+        JackpotService._active_progressive.pop(tenant_id)
+
     @staticmethod
     def process_progressive_bet(
         db: Session,
@@ -165,29 +389,146 @@ class JackpotService:
         total_bet: float,
         bet_id: uuid.UUID
     ):
-        jackpot = db.query(Jackpot).filter(
-            Jackpot.tenant_id == tenant_id,
-            Jackpot.jackpot_type == 'PROGRESSIVE',
-            Jackpot.status == 'ACTIVE'
-        ).first()
+        return JackpotService.process_progressive_bets(
+            db, player_id, tenant_id, [(bet_id, total_bet)]
+        )[0]
 
-        if not jackpot:
-            return float(total_bet)
+    @staticmethod
+    def process_progressive_bets(
+        db: Session,
+        player_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        bets: list
+    ) -> list[float]:
+        """
+        Split several opted-in bets of one player into jackpot contribution
+        and game stake. `bets` is a list of (bet_id, total_bet); returns the
+        game stakes in the same order. One shard upsert covers the whole batch.
+        """
+        if not bets:
+            return []
 
-        total_dec = Decimal(str(total_bet))
-        percent_dec = Decimal(str(jackpot.contribution_percentage or 0))
-        
-        contrib_amount = total_dec * (percent_dec / Decimal("100"))
-        game_stake = total_dec - contrib_amount
+        active = JackpotService.get_active_progressive(db, tenant_id)
 
-        jackpot.current_amount += contrib_amount
+        # Past its deadline the pool only waits for the scheduler's draw
+        if not active or (active[2] and datetime.now() > active[2]):
+            return [float(total_bet) for _, total_bet in bets]
 
-        contribution = ContributionModel(
-            jackpot_id=jackpot.jackpot_id,
-            player_id=player_id,
-            amount=contrib_amount,
-            bet_id=bet_id
-        )
-        db.add(contribution)
+        jackpot_id, percent_dec, _ = active
+
+        stakes = []
+        contributions = []
+        batch_total = Decimal("0")
+
+        for bet_id, total_bet in bets:
+            total_dec = Decimal(str(total_bet))
+            contrib_amount = (total_dec * (percent_dec / Decimal("100"))).quantize(Decimal("0.01"))
+
+            stakes.append(float(total_dec - contrib_amount))
+            batch_total += contrib_amount
+            contributions.append(ContributionModel(
+                jackpot_id=jackpot_id,
+                player_id=player_id,
+                amount=contrib_amount,
+                bet_id=bet_id
+            ))
+
+        # Buffered on a shard; the jackpots row is only touched by the flusher
+        JackpotPoolAccumulator.add(db, jackpot_id, batch_total, shard_key=bets[0][0])
+        db.add_all(contributions)
+
+        return stakes
+
+    @staticmethod
+    def reverse_contributions(db: Session, bet_ids: list) -> Decimal:
+        """
+        Undo the jackpot split of voided bets: their contribution rows leave
+        the draw population and, while the pool they fed has not been drawn
+        since, the amount comes back out of it. Returns the amount reversed.
+        Does not commit.
+        """
+        # Newest draw watermark per jackpot: contributions up to it were already paid out
+        watermarks = db.query(
+            JackpotWin.jackpot_id,
+            func.max(JackpotWin.contributions_until).label("until")
+        ).group_by(JackpotWin.jackpot_id).subquery()
+
+        rows = db.query(ContributionModel, Jackpot.status, watermarks.c.until).join(
+            Jackpot, Jackpot.jackpot_id == ContributionModel.jackpot_id
+        ).outerjoin(
+            watermarks, watermarks.c.jackpot_id == ContributionModel.jackpot_id
+        ).filter(ContributionModel.bet_id.in_(bet_ids)).all()
+
+        reversed_total = Decimal("0")
+        for contribution, status, drawn_until in rows:
+            # Already paid out by a draw: the pool it was in no longer exists
+            if status in LIVE_STATUSES and (drawn_until is None or contribution.contributed_at > drawn_until):
+                JackpotPoolAccumulator.add(
+                    db, contribution.jackpot_id, -contribution.amount, shard_key=contribution.bet_id
+                )
+                reversed_total += contribution.amount
+            db.delete(contribution)
+
+        return reversed_total
+
+    @staticmethod
+    def refund_late_contributions(db: Session) -> dict:
+        """
+        Return contributions that reached a pool after it closed for good.
+
+        Bets read the active progressive from a short-lived cache, so a few
+        can still split a contribution off after the final draw. The flusher
+        leaves those shard deltas alone; here they are zeroed and every
+        contribution newer than the pool's closing watermark (the last
+        draw's, else when the jackpot was closed) is credited back to its
+        player and leaves the draw records. Returns jackpot_id -> amount
+        refunded. Does not commit.
+        """
+        jackpot_ids = JackpotPoolAccumulator.pending_jackpot_ids(db, LIVE_STATUSES, exclude=True)
+        jackpot_ids = JackpotPoolAccumulator.lock_jackpots(db, jackpot_ids, LIVE_STATUSES, exclude=True)
+        if not jackpot_ids:
+            return {}
+
+        discarded = JackpotPoolAccumulator.discard(db, jackpot_ids)
 
-        return float(game_stake)
\ No newline at end of file
+        watermarks = db.query(
+            JackpotWin.jackpot_id,
+            func.max(JackpotWin.contributions_until).label("until")
+        ).filter(JackpotWin.jackpot_id.in_(jackpot_ids)).group_by(JackpotWin.jackpot_id).subquery()
+
+        late = db.query(ContributionModel, Jackpot.tenant_id).join(
+            Jackpot, Jackpot.jackpot_id == ContributionModel.jackpot_id
+        ).outerjoin(
+            watermarks, watermarks.c.jackpot_id == ContributionModel.jackpot_id
+        ).filter(
+            ContributionModel.jackpot_id.in_(jackpot_ids),
+            ContributionModel.bet_id.isnot(None),
+            ContributionModel.contributed_at > func.coalesce(watermarks.c.until, Jackpot.updated_at)
+        ).all()
+
+        owed = {}
+        for contribution, tenant_id in late:
+            key = (contribution.jackpot_id, contribution.player_id, tenant_id)
+            owed[key] = owed.get(key, Decimal("0")) + contribution.amount
+            db.delete(contribution)
+
+        refunded = {}
+        for (jackpot_id, player_id, tenant_id), amount in sorted(owed.items(), key=lambda item: str(item[0][1])):
+            wallet = WalletService.get_wallet(db, player_id, "CASH", tenant_id)
+            WalletService.apply_transaction(
+                db=db,
+                wallet=wallet,
+                amount=float(amount),
+                txn_code="jackpot_refund",
+                ref_type="jackpot",
+                ref_id=jackpot_id
+            )
+            refunded[jackpot_id] = refunded.get(jackpot_id, Decimal("0")) + amount
+
+        for jackpot_id, amount in discarded.items():
+            if refunded.get(jackpot_id, Decimal("0")) != amount:
+                logger.warning(
+                    "Jackpot %s: discarded %s of late deltas but refunded %s",
+                    jackpot_id, amount, refunded.get(jackpot_id, Decimal("0"))
+                )
+        return refunded
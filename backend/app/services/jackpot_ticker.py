@@ -0,0 +1,245 @@
+import asyncio
+import json
+import logging
+import uuid
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal, engine
+from app.models.jackpot import Jackpot
+from app.services.jackpot_pool_accumulator import JackpotPoolAccumulator
+
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel carrying {"tenant_id": ..., "win": {...}?} between processes
+JACKPOT_EVENTS_CHANNEL = "jackpot_events"
+# A tenant's pools are re-read at most this often, however many notifications arrive
+JACKPOT_REFRESH_MIN_SECONDS = 0.5
+# ... and at least this often, for edits that send no notification (new or paused jackpots)
+JACKPOT_RESYNC_SECONDS = 30
+# Delay before reconnecting a dropped LISTEN connection
+JACKPOT_LISTEN_RETRY_SECONDS = 5
+# Comment frames keep idle connections alive through proxies
+JACKPOT_STREAM_HEARTBEAT_SECONDS = 15
+# Per-client backlog; a client that falls this far behind loses its oldest frames
+SUBSCRIBER_QUEUE_SIZE = 32
+
+# One notification per tenant owning any of the jackpots; delivered on commit
+_NOTIFY_POOLS_SQL = text(f"""
+    SELECT pg_notify('{JACKPOT_EVENTS_CHANNEL}', json_build_object('tenant_id', tenant_id)::text)
+    FROM (SELECT DISTINCT tenant_id FROM jackpots WHERE jackpot_id = ANY(:jackpot_ids)) owners
+""").bindparams(bindparam("jackpot_ids", type_=ARRAY(UUID(as_uuid=True))))
+
+
+def format_event(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str, separators=(',', ':'))}\n\n"
+
+
+class _TenantChannel:
+    __slots__ = ("tenant_id", "subscribers", "task", "last_pools", "dirty")
+
+    def __init__(self, tenant_id):
+        self.tenant_id = tenant_id
+        self.subscribers: set[asyncio.Queue] = set()
+        self.task: asyncio.Task | None = None
+        self.last_pools: str | None = None
+        self.dirty = asyncio.Event()
+        self.dirty.set()
+
+
+class JackpotTicker:
+    """
+    Per-tenant fan-out of live jackpot pools and wins.
+
+    Nothing polls: the pool flusher and jackpot draws NOTIFY on
+    jackpot_events in the transaction that changes a pool, and each API
+    process holds one LISTEN connection (open only while someone
+    listens). A notification marks the tenant's channel dirty; its
+    refresher re-reads the pools once and pushes a coalesced frame to
+    every subscriber queue. Win frames travel in the notification, so
+    every process announces every draw. The LISTEN connection opens with
+    the process's first subscriber and stays for its lifetime.
+    """
+
+    _channels: dict = {}
+    _listener: asyncio.Task | None = None
+
+    # ─────────────────────────────
+    # Subscriptions
+    # ─────────────────────────────
+    @staticmethod
+    def subscribe(tenant_id) -> asyncio.Queue:
+        if JackpotTicker._listener is None or JackpotTicker._listener.done():
+            JackpotTicker._listener = asyncio.create_task(JackpotTicker._listen())
+
+        channel = JackpotTicker._channels.get(tenant_id)
+        if channel is None:
+            channel = JackpotTicker._channels[tenant_id] = _TenantChannel(tenant_id)
+
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        if channel.last_pools is not None:
+            queue.put_nowait(channel.last_pools)
+        channel.subscribers.add(queue)
+
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(JackpotTicker._refresh(channel))
+        return queue
+
+    @staticmethod
+    def unsubscribe(tenant_id, queue: asyncio.Queue):
+        channel = JackpotTicker._channels.get(tenant_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(queue)
+        if not channel.subscribers:
+            if channel.task:
+                channel.task.cancel()
+            JackpotTicker._channels.pop(tenant_id, None)
+
+    # ─────────────────────────────
+    # Publishing (any process, inside the changing transaction)
+    # ─────────────────────────────
+    @staticmethod
+    def notify_pools_changed(db: Session, jackpot_ids):
+        """Tell every process the pools of these jackpots' tenants changed. Sent when `db` commits."""
+        if jackpot_ids:
+            db.execute(_NOTIFY_POOLS_SQL, {"jackpot_ids": list(jackpot_ids)})
+
+    @staticmethod
+    def notify_win(db: Session, tenant_id, win: dict):
+        """Announce a win (and the pool change) to every process. Sent when `db` commits."""
+        payload = json.dumps({"tenant_id": str(tenant_id), "win": win}, default=str, separators=(",", ":"))
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {
+            "channel": JACKPOT_EVENTS_CHANNEL, "payload": payload,
+        })
+
+    @staticmethod
+    def _broadcast(channel: _TenantChannel, frame: str):
+        for queue in channel.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+    @staticmethod
+    def _dispatch(payload: str):
+        event = json.loads(payload)
+        channel = JackpotTicker._channels.get(uuid.UUID(event["tenant_id"]))
+        if channel is None:
+            return
+        if "win" in event:
+            JackpotTicker._broadcast(channel, format_event("win", event["win"]))
+        channel.dirty.set()
+
+    # ─────────────────────────────
+    # Listening
+    # ─────────────────────────────
+    @staticmethod
+    def _listen_connection():
+        """A dedicated autocommit psycopg2 connection, taken out of the pool, LISTENing on the channel."""
+        conn = engine.raw_connection()
+        dbapi = conn.driver_connection
+        conn.detach()
+        dbapi.autocommit = True
+        with dbapi.cursor() as cursor:
+            cursor.execute(f"LISTEN {JACKPOT_EVENTS_CHANNEL}")
+        return dbapi
+
+    @staticmethod
+    async def _listen():
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                conn = await asyncio.to_thread(JackpotTicker._listen_connection)
+            except Exception:
+                logger.exception("Jackpot ticker could not LISTEN; retrying")
+                await asyncio.sleep(JACKPOT_LISTEN_RETRY_SECONDS)
+                continue
+
+            # Anything sent while we were not listening was missed: re-read everyone
+            for channel in JackpotTicker._channels.values():
+                channel.dirty.set()
+
+            readable = asyncio.Event()
+            loop.add_reader(conn.fileno(), readable.set)
+            try:
+                while True:
+                    await readable.wait()
+                    readable.clear()
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        try:
+                            JackpotTicker._dispatch(notify.payload)
+                        except Exception:
+                            logger.exception("Bad jackpot notification %r", notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Jackpot ticker LISTEN connection lost; reconnecting")
+                await asyncio.sleep(JACKPOT_LISTEN_RETRY_SECONDS)
+            finally:
+                loop.remove_reader(conn.fileno())
+                conn.close()
+
+    # ─────────────────────────────
+    # Refreshing
+    # ─────────────────────────────
+    @staticmethod
+    def read_pools(tenant_id) -> list[dict]:
+        db = SessionLocal()
+        try:
+            jackpots = db.query(Jackpot).filter(
+                Jackpot.tenant_id == tenant_id,
+                Jackpot.status == "ACTIVE"
+            ).order_by(Jackpot.created_at).all()
+
+            amounts = JackpotPoolAccumulator.display_amounts(db, jackpots)
+            return [
+                {
+                    "jackpot_id": j.jackpot_id,
+                    "jackpot_name": j.jackpot_name,
+                    "jackpot_type": j.jackpot_type,
+                    "current_amount": float(amounts[j.jackpot_id]),
+                    "deadline": j.deadline,
+                }
+                for j in jackpots
+            ]
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _refresh(channel: _TenantChannel):
+        while channel.subscribers:
+            try:
+                await asyncio.wait_for(channel.dirty.wait(), timeout=JACKPOT_RESYNC_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            channel.dirty.clear()
+            try:
+                pools = await asyncio.to_thread(JackpotTicker.read_pools, channel.tenant_id)
+                frame = format_event("pools", pools)
+                if frame != channel.last_pools:
+                    channel.last_pools = frame
+                    JackpotTicker._broadcast(channel, frame)
+            except Exception:
+                logger.exception("Jackpot ticker refresh failed for tenant %s", channel.tenant_id)
+            await asyncio.sleep(JACKPOT_REFRESH_MIN_SECONDS)
+
+    # ─────────────────────────────
+    # SSE body
+    # ─────────────────────────────
+    @staticmethod
+    async def stream(tenant_id):
+        queue = JackpotTicker.subscribe(tenant_id)
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=JACKPOT_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    frame = ": keep-alive\n\n"
+                yield frame
+        finally:
+            JackpotTicker.unsubscribe(tenant_id, queue)
@@ -1,4 +1,7 @@
+from sqlalchemy import func
+
 from app.models.kyc_document import KYCDocument
+from app.models.user import User
 
 ROLE_REQUIREMENTS = {
     "TENANT_ADMIN": {"business_license", "identity_proof"},
@@ -6,38 +9,68 @@ ROLE_REQUIREMENTS = {
     "PLAYER": {"government_id", "proof_of_address"},
 }
 
+REJECTED_REASON = "One or more documents were rejected. Please re-upload."
 
-def recalculate_user_kyc_status(user, db):
+
+def derive_kyc_status(required_docs, status_map):
+    """
+    Pure status rule shared by the single and bulk recalculation paths.
+    Returns (kyc_status, kyc_rejection_reason).
+    """
+    if any(status_map.get(doc) == "rejected" for doc in required_docs):
+        return "rejected", REJECTED_REASON
+
+    if any(doc not in status_map for doc in required_docs):
+        return "pending", None
+
+    if any(status_map[doc] in ["submitted", "re-submitted"] for doc in required_docs):
+        return "submitted", None
+
+    if all(status_map[doc] == "verified" for doc in required_docs):
+        return "verified", None
+
+    return "submitted", None
+
+
+def _apply_status(user, status_map):
     required_docs = ROLE_REQUIREMENTS.get(user.role.role_name, set())
+    user.kyc_status, user.kyc_rejection_reason = derive_kyc_status(required_docs, status_map)
+
 
+def recalculate_user_kyc_status(user, db):
     active_docs = db.query(KYCDocument).filter(
         KYCDocument.user_id == user.user_id,
         KYCDocument.is_active == True
     ).all()
 
     status_map = {d.document_type: d.verification_status for d in active_docs}
+    _apply_status(user, status_map)
 
 
-    if any(status_map.get(doc) == "rejected" for doc in required_docs):
-        user.kyc_status = "rejected"
-        user.kyc_rejection_reason = "One or more documents were rejected. Please re-upload."
-        return
+def recalculate_kyc_status_bulk(user_ids, db):
+    """
+    Recompute kyc_status for many users at once.
 
-    if any(doc not in status_map for doc in required_docs):
-        user.kyc_status = "pending"
-        user.kyc_rejection_reason = None
-        return
+    One grouped query collects every user's active document statuses as a
+    {document_type: verification_status} map, and one query loads the users
+    (role is joined eagerly on User), instead of one query per user.
+    """
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return []
 
- 
-    if any(status_map[doc] in ["submitted", "re-submitted"] for doc in required_docs):
-        user.kyc_status = "submitted"
-        user.kyc_rejection_reason = None
-        return
+    rows = db.query(
+        KYCDocument.user_id,
+        func.jsonb_object_agg(KYCDocument.document_type, KYCDocument.verification_status)
+    ).filter(
+        KYCDocument.user_id.in_(user_ids),
+        KYCDocument.is_active == True
+    ).group_by(KYCDocument.user_id).all()
 
-    
-    if all(status_map[doc] == "verified" for doc in required_docs):
-        user.kyc_status = "verified"
-        user.kyc_rejection_reason = None
-    else:
-      
-        user.kyc_status = "submitted"
+    status_maps = {user_id: status_map for user_id, status_map in rows}
+
+    users = db.query(User).filter(User.user_id.in_(user_ids)).all()
+    for user in users:
+        _apply_status(user, status_maps.get(user.user_id, {}))
+
+    return users
@@ -0,0 +1,184 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import update, func, tuple_
+from fastapi import HTTPException
+import base64
+import uuid
+
+from app.models.user import User
+from app.models.role import Role
+from app.models.kyc_document import KYCDocument, REVIEW_QUEUE_STATUSES
+from app.services.kyc_engine import recalculate_kyc_status_bulk
+
+
+QUEUE_PAGE_MAX = 200
+
+
+class KYCReviewService:
+
+    # ─────────────────────────────
+    # Keyset cursor helpers
+    # ─────────────────────────────
+    @staticmethod
+    def _encode_cursor(uploaded_at: datetime, document_id: int) -> str:
+        raw = f"{uploaded_at.isoformat()}|{document_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            uploaded_at, document_id = raw.split("|")
+            return datetime.fromisoformat(uploaded_at), int(document_id)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # ─────────────────────────────
+    # Pending review queue
+    # ─────────────────────────────
+    @staticmethod
+    def get_pending_queue(
+        db: Session,
+        role_name: str | None = None,
+        status: str | None = None,
+        cursor: str | None = None,
+        limit: int = 50
+    ):
+        """
+        Oldest-first queue of active documents awaiting review.
+
+        Reads walk ix_kyc_documents_review_queue in (uploaded_at, document_id)
+        order and stop after `limit` rows; the next page starts strictly after
+        the last row returned, so deep pages cost the same as the first one.
+        """
+        limit = max(1, min(limit, QUEUE_PAGE_MAX))
+        statuses = [status] if status else list(REVIEW_QUEUE_STATUSES)
+
+        base_filters = [
+            KYCDocument.is_active == True,
+            KYCDocument.verification_status.in_(statuses),
+        ]
+        if role_name:
+            base_filters.append(Role.role_name == role_name.upper())
+
+        query = (
+            db.query(
+                KYCDocument.document_id,
+                KYCDocument.document_type,
+                KYCDocument.verification_status,
+                KYCDocument.version,
+                KYCDocument.uploaded_at,
+                User.user_id,
+                User.email,
+                User.first_name,
+                User.last_name,
+                Role.role_name,
+            )
+            .join(User, User.user_id == KYCDocument.user_id)
+            .join(Role, Role.role_id == User.role_id)
+            .filter(*base_filters)
+        )
+
+        if cursor:
+            after_uploaded_at, after_document_id = KYCReviewService._decode_cursor(cursor)
+            query = query.filter(
+                tuple_(KYCDocument.uploaded_at, KYCDocument.document_id)
+                > tuple_(after_uploaded_at, after_document_id)
+            )
+
+        rows = (
+            query.order_by(KYCDocument.uploaded_at, KYCDocument.document_id)
+            .limit(limit + 1)
+            .all()
+        )
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        counts_query = db.query(
+            KYCDocument.verification_status,
+            func.count(KYCDocument.document_id)
+        ).filter(
+            KYCDocument.is_active == True,
+            KYCDocument.verification_status.in_(REVIEW_QUEUE_STATUSES),
+        )
+        if role_name:
+            counts_query = (
+                counts_query
+                .join(User, User.user_id == KYCDocument.user_id)
+                .join(Role, Role.role_id == User.role_id)
+                .filter(Role.role_name == role_name.upper())
+            )
+        counts = dict(counts_query.group_by(KYCDocument.verification_status).all())
+
+        return {
+            "items": [
+                {
+                    "document_id": row.document_id,
+                    "document_type": row.document_type,
+                    "status": row.verification_status,
+                    "version": row.version,
+                    "submitted_at": row.uploaded_at.isoformat() if row.uploaded_at else None,
+                    "user_id": str(row.user_id),
+                    "email": row.email,
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "role_name": row.role_name,
+                }
+                for row in rows
+            ],
+            "next_cursor": (
+                KYCReviewService._encode_cursor(rows[-1].uploaded_at, rows[-1].document_id)
+                if has_more else None
+            ),
+            "counts": {s: counts.get(s, 0) for s in REVIEW_QUEUE_STATUSES},
+        }
+
+    # ─────────────────────────────
+    # Bulk verify / reject
+    # ─────────────────────────────
+    @staticmethod
+    def bulk_review(
+        db: Session,
+        reviewer_id: uuid.UUID,
+        document_ids: list[int],
+        status: str,
+        reason: str | None = None
+    ):
+        """
+        Verify or reject many active documents in one transaction.
+
+        Documents are updated with a single UPDATE ... RETURNING, and the
+        owners' kyc_status is recomputed once per affected user.
+        """
+        document_ids = list(set(document_ids))
+
+        updated = db.execute(
+            update(KYCDocument)
+            .where(
+                KYCDocument.document_id.in_(document_ids),
+                KYCDocument.is_active == True
+            )
+            .values(
+                verification_status=status,
+                rejection_reason=reason if status == "rejected" else None,
+                verified_by=reviewer_id,
+                verified_at=datetime.utcnow()
+            )
+            .returning(KYCDocument.document_id, KYCDocument.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        updated_ids = {row.document_id for row in updated}
+        affected_user_ids = {row.user_id for row in updated}
+
+        recalculate_kyc_status_bulk(affected_user_ids, db)
+
+        db.commit()
+
+        return {
+            "status": status,
+            "updated_count": len(updated_ids),
+            "affected_users": len(affected_user_ids),
+            "missing_document_ids": sorted(set(document_ids) - updated_ids),
+        }
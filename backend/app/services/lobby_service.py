@@ -1,11 +1,58 @@
+import hashlib
+import json
+from datetime import datetime
+
 from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.core.cache import TTLCache
 from app.models.tenant_game import TenantGame
 from app.models.game import Game
 from app.models.game_provider import GameProvider
+from app.models.wallet import Wallet
+from app.services.game_search_service import LobbySearchIndex
+
+
+# Safety net for multi-worker deployments: writes invalidate the local worker
+# immediately, other workers pick the change up within this window.
+LOBBY_SNAPSHOT_TTL_SECONDS = 60
+PROFILE_CACHE_TTL_SECONDS = 300
+
+
+class LobbySnapshot:
+    """Pre-serialized lobby for one tenant, ready to be written to the socket."""
+
+    __slots__ = ("tenant_id", "games", "body", "etag", "built_at", "_search_index")
+
+    def __init__(self, tenant_id, games: list[dict]):
+        self.tenant_id = tenant_id
+        self.games = games
+        self.body = json.dumps(games, default=str, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.built_at = datetime.utcnow()
+        self._search_index = None
+
+    @property
+    def search_index(self) -> LobbySearchIndex:
+        # Built on first search; lives and dies with the snapshot
+        if self._search_index is None:
+            self._search_index = LobbySearchIndex(self.games)
+        return self._search_index
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return self.etag in candidates
 
 
 class LobbyService:
 
+    _snapshots = TTLCache(ttl_seconds=LOBBY_SNAPSHOT_TTL_SECONDS)
+    _profiles = TTLCache(ttl_seconds=PROFILE_CACHE_TTL_SECONDS, max_entries=100000)
+
     @staticmethod
     def get_lobby_games(db: Session, tenant_id):
         rows = (
@@ -18,6 +65,7 @@ class LobbyService:
                 TenantGame.status == "active",
                 Game.status == "active"
             )
+            .order_by(Game.game_name)
             .all()
         )
 
@@ -28,7 +76,7 @@ class LobbyService:
                 "game_name": game.game_name,
                 "game_code": game.game_code,
                 "volatility": game.volatility,
-                "engine_type": game.engine_type,  
+                "engine_type": game.engine_type,
                 # PROVIDER
                 "provider_name": provider.provider_name,
 
@@ -39,3 +87,54 @@ class LobbyService:
             }
             for tg, game, provider in rows
         ]
+
+    # ─────────────────────────────
+    # Snapshot cache
+    # ─────────────────────────────
+    @staticmethod
+    def get_snapshot(db: Session, tenant_id) -> LobbySnapshot:
+        return LobbyService._snapshots.get_or_set(
+            tenant_id,
+            lambda: LobbySnapshot(tenant_id, LobbyService.get_lobby_games(db, tenant_id))
+        )
+
+    @staticmethod
+    def refresh_snapshot(db: Session, tenant_id) -> LobbySnapshot:
+        """Rebuild a tenant's snapshot right away (after tenant game settings change)."""
+        snapshot = LobbySnapshot(tenant_id, LobbyService.get_lobby_games(db, tenant_id))
+        LobbyService._snapshots.set(tenant_id, snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate(tenant_id=None):
+        """Drop one tenant's snapshot, or every tenant's when a global game changes."""
+        if tenant_id is None:
+            LobbyService._snapshots.clear()
+        else:
+            LobbyService._snapshots.pop(tenant_id)
+
+    # ─────────────────────────────
+    # Casino profile check
+    # ─────────────────────────────
+    @staticmethod
+    def ensure_casino_profile(db: Session, player_id, tenant_id):
+        """
+        A player can only open a lobby after entering the casino (wallets exist).
+        Wallets are never deleted, so a positive answer is cached.
+        """
+        key = (player_id, tenant_id)
+        if LobbyService._profiles.get(key):
+            return
+
+        wallet_exists = db.query(Wallet.wallet_id).filter(
+            Wallet.player_id == player_id,
+            Wallet.tenant_id == tenant_id
+        ).first()
+
+        if not wallet_exists:
+            raise HTTPException(
+                status_code=403,
+                detail="Casino profile not initialized. Please enter via the Marketplace."
+            )
+
+        LobbyService._profiles.set(key, True)
@@ -0,0 +1,121 @@
+import re
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+# Partitioned table -> range key (monthly partitions named <table>_pYYYYMM)
+PARTITIONED_TABLES = {
+    "game_rounds": "started_at",
+    "bets": "placed_at",
+    "wallet_transactions": "created_at",
+}
+
+# Detached partitions are moved here until they are archived / dropped
+ARCHIVE_SCHEMA = "archive"
+
+_BOUND = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _parse_bound(raw: str) -> datetime | None:
+    raw = raw.strip()
+    if raw in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(raw.strip("'"))
+
+
+class PartitionService:
+    """
+    Monthly range partitions for the per-bet tables.
+
+    Partitions are created months_ahead in advance so inserts never hit a
+    missing range, and partitions older than the retention window are
+    detached into the archive schema, which keeps per-partition indexes,
+    vacuum and inserts bounded to recent data.
+    """
+
+    @staticmethod
+    def partition_name(table: str, month: datetime) -> str:
+        return f"{table}_p{month:%Y%m}"
+
+    @staticmethod
+    def list_partitions(db: Session, table: str) -> list[dict]:
+        """Attached partitions of `table`, oldest first; lower is None for the legacy (MINVALUE) one."""
+        rows = db.execute(text("""
+            SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table AS regclass)
+        """), {"table": table}).all()
+
+        partitions = []
+        for row in rows:
+            match = _BOUND.search(row.bound)
+            if match:
+                partitions.append({
+                    "name": row.name,
+                    "lower": _parse_bound(match.group(1)),
+                    "upper": _parse_bound(match.group(2)),
+                })
+        return sorted(partitions, key=lambda p: (p["lower"] is not None, p["lower"] or datetime.min))
+
+    @staticmethod
+    def ensure_partitions(db: Session, months_ahead: int, now: datetime | None = None) -> list[str]:
+        """Create the monthly partitions from the current month to `months_ahead` months out."""
+        current = month_start(now or datetime.utcnow())
+        created = []
+
+        for table in PARTITIONED_TABLES:
+            partitions = PartitionService.list_partitions(db, table)
+            existing = {p["name"] for p in partitions}
+            # Ranges already covered (e.g. by the legacy partition) are skipped
+            covered = max((p["upper"] for p in partitions if p["upper"]), default=None)
+            start = max(current, covered) if covered else current
+
+            month = start
+            while month <= add_months(current, months_ahead):
+                name = PartitionService.partition_name(table, month)
+                if name not in existing:
+                    db.execute(text(
+                        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+                    ))
+                    created.append(name)
+                month = add_months(month, 1)
+
+        db.commit()
+        return created
+
+    @staticmethod
+    def detach_expired(db: Session, retain_months: int, now: datetime | None = None) -> list[str]:
+        """
+        Detach partitions that end before the retention window into the
+        archive schema (still queryable there, no longer scanned or vacuumed
+        with the live table). retain_months <= 0 keeps everything attached.
+        """
+        if retain_months <= 0:
+            return []
+        cutoff = add_months(month_start(now or datetime.utcnow()), -retain_months)
+        detached = []
+
+        db.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{ARCHIVE_SCHEMA}"'))
+        for table in PARTITIONED_TABLES:
+            for partition in PartitionService.list_partitions(db, table):
+                if partition["upper"] is None or partition["upper"] > cutoff:
+                    continue
+                db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{partition["name"]}"'))
+                db.execute(text(f'ALTER TABLE "{partition["name"]}" SET SCHEMA "{ARCHIVE_SCHEMA}"'))
+                detached.append(partition["name"])
+
+        db.commit()
+        return detached
@@ -301,6 +301,45 @@ class ResponsibleGamingService:
 
         return True
 
+    # -----------------------------
+    # Release Usage (Voided Action)
+    # -----------------------------
+    @staticmethod
+    def release_usage(
+        db: Session,
+        player_id: UUID,
+        tenant_id: UUID,
+        limit_type: str,
+        amount: float,
+        since: float,
+        period: str = "DAILY"
+    ):
+        """
+        Give back usage recorded for an action that was voided. `since` is
+        when the action was counted (epoch seconds); usage from a period that
+        has rolled over since is left alone. Does not commit.
+        """
+        now = datetime.now()
+
+        limit = db.query(PlayerLimit).filter(
+            PlayerLimit.player_id == player_id,
+            PlayerLimit.tenant_id == tenant_id,
+            PlayerLimit.limit_type == limit_type,
+            PlayerLimit.period == period,
+            PlayerLimit.status == "ACTIVE"
+        ).with_for_update().first()
+
+        if not limit:
+            return
+        if limit.period_start:
+            period_end = ResponsibleGamingService._get_period_end(limit.period_start, limit.period)
+            if limit.period_start.timestamp() > since or now > period_end:
+                return
+
+        new_usage = max(0.0, float(limit.current_usage or 0) - amount)
+        limit.current_usage = Decimal(str(round(new_usage, 2)))
+        limit.updated_at = now
+
     # -----------------------------
     # Remove / Cancel Limit
     # -----------------------------
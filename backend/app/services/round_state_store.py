@@ -0,0 +1,131 @@
+import threading
+import time
+import uuid
+
+
+class RoundState:
+    """
+    Server-held state of one interactive round (Mines, live Crash).
+
+    `secret` holds what the player must not see until settlement (mine
+    layout, crash point); `progress` holds what they built up (revealed
+    cells). `step` increments on every checkpoint and is the optimistic
+    concurrency token against the durable copy in game_rounds.result_data.
+    """
+
+    __slots__ = (
+        "round_id", "player_id", "tenant_id", "game_id", "engine_type", "config",
+        "bet_amount", "game_stake", "opt_in", "secret", "progress", "fairness",
+        "started_at", "updated_at", "step", "lock",
+    )
+
+    def __init__(self, round_id, player_id, tenant_id, game_id, engine_type, config,
+                 bet_amount, game_stake, opt_in, secret, progress, fairness,
+                 started_at, updated_at=None, step=0):
+        self.round_id = round_id
+        self.player_id = player_id
+        self.tenant_id = tenant_id
+        self.game_id = game_id
+        self.engine_type = engine_type
+        self.config = config
+        self.bet_amount = bet_amount
+        self.game_stake = game_stake
+        self.opt_in = opt_in
+        self.secret = secret
+        self.progress = progress
+        self.fairness = fairness
+        self.started_at = started_at
+        self.updated_at = updated_at or started_at
+        self.step = step
+        self.lock = threading.Lock()
+
+    # ─────────────────────────────
+    # Durable checkpoint (game_rounds.result_data while the round is open)
+    # ─────────────────────────────
+    def checkpoint(self) -> dict:
+        return {
+            "status": "OPEN",
+            "step": self.step,
+            "engine_type": self.engine_type,
+            "player_id": str(self.player_id),
+            "tenant_id": str(self.tenant_id),
+            "game_id": str(self.game_id),
+            "game_stake": self.game_stake,
+            "opt_in": self.opt_in,
+            "secret": self.secret,
+            "progress": self.progress,
+            "fairness": self.fairness,
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, round_id, bet_amount: float, config: dict, data: dict) -> "RoundState":
+        return cls(
+            round_id=round_id,
+            player_id=uuid.UUID(data["player_id"]),
+            tenant_id=uuid.UUID(data["tenant_id"]),
+            game_id=uuid.UUID(data["game_id"]),
+            engine_type=data["engine_type"],
+            config=config,
+            bet_amount=bet_amount,
+            game_stake=data["game_stake"],
+            opt_in=data["opt_in"],
+            secret=data["secret"],
+            progress=data["progress"],
+            fairness=data["fairness"],
+            started_at=data["started_at"],
+            updated_at=data["updated_at"],
+            step=data["step"],
+        )
+
+
+class RoundStateStore:
+    """
+    Per-process map of open rounds: a dict lookup per step, no game,
+    session or wallet reads. Entries expire `ttl_seconds` after their last
+    touch; an expired or missing entry is rebuilt from the checkpoint, so
+    the store is a cache and losing it (restart, another API worker)
+    only costs one read.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 100_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, round_id) -> RoundState | None:
+        with self._lock:
+            entry = self._data.get(round_id)
+            if entry is None:
+                return None
+            state, expires_at = entry
+            now = time.monotonic()
+            if expires_at < now:
+                del self._data[round_id]
+                return None
+            self._data[round_id] = (state, now + self.ttl_seconds)
+            return state
+
+    def put(self, state: RoundState):
+        with self._lock:
+            if len(self._data) >= self.max_entries and state.round_id not in self._data:
+                self._evict_expired()
+                if len(self._data) >= self.max_entries:
+                    # Least recently touched; it can be reloaded from its checkpoint
+                    oldest = min(self._data, key=lambda k: self._data[k][1])
+                    del self._data[oldest]
+            self._data[state.round_id] = (state, time.monotonic() + self.ttl_seconds)
+
+    def discard(self, round_id):
+        with self._lock:
+            self._data.pop(round_id, None)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._data.items() if expires_at < now]:
+            del self._data[key]
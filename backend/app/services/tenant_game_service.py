@@ -1,47 +1,100 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
 from fastapi import HTTPException
 from datetime import datetime
 
 from app.models.tenant_game import TenantGame
 from app.models.game import Game, GameStatusEnum
 from app.models.game_provider import GameProvider
+from app.services.lobby_service import LobbyService
 
 
 class TenantGameService:
 
     # Marketplace listing
     @staticmethod
-    def list_available_market_games(db: Session, tenant_id):
-        games = (
-            db.query(Game)
-            .join(GameProvider)
+    def list_available_market_games(
+        db: Session,
+        tenant_id,
+        page: int = 1,
+        page_size: int = 50,
+        provider_id=None,
+        engine_type: str | None = None,
+        volatility: str | None = None,
+        search: str | None = None
+    ):
+        """
+        One set-based query: active games outer-joined to this tenant's links,
+        provider name joined in, total row count via a window function.
+        """
+        query = (
+            db.query(
+                Game.game_id,
+                Game.game_name,
+                GameProvider.provider_name,
+                func.coalesce(TenantGame.min_bet, Game.min_bet).label("tenant_min_bet"),
+                func.coalesce(TenantGame.max_bet, Game.max_bet).label("tenant_max_bet"),
+                func.coalesce(TenantGame.rtp_override, Game.rtp_percentage).label("rtp_percentage"),
+                Game.volatility,
+                Game.engine_type,
+                Game.engine_config,
+                TenantGame.game_id.isnot(None).label("is_enabled"),
+                func.count().over().label("total_count"),
+            )
+            .join(GameProvider, GameProvider.provider_id == Game.provider_id)
+            .outerjoin(
+                TenantGame,
+                and_(
+                    TenantGame.game_id == Game.game_id,
+                    TenantGame.tenant_id == tenant_id,
+                    TenantGame.is_active == True
+                )
+            )
             .filter(Game.status == GameStatusEnum.ACTIVE)
-            .all()
         )
 
-        result = []
+        if provider_id:
+            query = query.filter(Game.provider_id == provider_id)
+        if engine_type:
+            query = query.filter(Game.engine_type == engine_type)
+        if volatility:
+            query = query.filter(Game.volatility == volatility.lower())
+        if search:
+            # Prefix match served by ix_games_game_name_lower (text_pattern_ops)
+            pattern = search.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.filter(func.lower(Game.game_name).like(f"{pattern}%", escape="\\"))
 
-        for g in games:
-            tg = db.query(TenantGame).filter_by(
-                tenant_id=tenant_id,
-                game_id=g.game_id,
-                is_active=True
-            ).first()
-
-            result.append({
-                "game_id": g.game_id,
-                "game_name": g.game_name,
-                "provider_name": g.provider.provider_name,
-                "tenant_min_bet": tg.min_bet if tg and tg.min_bet else g.min_bet,
-                "tenant_max_bet": tg.max_bet if tg and tg.max_bet else g.max_bet,
-                "rtp_percentage": tg.rtp_override if tg and tg.rtp_override else g.rtp_percentage,
-                "volatility": g.volatility,
-                "engine_type": g.engine_type,
-                "engine_config": g.engine_config,
-                "is_enabled": bool(tg)
-            })
-
-        return result
+        rows = (
+            query.order_by(Game.game_name, Game.game_id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+
+        total = rows[0].total_count if rows else 0
+        if not rows and page > 1:
+            total = query.with_entities(func.count(Game.game_id)).order_by(None).scalar()
+
+        return {
+            "items": [
+                {
+                    "game_id": row.game_id,
+                    "game_name": row.game_name,
+                    "provider_name": row.provider_name,
+                    "tenant_min_bet": row.tenant_min_bet,
+                    "tenant_max_bet": row.tenant_max_bet,
+                    "rtp_percentage": row.rtp_percentage,
+                    "volatility": row.volatility,
+                    "engine_type": row.engine_type,
+                    "engine_config": row.engine_config,
+                    "is_enabled": row.is_enabled
+                }
+                for row in rows
+            ],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        }
 
     # Enable Game
     @staticmethod
@@ -74,6 +127,7 @@ class TenantGameService:
             db.add(tg)
 
         db.commit()
+        LobbyService.refresh_snapshot(db, tenant_id)
         return {"message": "Game enabled"}
 
     # Disable Game
@@ -92,6 +146,7 @@ class TenantGameService:
         tg.updated_at = datetime.utcnow()
 
         db.commit()
+        LobbyService.refresh_snapshot(db, tenant_id)
         return {"message": "Game disabled"}
 
     # Update overrides
@@ -114,6 +169,7 @@ class TenantGameService:
 
         tg.updated_at = datetime.utcnow()
         db.commit()
+        LobbyService.refresh_snapshot(db, tenant_id)
 
         return {"message": "Overrides updated"}
 
@@ -1,9 +1,9 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, extract, cast, Date, func
+from sqlalchemy import desc, func
 from fastapi import HTTPException
 from decimal import Decimal
 import uuid
-from datetime import date
+from datetime import date, datetime, timedelta
 from sqlalchemy.dialects.postgresql import insert
 from uuid import UUID
 
@@ -16,6 +16,8 @@ from app.models.game_round import GameRound
 from app.models.deposit import Deposit
 from app.models.withdrawal import Withdrawal
 from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.core.config import settings
+from app.services.partition_service import add_months, month_start
 
 
 # ✅ Global constant (correct placement)
@@ -35,7 +37,11 @@ class WalletService:
             raise HTTPException(400, "Reference information required")
 
         if ref_type == "bet":
-            exists = db.query(GameRound).filter_by(round_id=ref_id).first()
+            # Rounds are settled soon after they start: look in the latest partitions before all of them
+            exists = db.query(GameRound.round_id).filter(
+                GameRound.round_id == ref_id,
+                GameRound.started_at >= add_months(month_start(datetime.utcnow()), -1)
+            ).first() or db.query(GameRound.round_id).filter_by(round_id=ref_id).first()
 
         elif ref_type == "deposit":
             exists = db.query(Deposit).filter_by(deposit_id=ref_id).first()
@@ -145,22 +151,25 @@ class WalletService:
         if tx_type:
             query = query.filter(WalletTransaction.reference_type == tx_type)
 
+        # Range predicates on created_at (not casts / extract) so only the matching partitions are read
+        since = datetime.utcnow() - timedelta(days=settings.history_window_days)
+        until = None
         if month and month not in ["", "month"]:
             try:
                 if len(month) == 10:
-                    query = query.filter(
-                        cast(WalletTransaction.created_at, Date) == month
-                    )
+                    since = datetime.strptime(month, "%Y-%m-%d")
+                    until = since + timedelta(days=1)
 
                 elif len(month) == 7:
-                    year, m = map(int, month.split("-"))
-                    query = query.filter(
-                        extract("year", WalletTransaction.created_at) == year,
-                        extract("month", WalletTransaction.created_at) == m,
-                    )
+                    since = datetime.strptime(month, "%Y-%m")
+                    until = add_months(since, 1)
             except Exception:
                 pass
 
+        query = query.filter(WalletTransaction.created_at >= since)
+        if until:
+            query = query.filter(WalletTransaction.created_at < until)
+
         transactions = (
             query.order_by(desc(WalletTransaction.created_at))
             .limit(50)
@@ -0,0 +1,48 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.jackpot_pool_accumulator import JackpotPoolAccumulator
+from app.services.jackpot_service import JackpotService
+from app.services.jackpot_ticker import JackpotTicker
+
+
+logger = logging.getLogger(__name__)
+
+
+def flush_once() -> dict:
+    db = SessionLocal()
+    try:
+        applied = JackpotPoolAccumulator.flush(db)
+        # Live tickers in every process re-read these tenants' pools once this commits
+        JackpotTicker.notify_pools_changed(db, applied)
+        db.commit()
+    except Exception:
+        db.rollback()
+        db.close()
+        raise
+
+    # Separate transaction: a failing refund must not hold up the live pools
+    try:
+        refunded = JackpotService.refund_late_contributions(db)
+        db.commit()
+        if refunded:
+            logger.info("Refunded late contributions to closed jackpots: %s", refunded)
+    except Exception:
+        db.rollback()
+        logger.exception("Refunding late jackpot contributions failed")
+    finally:
+        db.close()
+    return applied
+
+
+async def run_jackpot_pool_flusher():
+    """Apply buffered jackpot contributions every few seconds until cancelled."""
+    interval = settings.jackpot_pool_flush_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(flush_once)
+        except Exception:
+            logger.exception("Jackpot pool flush failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.jackpot_service import JackpotService
+
+
+logger = logging.getLogger(__name__)
+
+JACKPOT_DRAW_BATCH_SIZE = 100
+
+
+def run_due_draws_once(now: datetime | None = None) -> int:
+    """
+    Draw every jackpot past its deadline, for all tenants, in deadline order.
+    Each jackpot commits on its own, so one failure does not hold up the rest.
+    """
+    now = now or datetime.now()
+    processed = 0
+
+    db = SessionLocal()
+    try:
+        cursor = None
+        while True:
+            batch = JackpotService.due_jackpots(db, now, after=cursor, limit=JACKPOT_DRAW_BATCH_SIZE)
+            db.rollback()  # end the read transaction before drawing
+            if not batch:
+                break
+
+            for deadline, jackpot_id in batch:
+                try:
+                    if JackpotService.run_scheduled_draw(db, jackpot_id, now) is not None:
+                        processed += 1
+                except Exception:
+                    db.rollback()
+                    logger.exception("Scheduled draw failed for jackpot %s", jackpot_id)
+
+            cursor = batch[-1]
+            if len(batch) < JACKPOT_DRAW_BATCH_SIZE:
+                break
+    finally:
+        db.close()
+
+    return processed
+
+
+async def run_jackpot_scheduler():
+    """Process due jackpots on a fixed interval until cancelled."""
+    interval = settings.jackpot_scheduler_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(run_due_draws_once)
+        except Exception:
+            logger.exception("Jackpot scheduler pass failed")
+        await asyncio.sleep(interval)
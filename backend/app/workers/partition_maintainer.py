@@ -0,0 +1,37 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.partition_service import PartitionService
+
+
+logger = logging.getLogger(__name__)
+
+
+def maintain_partitions_once() -> tuple[list[str], list[str]]:
+    """Create upcoming monthly partitions, then detach expired ones. Returns (created, detached)."""
+    db = SessionLocal()
+    try:
+        created = PartitionService.ensure_partitions(db, settings.partition_months_ahead)
+        detached = PartitionService.detach_expired(db, settings.partition_retention_months)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if created or detached:
+        logger.info("Partitions created: %s, detached: %s", created, detached)
+    return created, detached
+
+
+async def run_partition_maintainer():
+    """Keep partitions ahead of the clock on a fixed interval until cancelled."""
+    interval = settings.partition_maintenance_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(maintain_partitions_once)
+        except Exception:
+            logger.exception("Partition maintenance pass failed")
+        await asyncio.sleep(interval)
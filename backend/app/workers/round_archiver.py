@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.archive_service import ArchiveService
+
+
+logger = logging.getLogger(__name__)
+
+
+def archive_rounds_once() -> int:
+    """Move settled rounds past settings.archive_after_days to the Parquet archive. Returns rounds archived."""
+    db = SessionLocal()
+    try:
+        batches = ArchiveService.archive_settled(db, settings.archive_after_days)
+    finally:
+        db.close()
+
+    archived = sum(batch["files"]["rounds"]["rows"] for batch in batches)
+    if archived:
+        logger.info("Archived %s rounds in %s batches", archived, len(batches))
+    return archived
+
+
+async def run_round_archiver():
+    """Archive old rounds on a fixed interval until cancelled."""
+    interval = settings.round_archive_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(archive_rounds_once)
+        except Exception:
+            logger.exception("Round archive pass failed")
+        await asyncio.sleep(interval)
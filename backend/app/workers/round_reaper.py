@@ -0,0 +1,62 @@
+import asyncio
+import logging
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.crash_table_service import CrashTableService
+from app.services.interactive_round_service import InteractiveRoundService
+
+
+logger = logging.getLogger(__name__)
+
+ROUND_REAPER_BATCH_SIZE = 500
+
+
+def reap_rounds_once() -> int:
+    """
+    Settle interactive rounds their players walked away from (each commits
+    on its own), then crash table rounds left open by their table.
+    """
+    settled = 0
+
+    db = SessionLocal()
+    try:
+        round_ids = InteractiveRoundService.open_round_ids(db, limit=ROUND_REAPER_BATCH_SIZE)
+        db.rollback()
+
+        for round_id in round_ids:
+            try:
+                if InteractiveRoundService.settle_if_abandoned(db, round_id) is not None:
+                    settled += 1
+            except HTTPException as e:
+                # 404 / 409: the player (or another process's reaper) settled it first
+                db.rollback()
+                if e.status_code not in (404, 409):
+                    logger.exception("Could not settle abandoned round %s", round_id)
+            except Exception:
+                db.rollback()
+                logger.exception("Could not settle abandoned round %s", round_id)
+
+        # Shared crash table rounds whose table never settled them
+        try:
+            settled += CrashTableService.recover_stranded(db, limit=ROUND_REAPER_BATCH_SIZE)
+        except Exception:
+            db.rollback()
+            logger.exception("Could not recover stranded crash table rounds")
+    finally:
+        db.close()
+
+    return settled
+
+
+async def run_round_reaper():
+    """Settle abandoned interactive rounds on a fixed interval until cancelled."""
+    interval = settings.round_reaper_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(reap_rounds_once)
+        except Exception:
+            logger.exception("Round reaper pass failed")
+        await asyncio.sleep(interval)
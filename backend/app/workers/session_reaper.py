@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.game_session_service import GameSessionService
+
+
+logger = logging.getLogger(__name__)
+
+SESSION_REAPER_BATCH_SIZE = 1000
+
+
+def reap_sessions_once() -> int:
+    """Close idle game sessions in batches, accounting their play time. Returns sessions closed."""
+    closed = 0
+
+    db = SessionLocal()
+    try:
+        while True:
+            batch = GameSessionService.close_idle(
+                db, settings.session_idle_timeout_seconds, limit=SESSION_REAPER_BATCH_SIZE
+            )
+            closed += batch
+            if batch < SESSION_REAPER_BATCH_SIZE:
+                break
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if closed:
+        logger.info("Closed %s idle game sessions", closed)
+    return closed
+
+
+async def run_session_reaper():
+    """Close idle game sessions on a fixed interval until cancelled."""
+    interval = settings.session_reaper_interval_seconds
+    while True:
+        try:
+            await asyncio.to_thread(reap_sessions_once)
+        except Exception:
+            logger.exception("Session reaper pass failed")
+        await asyncio.sleep(interval)
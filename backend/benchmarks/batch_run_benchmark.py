@@ -0,0 +1,47 @@
+"""
+Per-round cost of BaseGameEngine.run in a loop vs. one run_many call,
+for every batchable engine, plus the empirical RTP of the batch against
+the engine's theoretical rtp().
+
+Run from backend/:  python -m benchmarks.batch_run_benchmark [rounds]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+from app.game_engines.batch import batch_generator
+from app.game_engines.registry import engine_registry
+
+
+CASES = [
+    ("dice", {}, {"player_choice": "EVEN"}),
+    ("slot", {}, {}),
+    ("crash", {}, {"target_multiplier": 2.0}),
+    ("mines", {}, {"successful_picks": 3}),
+    ("plinko", {"rows": 12, "risk_level": "medium"}, {}),
+]
+
+
+def _per_round(stmt, rounds: int) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=3)) / rounds * 1e6
+
+
+def main(rounds: int = 200_000):
+    bets = np.ones(rounds)
+    print(f"{rounds:,} rounds per engine\n")
+    print(f"{'engine':<8} {'run() loop':>12} {'run_many':>12} {'speedup':>8} {'RTP (batch)':>12} {'rtp()':>8}")
+
+    for engine_type, config, params in CASES:
+        engine = engine_registry.engine(engine_type, config)
+        loop_rounds = min(rounds, 50_000)
+        loop = _per_round(lambda: [engine.run(1.0, **params) for _ in range(loop_rounds)], loop_rounds)
+        batch = _per_round(lambda: engine.run_many(bets, params, batch_generator()), rounds)
+
+        result = engine.run_many(bets, params, batch_generator())
+        print(f"{engine_type:<8} {loop:>9.2f} us {batch:>9.3f} us {loop / batch:>7.0f}x "
+              f"{result.total_win / rounds:>12.4f} {engine.rtp():>8.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
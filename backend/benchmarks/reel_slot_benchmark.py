@@ -0,0 +1,64 @@
+"""
+Per-spin cost of the compiled reel-slot evaluator vs. a straightforward
+string-based one (slice the strips, join symbols per payline, look the
+combination up). Also cross-checks that both pay the same.
+
+Run from backend/:  python -m benchmarks.reel_slot_benchmark [spins]
+"""
+import sys
+import timeit
+
+from app.game_engines.reel_slot_engine import DEFAULT_REEL_CONFIG, ReelSlotEngine, compile_reels
+from app.game_engines.rng import BufferedSecureRNG
+from app.game_engines.slot_engine import SlotEngine
+
+
+def naive_line_multiplier(config: dict, stops: list[int]) -> float:
+    rows, strips = config["rows"], config["reel_strips"]
+    wild, scatter = config.get("wild"), config.get("scatter")
+    columns = [[strip[(stop + k) % len(strip)] for k in range(rows)] for strip, stop in zip(strips, stops)]
+
+    total = 0.0
+    for line in config["paylines"]:
+        combo = "|".join(columns[reel][row] for reel, row in enumerate(line)).split("|")
+        symbol = next((s for s in combo if s != wild), None)
+        best = 0.0
+        for candidate in {symbol, wild} - {None, scatter}:
+            count = 0
+            for s in combo:
+                if s == candidate or (s == wild and candidate != wild):
+                    count += 1
+                else:
+                    break
+            best = max(best, float(config["paytable"].get(candidate, {}).get(str(count), 0)))
+        total += best
+    return total
+
+
+def _row(label: str, spins: int, stmt):
+    elapsed = min(timeit.repeat(stmt, number=1, repeat=3))
+    print(f"{label:<44} {elapsed / spins * 1e6:>8.2f} us/spin")
+
+
+def main(spins: int = 100_000):
+    rng = BufferedSecureRNG()
+    config = DEFAULT_REEL_CONFIG
+    compiled = compile_reels(config)
+    stops = [compiled.spin_stops(rng) for _ in range(spins)]
+
+    mismatches = sum(
+        naive_line_multiplier(config, s) != compiled.evaluate(s)[3] for s in stops[:20_000]
+    )
+    print(f"cross-check on 20,000 spins: {mismatches} mismatches\n")
+
+    legacy = SlotEngine({}, rng)
+    engine = ReelSlotEngine(config, rng)
+    print(f"{len(config['reel_strips'])}x{config['rows']}, {len(config['paylines'])} lines, {spins:,} spins")
+    _row("legacy SlotEngine.run (3 reels, 1 line)", spins, lambda: [legacy.run(1.0) for _ in range(spins)])
+    _row("string-based evaluation", spins, lambda: [naive_line_multiplier(config, s) for s in stops])
+    _row("compiled evaluation", spins, lambda: [compiled.evaluate(s) for s in stops])
+    _row("ReelSlotEngine.run (draw + evaluate)", spins, lambda: [engine.run(1.0) for _ in range(spins)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,55 @@
+"""
+Per-draw cost of the buffered CSPRNG vs. `random` and `secrets`.
+
+Run from backend/:  python -m benchmarks.secure_rng_benchmark [draws]
+"""
+import random
+import secrets
+import sys
+import timeit
+
+from app.game_engines.rng import BufferedSecureRNG
+
+
+SYMBOLS = ["A", "B", "C", "7"]
+
+
+def _row(label: str, draws: int, stmt):
+    elapsed = min(timeit.repeat(stmt, number=1, repeat=3))
+    print(f"{label:<44} {elapsed / draws * 1e9:>8.0f} ns/draw")
+
+
+def main(draws: int = 500_000):
+    buffered = BufferedSecureRNG()
+    system = random.SystemRandom()
+    loop = range(draws)
+
+    print(f"float in [0, 1), {draws:,} draws")
+    _row("random.random (Mersenne Twister)", draws, lambda: [random.random() for _ in loop])
+    _row("SystemRandom.random (urandom per call)", draws, lambda: [system.random() for _ in loop])
+    _row("BufferedSecureRNG.random", draws, lambda: [buffered.random() for _ in loop])
+
+    print(f"\ndie roll 1..6, {draws:,} draws")
+    _row("random.randint", draws, lambda: [random.randint(1, 6) for _ in loop])
+    _row("secrets.randbelow", draws, lambda: [secrets.randbelow(6) + 1 for _ in loop])
+    _row("BufferedSecureRNG.randint", draws, lambda: [buffered.randint(1, 6) for _ in loop])
+
+    print(f"\nreel symbol, {draws:,} draws")
+    _row("random.choice", draws, lambda: [random.choice(SYMBOLS) for _ in loop])
+    _row("secrets.choice", draws, lambda: [secrets.choice(SYMBOLS) for _ in loop])
+    _row("BufferedSecureRNG.choice", draws, lambda: [buffered.choice(SYMBOLS) for _ in loop])
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("\nnumpy not installed; skipping vectorized draws")
+        return
+
+    print(f"\nvectorized, {draws:,} draws")
+    _row("BufferedSecureRNG.random_array", draws, lambda: buffered.random_array(draws))
+    _row("BufferedSecureRNG.integers_array(1, 6)", draws, lambda: buffered.integers_array(1, 6, draws))
+    _row("BufferedSecureRNG.choice_array", draws, lambda: buffered.choice_array(SYMBOLS, draws))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,155 @@
+"""
+Replays the hot-query catalog with EXPLAIN (ANALYZE, BUFFERS) against the
+configured database and flags sequential scans over enough rows to
+matter. Parameters are sampled from existing rows (the most recent
+session and its player's wallet / round), so run it against a copy of
+production-sized data. Everything runs in one transaction that is
+rolled back, so the counter UPDATE leaves no trace.
+
+Run from backend/:  python -m database_check.index_advisor [--min-rows N] [--plans]
+
+Exits 1 when any query sequentially scans at least --min-rows rows.
+"""
+import argparse
+import json
+import sys
+import uuid
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+
+# name -> SQL, mirroring the service queries run per bet / per page view
+HOT_QUERIES = {
+    "active_session": """
+        SELECT * FROM game_sessions
+        WHERE player_id = :player_id AND game_id = :game_id AND tenant_id = :tenant_id AND status = 'active'
+        LIMIT 1
+    """,
+    "next_round_number": """
+        UPDATE game_sessions SET round_count = round_count + 1
+        WHERE session_id = :session_id
+        RETURNING round_count
+    """,
+    "idle_sessions": """
+        SELECT session_id FROM game_sessions
+        WHERE status = 'active' AND last_activity_at < LOCALTIMESTAMP - interval '30 minutes'
+        ORDER BY last_activity_at
+        LIMIT 1000
+    """,
+    "player_wallet": """
+        SELECT * FROM wallets
+        WHERE player_id = :player_id AND tenant_id = :tenant_id AND wallet_type_id = :wallet_type_id AND is_active = true
+        LIMIT 1
+    """,
+    "wallet_statement": """
+        SELECT * FROM wallet_transactions
+        WHERE wallet_id = :wallet_id AND created_at >= now() - interval '90 days'
+        ORDER BY created_at DESC
+        LIMIT 50
+    """,
+    "round_postings": """
+        SELECT reference_id, balance_after FROM wallet_transactions
+        WHERE reference_id = :round_id AND created_at >= now() - interval '90 days'
+    """,
+    "player_limit": """
+        SELECT * FROM player_limits
+        WHERE player_id = :player_id AND tenant_id = :tenant_id
+          AND limit_type = 'WAGER' AND period = 'DAILY' AND status = 'ACTIVE'
+    """,
+    "bonus_wagering": """
+        SELECT bu.* FROM bonus_usage bu
+        JOIN bonuses b ON b.bonus_id = bu.bonus_id
+        WHERE bu.player_id = :player_id AND bu.status = 'active'
+          AND b.tenant_id = :tenant_id AND b.valid_to > now()
+    """,
+}
+
+SEQ_SCANS = ("Seq Scan", "Parallel Seq Scan")
+
+
+def sample_params(conn) -> dict:
+    """Ids from the most recent session; random ids (empty results) where tables are empty."""
+    params = {
+        "session_id": uuid.uuid4(), "player_id": uuid.uuid4(), "game_id": uuid.uuid4(),
+        "tenant_id": uuid.uuid4(), "wallet_id": uuid.uuid4(), "wallet_type_id": 1, "round_id": uuid.uuid4(),
+    }
+    session = conn.execute(text("""
+        SELECT session_id, player_id, game_id, tenant_id FROM game_sessions
+        ORDER BY started_at DESC NULLS LAST LIMIT 1
+    """)).mappings().first()
+    if session:
+        params.update(session)
+        wallet = conn.execute(text("""
+            SELECT wallet_id, wallet_type_id FROM wallets
+            WHERE player_id = :player_id AND tenant_id = :tenant_id LIMIT 1
+        """), params).mappings().first()
+        if wallet:
+            params.update(wallet)
+        round_id = conn.execute(text(
+            "SELECT round_id FROM game_rounds WHERE session_id = :session_id LIMIT 1"
+        ), params).scalar()
+        if round_id:
+            params["round_id"] = round_id
+    return params
+
+
+def walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def explain(conn, sql: str, params: dict) -> dict:
+    plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def report(name: str, plan: dict, min_rows: int) -> list[str]:
+    root = plan["Plan"]
+    nodes = list(walk(root))
+    indexes = sorted({n["Index Name"] for n in nodes if "Index Name" in n})
+
+    flagged = []
+    for n in nodes:
+        if n["Node Type"] not in SEQ_SCANS:
+            continue
+        scanned = (n.get("Actual Rows", 0) + n.get("Rows Removed by Filter", 0)) * n.get("Actual Loops", 1)
+        if scanned >= min_rows:
+            flagged.append(f"seq scan on {n.get('Relation Name')} ({scanned:,} rows read)")
+
+    buffers = root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0)
+    status = "SEQ SCAN" if flagged else "ok"
+    print(f"{name:<20} {status:<9} {plan['Execution Time']:>9.3f} ms {buffers:>8} buffers  "
+          f"{', '.join(indexes) or '-'}")
+    for line in flagged:
+        print(f"{'':<20} ! {line}")
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-rows", type=int, default=1000, help="flag seq scans reading at least this many rows")
+    parser.add_argument("--plans", action="store_true", help="print the full JSON plans")
+    args = parser.parse_args()
+
+    flagged = []
+    with engine.connect() as conn:
+        params = sample_params(conn)
+        print(f"{'query':<20} {'status':<9} {'time':>12} {'buffers':>16}  indexes")
+        for name, sql in HOT_QUERIES.items():
+            plan = explain(conn, sql, params)
+            flagged += report(name, plan, args.min_rows)
+            if args.plans:
+                print(json.dumps(plan, indent=2, default=str))
+        conn.rollback()
+
+    print(f"\n{len(flagged)} sequential scan(s) over {args.min_rows:,}+ rows")
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
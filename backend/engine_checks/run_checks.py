@@ -0,0 +1,225 @@
+"""
+Statistical checks that each engine's outcomes follow its intended distribution.
+
+Run from backend/:
+
+    python -m engine_checks.run_checks                  # fast tier (CI)
+    python -m engine_checks.run_checks --tier full      # certification-size samples
+    python -m engine_checks.run_checks --samples 250000 --rng fair --engine crash
+
+--rng batch (the default) plays batchable engines through run_many in one
+vectorized call; secure and fair play every round through run() with the
+RNG player rounds use. Exits non-zero when any test's p-value falls below
+--alpha. tests/test_engine_checks.py runs the fast tier under pytest -m slow.
+"""
+import argparse
+import math
+import secrets
+import sys
+import time
+
+import numpy as np
+
+from app.game_engines.batch import batch_generator
+from app.game_engines.crash_engine import CrashEngine
+from app.game_engines.dice_engine import DiceEngine
+from app.game_engines.plink_engine import PlinkoEngine
+from app.game_engines.reel_slot_engine import DEFAULT_REEL_CONFIG, ReelSlotEngine
+from app.game_engines.slot_engine import SlotEngine
+from app.game_engines.rng import BufferedSecureRNG, FairRNG
+from engine_checks.stats import chi_square, ks_test, runs_test
+
+
+TIERS = {"fast": 20_000, "full": 1_000_000}
+RNGS = ("batch", "secure", "fair")
+
+
+# ─────────────────────────────
+# RNG sources
+# ─────────────────────────────
+def _rng_factory(kind: str):
+    """Returns rng_for(i): the randomness one sampled round uses; None plays batchable engines via run_many."""
+    if kind == "batch":
+        return None
+    if kind == "fair":
+        server_seed, client_seed = secrets.token_hex(32), "engine-checks"
+        return lambda i: FairRNG(server_seed, client_seed, i)
+
+    shared = BufferedSecureRNG()
+    return lambda i: shared
+
+
+def _sample(engine_cls, config, n, rng_for, **kwargs) -> dict[str, np.ndarray]:
+    """n rounds' result_data as columns, in run_many's layout."""
+    if rng_for is None:
+        if engine_cls.batchable:
+            return engine_cls(config).run_many(np.ones(n), kwargs, batch_generator()).data
+        rng_for = _rng_factory("secure")
+
+    engine = engine_cls(config)
+    rows = [engine.with_rng(rng_for(i)).run(1.0, **kwargs)["result_data"] for i in range(n)]
+    return {key: _column([r[key] for r in rows]) for key in rows[0]}
+
+
+def _column(values: list) -> np.ndarray:
+    try:
+        return np.array(values)
+    except ValueError:
+        # Ragged fields (e.g. per-line wins) stay one object per round
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+
+# ─────────────────────────────
+# Per-engine checks
+# ─────────────────────────────
+def check_dice(config, n, rng_for):
+    rolls = _sample(DiceEngine, config, n, rng_for, player_choice="EVEN")["roll"].astype(np.int64)
+    return [
+        ("roll uniform on 1..6", chi_square(np.bincount(rolls, minlength=7)[1:], [1 / 6] * 6)),
+        ("even/odd independence", runs_test(rolls % 2 == 0)),
+    ]
+
+
+def check_slot(config, n, rng_for):
+    engine = SlotEngine(config)
+    symbols, reels = engine.batch_symbols, engine.params.reels
+    expected = list(engine.batch_weights / engine.batch_weights.sum())
+
+    spins = _sample(SlotEngine, config, n, rng_for)["spin"]
+    if spins.dtype.kind != "i":
+        # run() returns the symbols, run_many their indices into batch_symbols
+        index = {s: i for i, s in enumerate(symbols)}
+        spins = np.vectorize(index.__getitem__, otypes=[np.int64])(spins)
+    results = [
+        (f"reel {reel + 1} symbols ~ symbol_map", chi_square(
+            np.bincount(spins[:, reel], minlength=len(symbols)), expected
+        ))
+        for reel in range(reels)
+    ]
+    results.append(("reel 1 first-symbol independence", runs_test(spins[:, 0] == 0)))
+    return results
+
+
+def check_reel_slot(config, n, rng_for):
+    strips = config["reel_strips"]
+    stop_weights = config.get("stop_weights") or [[1] * len(strip) for strip in strips]
+
+    stops = _sample(ReelSlotEngine, config, n, rng_for)["stops"]
+    results = [
+        (f"reel {reel + 1} stops ~ stop weights", chi_square(
+            np.bincount(stops[:, reel], minlength=len(weights)), [w / sum(weights) for w in weights]
+        ))
+        for reel, weights in enumerate(stop_weights)
+    ]
+    results.append(("reel 1 first-stop independence", runs_test(stops[:, 0] == 0)))
+    return results
+
+
+def check_crash(config, n, rng_for):
+    house_edge = config.get("house_edge", 0.03)
+    max_mult = config.get("max_multiplier", 1000)
+    scale = 1 - house_edge
+
+    crash = _sample(CrashEngine, config, n, rng_for)["crash_at"].astype(np.float64)
+
+    # Exceedance odds drive the house edge: P(crash >= t) = scale / (t - 0.005) after rounding
+    targets = [1.01, 1.5, 2.0, 5.0, 10.0, 100.0]
+    edges = np.array([0.0] + [t - 0.005 for t in targets] + [np.inf])
+    survival = [1.0] + [min(1.0, scale / e) for e in edges[1:-1]] + [0.0]
+    probs = [survival[i] - survival[i + 1] for i in range(len(survival) - 1)]
+    counts = np.histogram(crash, bins=edges)[0]
+
+    # KS on the uncapped part above 1.00: jitter undoes the 2-decimal rounding
+    lo, hi = 1.005, max_mult - 0.005
+    body = crash[(crash >= 1.01) & (crash < max_mult)]
+    body = body + (np.random.default_rng().random(len(body)) - 0.5) * 0.01
+    body = body[(body >= lo) & (body < hi)]
+
+    def cdf(x):
+        return (1 - lo / x) / (1 - lo / hi)
+
+    return [
+        ("crash point exceedance odds", chi_square(counts, probs)),
+        ("crash point CDF above 1.00", ks_test(body, cdf)),
+        ("win at 2x independence", runs_test(crash >= 2.0)),
+    ]
+
+
+def check_plinko(config, n, rng_for):
+    engine = PlinkoEngine(config)
+    rows = engine.rows
+    drops = _sample(PlinkoEngine, config, n, rng_for)
+    buckets = drops["bucket"].astype(np.int64)
+    # Paths are derived from the drop on request; check them on a subset
+    subset = min(n, max(1, 200_000 // rows))
+    steps = np.array([
+        step for bucket, offset in zip(buckets[:subset].tolist(), drops["drop"][:subset].tolist())
+        for step in engine.path_for(bucket, offset)
+    ])
+    binomial = [math.comb(rows, k) / 2 ** rows for k in range(rows + 1)]
+
+    return [
+        ("bucket ~ Binomial(rows, 1/2)", chi_square(np.bincount(buckets, minlength=rows + 1), binomial)),
+        ("left/right step independence", runs_test(steps == 1)),
+    ]
+
+
+# Engine configurations covered; mines has no random component
+SUITES = {
+    "dice": [(check_dice, {"multiplier": 1.98, "house_edge": 0.02})],
+    "slot": [
+        (check_slot, {"reels": 3, "symbol_map": ["A", "B", "C", "7"]}),
+        (check_slot, {"reels": 5, "symbol_map": ["A", "K", "Q", "J", "10", "7"]}),
+    ],
+    "reel_slot": [
+        (check_reel_slot, DEFAULT_REEL_CONFIG),
+        (check_reel_slot, {**DEFAULT_REEL_CONFIG, "stop_weights": [
+            [1, 2, 3, 4, 5, 1, 2, 3, 4, 5, 1, 1, 2, 3, 4, 5, 6, 1] for _ in range(5)
+        ]}),
+    ],
+    "crash": [
+        (check_crash, {"max_multiplier": 1000, "house_edge": 0.03}),
+        (check_crash, {"max_multiplier": 100, "house_edge": 0.01}),
+    ],
+    "plinko": [
+        (check_plinko, {"rows": 8, "bucket_multipliers": [5, 2, 1, 0.5, 0.2, 0.5, 1, 2, 5]}),
+        (check_plinko, {"rows": 16, "bucket_multipliers": [1] * 17}),
+        (check_plinko, {"rows": 12, "risk_level": "high"}),
+    ],
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tier", choices=sorted(TIERS), default="fast")
+    parser.add_argument("--samples", type=int, help="rounds per configuration (overrides --tier)")
+    parser.add_argument("--engine", choices=sorted(SUITES), action="append", help="repeatable; default all")
+    parser.add_argument("--rng", choices=RNGS, default="batch")
+    parser.add_argument("--alpha", type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    n = args.samples or TIERS[args.tier]
+    failures = 0
+
+    for engine in args.engine or sorted(SUITES):
+        for check, config in SUITES[engine]:
+            started = time.perf_counter()
+            results = check(config, n, _rng_factory(args.rng))
+            elapsed = time.perf_counter() - started
+
+            described = str(config) if len(str(config)) <= 80 else str(config)[:77] + "..."
+            print(f"\n{engine} {described}  n={n:,}  ({elapsed:.1f}s)")
+            for label, result in results:
+                ok = result["p_value"] >= args.alpha
+                failures += not ok
+                print(f"  {'PASS' if ok else 'FAIL'}  {label:<36} "
+                      f"{result['test']:<10} stat={result['statistic']:.4f}  p={result['p_value']:.4f}")
+
+    print(f"\n{'FAILED' if failures else 'OK'}: {failures} test(s) below alpha={args.alpha}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Goodness-of-fit tests used by the engine distribution checks.
+
+Self-contained (math + numpy) so the checks run wherever the engines run.
+Every test returns {"test", "statistic", "p_value", ...}.
+"""
+import math
+
+import numpy as np
+
+
+# ─────────────────────────────
+# Special functions
+# ─────────────────────────────
+def _gamma_q(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+
+    if x < a + 1:
+        # Series for P(a, x)
+        term = total = 1.0 / a
+        n = a
+        for _ in range(10000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # Continued fraction for Q(a, x) (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi2_sf(statistic: float, dof: int) -> float:
+    return _gamma_q(dof / 2, statistic / 2)
+
+
+def kolmogorov_sf(d: float, n: int) -> float:
+    """Asymptotic P(D_n >= d), with Stephens' small-sample correction."""
+    sqrt_n = math.sqrt(n)
+    lam = (sqrt_n + 0.12 + 0.11 / sqrt_n) * d
+    if lam < 0.2:
+        return 1.0
+    total = sum((-1) ** (j - 1) * math.exp(-2 * j * j * lam * lam) for j in range(1, 101))
+    return min(1.0, max(0.0, 2 * total))
+
+
+# ─────────────────────────────
+# Tests
+# ─────────────────────────────
+def chi_square(observed, expected_probs, min_expected: float = 5.0) -> dict:
+    """
+    Pearson chi-square of observed counts against expected probabilities.
+    Adjacent cells with an expected count under `min_expected` are merged.
+    """
+    observed = np.asarray(observed, dtype=np.float64)
+    n = observed.sum()
+    expected = np.asarray(expected_probs, dtype=np.float64) * n
+
+    merged_obs, merged_exp = [], []
+    acc_obs = acc_exp = 0.0
+    for o, e in zip(observed, expected):
+        acc_obs += o
+        acc_exp += e
+        if acc_exp >= min_expected:
+            merged_obs.append(acc_obs)
+            merged_exp.append(acc_exp)
+            acc_obs = acc_exp = 0.0
+    if acc_exp > 0 and merged_exp:
+        merged_obs[-1] += acc_obs
+        merged_exp[-1] += acc_exp
+
+    merged_obs = np.array(merged_obs)
+    merged_exp = np.array(merged_exp)
+    statistic = float(((merged_obs - merged_exp) ** 2 / merged_exp).sum())
+    dof = len(merged_exp) - 1
+
+    return {
+        "test": "chi_square",
+        "statistic": statistic,
+        "dof": dof,
+        "cells": len(merged_exp),
+        "p_value": chi2_sf(statistic, dof) if dof > 0 else 1.0,
+    }
+
+
+def ks_test(samples, cdf) -> dict:
+    """One-sample Kolmogorov-Smirnov against a continuous CDF (vectorized callable)."""
+    x = np.sort(np.asarray(samples, dtype=np.float64))
+    n = len(x)
+    f = cdf(x)
+    i = np.arange(1, n + 1)
+    d = float(max((i / n - f).max(), (f - (i - 1) / n).max()))
+
+    return {"test": "ks", "statistic": d, "n": n, "p_value": kolmogorov_sf(d, n)}
+
+
+def runs_test(flags) -> dict:
+    """Wald-Wolfowitz runs test for independence of a binary sequence."""
+    flags = np.asarray(flags, dtype=bool)
+    n1 = int(flags.sum())
+    n2 = len(flags) - n1
+    if n1 == 0 or n2 == 0:
+        return {"test": "runs", "statistic": 0.0, "p_value": 0.0, "note": "sequence is constant"}
+
+    runs = 1 + int((flags[1:] != flags[:-1]).sum())
+    n = n1 + n2
+    mean = 2 * n1 * n2 / n + 1
+    var = 2 * n1 * n2 * (2 * n1 * n2 - n) / (n * n * (n - 1))
+    z = (runs - mean) / math.sqrt(var)
+
+    return {"test": "runs", "statistic": z, "runs": runs, "p_value": math.erfc(abs(z) / math.sqrt(2))}
@@ -0,0 +1,164 @@
+"""
+Shared fixtures. Run from backend/:
+
+    python -m pytest                      # engine suites; db tests skip
+    TEST_DATABASE_URL=postgresql://... python -m pytest
+
+Database tests rebuild the public schema of TEST_DATABASE_URL from the
+models, so point it at a scratch database, never a real one.
+"""
+import os
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    # Before app.core.config is imported anywhere
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_DATABASE_URL:
+        return
+    skip = pytest.mark.skip(reason="TEST_DATABASE_URL not set")
+    for item in items:
+        if "db" in item.keywords:
+            item.add_marker(skip)
+
+
+# ─────────────────────────────
+# Schema
+# ─────────────────────────────
+@pytest.fixture(scope="session")
+def engine():
+    from sqlalchemy import text
+
+    import app.models as models
+    from app.core.database import Base as CoreBase, SessionLocal, engine
+    from app.services.partition_service import PartitionService
+
+    # bonus / responsible-gaming models live on app.core.database's Base
+    for table in list(CoreBase.metadata.tables.values()):
+        if table.name not in models.Base.metadata.tables:
+            table.to_metadata(models.Base.metadata)
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE; CREATE SCHEMA public"))
+        has_trgm = conn.execute(text(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )).scalar()
+        if has_trgm:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # bet_taxes references tax_rules, which has no model
+    tables = [t for name, t in models.Base.metadata.tables.items() if name != "bet_taxes"]
+    if not has_trgm:
+        for table in tables:
+            for index in [i for i in table.indexes if "trgm" in i.name]:
+                table.indexes.discard(index)
+    models.Base.metadata.create_all(engine, tables=tables)
+
+    db = SessionLocal()
+    PartitionService.ensure_partitions(db, 1)
+    db.close()
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    from sqlalchemy import text
+    from app.core.database import SessionLocal
+
+    with engine.begin() as conn:
+        # Partitions are emptied through their parent
+        tables = conn.execute(text(
+            "SELECT string_agg(quote_ident(c.relname), ', ') FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') AND NOT c.relispartition"
+        )).scalar()
+        conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+# ─────────────────────────────
+# Seed data
+# ─────────────────────────────
+@pytest.fixture
+def casino(db):
+    """One tenant, one funded player, a Mines and a Crash game; returns their ids."""
+    import app.models as models
+
+    now = datetime.now()
+    db.add_all([
+        models.Role(role_id=3, role_name="GAME_PROVIDER"),
+        models.Role(role_id=4, role_name="PLAYER"),
+        models.Currency(currency_id=1, currency_code="USD", currency_name="US Dollar"),
+        models.WalletType(wallet_type_id=1, wallet_type_code="CASH"),
+        models.WalletType(wallet_type_id=2, wallet_type_code="BONUS"),
+        models.GameCategory(category_id=1, category_name="Casual"),
+    ])
+    db.add_all([
+        models.TransactionType(transaction_type_id=i, transaction_code=code, direction=direction)
+        for i, (code, direction) in enumerate([
+            ("bet", "debit"), ("win", "credit"), ("jackpot_payout", "credit"), ("jackpot_refund", "credit"),
+        ], 1)
+    ])
+    db.flush()
+
+    tenant = models.Tenant(tenant_name="Test Casino", domain="test", status="active", created_at=now, updated_at=now)
+    provider_user = models.User(email="provider@test", password_hash="x", role_id=3, kyc_status="verified")
+    player_user = models.User(email="player@test", password_hash="x", role_id=4, kyc_status="verified")
+    db.add_all([tenant, provider_user, player_user])
+    db.flush()
+
+    db.add(models.GameProvider(provider_id=provider_user.user_id, provider_name="Test Provider"))
+    db.add(models.Player(player_id=player_user.user_id, created_at=now, updated_at=now))
+    db.flush()
+    for wallet_type_id, balance in ((1, Decimal("1000")), (2, Decimal("0"))):
+        db.add(models.Wallet(
+            player_id=player_user.user_id, tenant_id=tenant.tenant_id, currency_id=1,
+            wallet_type_id=wallet_type_id, balance=balance, is_active=True, created_at=now, updated_at=now
+        ))
+
+    games = {}
+    for engine_type, config in (("mines", {"grid_size": 25, "mine_count": 3}), ("crash", {})):
+        game = models.Game(
+            provider_id=provider_user.user_id, category_id=1, game_name=engine_type.title(),
+            game_code=engine_type.upper(), rtp_percentage=97, volatility="medium", min_bet=1, max_bet=100,
+            status="active", engine_type=engine_type, engine_config=config,
+        )
+        db.add(game)
+        db.flush()
+        db.add(models.TenantGame(
+            tenant_id=tenant.tenant_id, game_id=game.game_id, is_active=True, status="active",
+            created_at=now, updated_at=now
+        ))
+        games[engine_type] = game.game_id
+    db.commit()
+
+    return {
+        "tenant_id": tenant.tenant_id,
+        "player_id": player_user.user_id,
+        "game_id": games["mines"],
+        "crash_game_id": games["crash"],
+    }
+
+
+@pytest.fixture
+def cash_balance(db):
+    """cash_balance(player_id) -> the player's CASH wallet balance as committed."""
+    from app.models.wallet import Wallet
+
+    def read(player_id: uuid.UUID) -> Decimal:
+        db.expire_all()
+        return db.query(Wallet.balance).filter(
+            Wallet.player_id == player_id, Wallet.wallet_type_id == 1
+        ).scalar()
+
+    return read
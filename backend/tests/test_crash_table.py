@@ -0,0 +1,127 @@
+"""Shared crash table rounds: limits, jackpot split and rounds left open by their table."""
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.models.bonus import Bonus
+from app.models.bonus_usage import BonusUsage
+from app.models.game_round import GameRound
+from app.models.jackpot import Jackpot
+from app.models.jackpot_contribution import JackpotContribution
+from app.models.jackpot_pool_shard import JackpotPoolShard
+from app.models.player_limit import PlayerLimit
+from app.models.wallet import Wallet
+from app.services.crash_table_service import CrashTableBet, CrashTableService
+from app.services.wallet_service import WalletService
+
+pytestmark = pytest.mark.db
+
+
+@pytest.fixture
+def table(db, casino):
+    return CrashTableService._load_table(casino["tenant_id"], casino["crash_game_id"])
+
+
+def bet(db, casino, amount: float, auto_cashout: float | None, opt_in: bool = False) -> CrashTableBet:
+    wallet = WalletService.get_wallet(db, casino["player_id"], "CASH", casino["tenant_id"])
+    db.rollback()
+    return CrashTableBet(casino["player_id"], wallet.wallet_id, wallet.currency_id, amount, auto_cashout, opt_in)
+
+
+def test_stranded_rounds_are_recovered_once(db, casino, table, cash_balance):
+    before = cash_balance(casino["player_id"])
+    # One bet per player per table round: two rounds, one with an auto cash-out
+    auto, manual = bet(db, casino, 10, auto_cashout=1.5), bet(db, casino, 20, auto_cashout=None)
+    for placed in (auto, manual):
+        CrashTableService._begin_betting(table)
+        table.crash_point = 2.0
+        assert CrashTableService.open_round(table, [placed]) == {casino["player_id"]}
+    assert cash_balance(casino["player_id"]) == before - 30
+
+    # Not before the rounds could have crashed
+    assert CrashTableService.recover_stranded(db) == 0
+
+    # The table died before settling: the auto cash-out pays, the other stake is refunded
+    later = time.time() + 3600
+    assert CrashTableService.recover_stranded(db, now=later) == 2
+    assert cash_balance(casino["player_id"]) == before - 30 + 15 + 20
+    outcomes = sorted(row.outcome for row in db.query(GameRound.outcome).all())
+    assert outcomes == ["VOID", "WIN"]
+
+    # Neither a second pass nor a late table settlement pays again
+    assert CrashTableService.recover_stranded(db, now=later) == 0
+    manual.cashed_out_at = 1.8
+    CrashTableService.settle_round(table, [manual])
+    assert cash_balance(casino["player_id"]) == before + 5
+
+
+def test_voided_stranded_rounds_are_no_wager(db, casino, table):
+    now = datetime.now()
+    bonus = Bonus(
+        tenant_id=casino["tenant_id"], bonus_name="Welcome", bonus_type="FIXED_CREDIT", bonus_amount=10,
+        wagering_multiplier=10, valid_from=now - timedelta(days=1), valid_to=now + timedelta(days=1),
+    )
+    wager_limit = PlayerLimit(
+        player_id=casino["player_id"], tenant_id=casino["tenant_id"], limit_type="WAGER",
+        limit_value=500, period="DAILY", status="ACTIVE", current_usage=0, effective_at=now, period_start=now,
+    )
+    db.add_all([bonus, wager_limit])
+    db.flush()
+    bonus_wallet = db.query(Wallet).filter(Wallet.player_id == casino["player_id"], Wallet.wallet_type_id == 2).one()
+    usage = BonusUsage(
+        bonus_id=bonus.bonus_id, player_id=casino["player_id"], wallet_id=bonus_wallet.wallet_id,
+        bonus_amount=10, wagering_required=100, wagering_completed=0, status="active",
+    )
+    db.add(usage)
+    db.commit()
+
+    auto, manual = bet(db, casino, 10, auto_cashout=1.5), bet(db, casino, 20, auto_cashout=None)
+    for placed in (auto, manual):
+        CrashTableService._begin_betting(table)
+        table.crash_point = 2.0
+        CrashTableService.open_round(table, [placed])
+    assert CrashTableService.recover_stranded(db, now=time.time() + 3600) == 2
+
+    # Only the auto cash-out was a wager; the refunded stake is no win either
+    db.expire_all()
+    assert usage.wagering_completed == 10
+    assert wager_limit.current_usage == 10
+    snapshot = db.query(AnalyticsSnapshot).one()
+    assert (snapshot.total_bets, snapshot.total_wins) == (10, 15)
+
+
+def test_bets_respect_the_session_limit(db, casino, table):
+    now = datetime.now()
+    db.add(PlayerLimit(
+        player_id=casino["player_id"], tenant_id=casino["tenant_id"], limit_type="SESSION",
+        limit_value=60, period="DAILY", status="ACTIVE", current_usage=60, effective_at=now, period_start=now,
+    ))
+    db.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        CrashTableService._validate_bet(db, table, casino["player_id"], 10)
+    assert "Session limit exceeded" in exc.value.detail
+
+
+def test_opted_in_bets_feed_the_jackpot(db, casino, table, cash_balance):
+    db.add(Jackpot(
+        tenant_id=casino["tenant_id"], currency_id=1, jackpot_name="Progressive", jackpot_type="PROGRESSIVE",
+        status="ACTIVE", seed_amount=100, current_amount=100, contribution_percentage=10, opt_in_required=True,
+    ))
+    db.commit()
+    before = cash_balance(casino["player_id"])
+
+    CrashTableService._begin_betting(table)
+    table.crash_point = 3.0
+    placed = bet(db, casino, 10, auto_cashout=2.0, opt_in=True)
+    CrashTableService.open_round(table, [placed])
+    CrashTableService.settle_round(table, [placed])
+
+    assert db.query(JackpotContribution.amount).scalar() == Decimal("1.00")
+    assert sum(s.pending_amount for s in db.query(JackpotPoolShard).all()) == Decimal("1.00")
+    # 2x on the 9.00 game stake
+    assert cash_balance(casino["player_id"]) == before - 10 + 18
@@ -0,0 +1,53 @@
+"""engine_checks' fast tier as tests: each engine's outcomes follow its intended distribution."""
+import numpy as np
+import pytest
+
+from engine_checks.run_checks import SUITES, TIERS, _rng_factory, check_dice
+
+pytestmark = pytest.mark.slow
+
+# ~50 tests per run: a stricter bar than the CLI's 0.001 keeps false alarms rare
+ALPHA = 1e-4
+
+CASES = [
+    pytest.param(check, config, id=f"{engine}-{i}")
+    for engine, suite in sorted(SUITES.items())
+    for i, (check, config) in enumerate(suite)
+]
+
+
+def failures(results) -> list[str]:
+    return [f"{label}: p={result['p_value']:.2g}" for label, result in results if result["p_value"] < ALPHA]
+
+
+# ─────────────────────────────
+# Distributions
+# ─────────────────────────────
+@pytest.mark.parametrize("check, config", CASES)
+def test_run_many_distribution(check, config):
+    assert not failures(check(config, TIERS["fast"], _rng_factory("batch")))
+
+
+@pytest.mark.parametrize("check, config", CASES)
+def test_run_distribution(check, config):
+    # The per-round path player rounds take
+    assert not failures(check(config, TIERS["fast"], _rng_factory("secure")))
+
+
+# ─────────────────────────────
+# The checks themselves
+# ─────────────────────────────
+class LoadedDie:
+    """Generator stand-in for DiceEngine.run_many that rolls a six twice as often."""
+
+    def __init__(self):
+        self.rng = np.random.default_rng(7)
+
+    def integers(self, low, high, size, dtype):
+        return self.rng.choice([1, 2, 3, 4, 5, 6, 6], size=size).astype(dtype)
+
+
+def test_biased_engine_fails(monkeypatch):
+    monkeypatch.setattr("engine_checks.run_checks.batch_generator", LoadedDie)
+    results = check_dice({"multiplier": 1.98, "house_edge": 0.02}, TIERS["fast"], _rng_factory("batch"))
+    assert [f for f in failures(results) if f.startswith("roll uniform")]
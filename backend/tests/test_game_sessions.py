@@ -0,0 +1,68 @@
+"""Game sessions: round numbering and sessions closed under a waiting bet."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.game_round import GameRound
+from app.models.game_session import GameSession
+from app.services.game_session_service import GameSessionService
+from app.services.gameplay_service import GameplayService
+from app.services.interactive_round_service import InteractiveRoundService
+
+pytestmark = pytest.mark.db
+
+
+def start(db, casino) -> dict:
+    return InteractiveRoundService.start(db, casino["player_id"], casino["tenant_id"], casino["game_id"], 10)
+
+
+def session_of(db, round_id) -> GameSession:
+    db.expire_all()
+    return db.query(GameSession).join(GameRound, GameRound.session_id == GameSession.session_id).filter(
+        GameRound.round_id == round_id
+    ).one()
+
+
+def test_concurrent_bets_number_rounds_without_gaps(db, casino):
+    def play(bets: int):
+        session = SessionLocal()
+        try:
+            for _ in range(bets):
+                GameplayService.play_game(session, casino["player_id"], casino["tenant_id"], casino["crash_game_id"], 1)
+        finally:
+            session.close()
+
+    # One bet opens the session (round 1), then 8 threads x 20 bets race on its counter
+    play(1)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(play, [20] * 8))
+
+    numbers = [n for (n,) in db.query(GameRound.round_number).order_by(GameRound.round_number)]
+    assert numbers == list(range(1, 162))
+    assert db.query(GameSession.round_count).scalar() == 161
+
+
+def test_bet_waiting_on_an_expiring_session_opens_a_new_one(db, casino):
+    first = session_of(db, start(db, casino)["round_id"])
+    db.rollback()
+
+    # The reaper is closing the session (row locked, not yet committed) as the next bet comes in
+    reaper = SessionLocal()
+    GameSessionService.end_sessions(reaper, [first.session_id], status="expired", now=datetime.now())
+
+    def finish_reaping():
+        time.sleep(0.5)
+        reaper.commit()
+        reaper.close()
+
+    threading.Thread(target=finish_reaping).start()
+    second = session_of(db, start(db, casino)["round_id"])
+
+    assert second.session_id != first.session_id
+    assert (second.status, second.round_count) == ("active", 1)
+    db.refresh(first)
+    assert (first.status, first.round_count) == ("expired", 1)
@@ -0,0 +1,202 @@
+"""Mines rounds driven step by step: repeated steps, settled rounds and the reaper."""
+import logging
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.models.analytics_snapshot import AnalyticsSnapshot
+from app.models.bonus import Bonus
+from app.models.bonus_usage import BonusUsage
+from app.models.game_round import GameRound
+from app.models.jackpot import Jackpot
+from app.models.jackpot_contribution import JackpotContribution
+from app.models.jackpot_pool_shard import JackpotPoolShard
+from app.models.player_limit import PlayerLimit
+from app.models.wallet import Wallet
+from app.services.interactive_round_service import InteractiveRoundService
+from app.services.round_state_store import RoundState
+from app.workers import round_reaper
+
+pytestmark = pytest.mark.db
+
+
+@pytest.fixture
+def start(db, casino):
+    def start_round(bet_amount: float = 10, opt_in: bool = False) -> dict:
+        return InteractiveRoundService.start(
+            db, casino["player_id"], casino["tenant_id"], casino["game_id"], bet_amount, opt_in=opt_in
+        )
+    return start_round
+
+
+def layout(round_id) -> list[int]:
+    return InteractiveRoundService._store.get(round_id).secret["layout"]
+
+
+def safe_cell(round_id) -> int:
+    mines = layout(round_id)
+    return next(cell for cell in range(25) if cell not in mines)
+
+
+def after_ttl() -> float:
+    return time.time() + settings.interactive_round_ttl_seconds + 1
+
+
+# ─────────────────────────────
+# Player steps
+# ─────────────────────────────
+def test_double_reveal_is_rejected(db, casino, start):
+    opened = start()
+    cell = safe_cell(opened["round_id"])
+
+    first = InteractiveRoundService.reveal(db, casino["player_id"], opened["round_id"], cell)
+    with pytest.raises(HTTPException) as exc:
+        InteractiveRoundService.reveal(db, casino["player_id"], opened["round_id"], cell)
+
+    assert exc.value.status_code == 400
+    state = InteractiveRoundService.get_state(db, casino["player_id"], opened["round_id"])
+    assert state["revealed"] == [cell]
+    assert state["step"] == first["step"]
+
+
+def test_reveal_after_cashout_is_rejected(db, casino, start, cash_balance):
+    opened = start()
+    InteractiveRoundService.reveal(db, casino["player_id"], opened["round_id"], safe_cell(opened["round_id"]))
+    settled = InteractiveRoundService.cashout(db, casino["player_id"], opened["round_id"])
+    balance = cash_balance(casino["player_id"])
+
+    for step in (
+        lambda: InteractiveRoundService.reveal(db, casino["player_id"], opened["round_id"], 0),
+        lambda: InteractiveRoundService.cashout(db, casino["player_id"], opened["round_id"]),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            step()
+        assert exc.value.status_code == 404
+
+    assert settled["outcome"] == "WIN"
+    assert cash_balance(casino["player_id"]) == balance == Decimal(str(settled["balance"]))
+
+
+def test_step_on_a_stale_server_is_retried(db, casino, start):
+    opened = start()
+    round_id = opened["round_id"]
+    mines = layout(round_id)
+    first, second = [cell for cell in range(25) if cell not in mines][:2]
+
+    # This server cached the round, then the player's first click went to another one
+    row = db.query(GameRound.bet_amount, GameRound.result_data).filter(GameRound.round_id == round_id).one()
+    config = InteractiveRoundService._store.get(round_id).config
+    stale_view = RoundState.from_checkpoint(round_id, float(row.bet_amount), config, row.result_data)
+    db.rollback()
+    InteractiveRoundService.reveal(db, casino["player_id"], round_id, first)
+    InteractiveRoundService._store.put(stale_view)
+
+    state = InteractiveRoundService.reveal(db, casino["player_id"], round_id, second)
+
+    assert state["revealed"] == [first, second]
+    assert state["step"] == opened["step"] + 2
+
+
+# ─────────────────────────────
+# Reaper
+# ─────────────────────────────
+def test_reap_racing_cashout_settles_once(db, casino, start, cash_balance, monkeypatch, caplog):
+    opened = start()
+    round_id = opened["round_id"]
+    InteractiveRoundService.reveal(db, casino["player_id"], round_id, safe_cell(round_id))
+
+    # Another process's reaper picked the round up and cached it from the checkpoint ...
+    row = db.query(GameRound.bet_amount, GameRound.result_data).filter(GameRound.round_id == round_id).one()
+    config = InteractiveRoundService._store.get(round_id).config
+    reaper_view = RoundState.from_checkpoint(round_id, float(row.bet_amount), config, row.result_data)
+    db.rollback()
+
+    # ... just before the player cashed out here
+    settled = InteractiveRoundService.cashout(db, casino["player_id"], round_id)
+    InteractiveRoundService._store.put(reaper_view)
+
+    with pytest.raises(HTTPException) as exc:
+        InteractiveRoundService.settle_if_abandoned(db, round_id, now=after_ttl())
+    assert exc.value.status_code == 409
+
+    # The worker treats the lost race as routine, not as an error
+    InteractiveRoundService._store.put(reaper_view)
+    monkeypatch.setattr(InteractiveRoundService, "open_round_ids", staticmethod(lambda db, limit: [round_id]))
+    monkeypatch.setattr(settings, "interactive_round_ttl_seconds", 0)
+    with caplog.at_level(logging.ERROR, logger=round_reaper.__name__):
+        assert round_reaper.reap_rounds_once() == 0
+    assert not caplog.records
+
+    assert cash_balance(casino["player_id"]) == Decimal(str(settled["balance"]))
+
+
+def test_abandoned_round_without_picks_is_void(db, casino, start, cash_balance):
+    now = datetime.now()
+    jackpot = Jackpot(
+        tenant_id=casino["tenant_id"], currency_id=1, jackpot_name="Progressive", jackpot_type="PROGRESSIVE",
+        status="ACTIVE", seed_amount=100, current_amount=100, contribution_percentage=10, opt_in_required=True,
+    )
+    loss_limit = PlayerLimit(
+        player_id=casino["player_id"], tenant_id=casino["tenant_id"], limit_type="LOSS",
+        limit_value=500, period="DAILY", status="ACTIVE", current_usage=0, effective_at=now, period_start=now,
+    )
+    db.add_all([jackpot, loss_limit])
+    db.commit()
+    before = cash_balance(casino["player_id"])
+
+    opened = start(bet_amount=10, opt_in=True)
+    assert db.query(JackpotContribution).count() == 1
+    settled = InteractiveRoundService.settle_if_abandoned(db, opened["round_id"], now=after_ttl())
+
+    assert settled["outcome"] == "VOID"
+    assert settled["win_amount"] == 10
+    assert cash_balance(casino["player_id"]) == before
+    assert db.query(JackpotContribution).count() == 0
+    assert sum(s.pending_amount for s in db.query(JackpotPoolShard).all()) == 0
+    db.refresh(loss_limit)
+    assert loss_limit.current_usage == 0
+    assert db.query(AnalyticsSnapshot).count() == 0
+
+
+def test_void_round_counts_no_wagering(db, casino, start):
+    now = datetime.now()
+    bonus = Bonus(
+        tenant_id=casino["tenant_id"], bonus_name="Welcome", bonus_type="FIXED_CREDIT", bonus_amount=10,
+        wagering_multiplier=2, valid_from=now - timedelta(days=1), valid_to=now + timedelta(days=1),
+    )
+    wager_limit = PlayerLimit(
+        player_id=casino["player_id"], tenant_id=casino["tenant_id"], limit_type="WAGER",
+        limit_value=500, period="DAILY", status="ACTIVE", current_usage=0, effective_at=now, period_start=now,
+    )
+    db.add_all([bonus, wager_limit])
+    db.flush()
+    bonus_wallet = db.query(Wallet).filter(Wallet.player_id == casino["player_id"], Wallet.wallet_type_id == 2).one()
+    usage = BonusUsage(
+        bonus_id=bonus.bonus_id, player_id=casino["player_id"], wallet_id=bonus_wallet.wallet_id,
+        bonus_amount=10, wagering_required=20, wagering_completed=0, status="active",
+    )
+    db.add(usage)
+    db.commit()
+
+    opened = start(bet_amount=20)
+    db.refresh(wager_limit)
+    assert wager_limit.current_usage == 20
+
+    settled = InteractiveRoundService.settle_if_abandoned(db, opened["round_id"], now=after_ttl())
+
+    assert settled["outcome"] == "VOID"
+    db.refresh(usage)
+    db.refresh(wager_limit)
+    assert (usage.wagering_completed, usage.status) == (0, "active")
+    assert wager_limit.current_usage == 0
+
+    # A round that is played out does count
+    played = start(bet_amount=20)
+    InteractiveRoundService.reveal(db, casino["player_id"], played["round_id"], safe_cell(played["round_id"]))
+    InteractiveRoundService.cashout(db, casino["player_id"], played["round_id"])
+    db.refresh(usage)
+    assert (usage.wagering_completed, usage.status) == (20, "eligible")
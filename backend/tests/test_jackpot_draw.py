@@ -0,0 +1,177 @@
+"""Jackpot draws: the contribution window, recurring cycles and failing draws."""
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.jackpot import Jackpot
+from app.models.jackpot_contribution import JackpotContribution
+from app.models.jackpot_pool_shard import JackpotPoolShard
+from app.models.jackpot_win import JackpotWin
+from app.models.player import Player
+from app.models.transaction_type import TransactionType
+from app.models.user import User
+from app.models.wallet_transaction import WalletTransaction
+from app.services.jackpot_pool_accumulator import JackpotPoolAccumulator
+from app.services.jackpot_service import DRAW_RETRY_BASE_SECONDS, MAX_DRAW_FAILURES, JackpotService
+from app.workers.jackpot_pool_flusher import flush_once
+
+pytestmark = pytest.mark.db
+
+
+@pytest.fixture
+def progressive(db, casino):
+    jackpot = Jackpot(
+        tenant_id=casino["tenant_id"], currency_id=1, jackpot_name="Progressive", jackpot_type="PROGRESSIVE",
+        status="ACTIVE", seed_amount=100, current_amount=500, contribution_percentage=1, opt_in_required=True,
+    )
+    db.add(jackpot)
+    db.commit()
+    return jackpot
+
+
+def test_draw_is_bounded_by_the_previous_watermark(db, casino, progressive):
+    now = datetime.now()
+    previous_draw = now - timedelta(days=1)
+    last_cycle_player = User(email="last-cycle@test", password_hash="x", role_id=4, kyc_status="verified")
+    db.add(last_cycle_player)
+    db.flush()
+    db.add(Player(player_id=last_cycle_player.user_id, created_at=now, updated_at=now))
+    db.flush()
+
+    # Already drawn in the previous cycle: must not make the population 2
+    earlier_cycle = JackpotContribution(
+        jackpot_id=progressive.jackpot_id, player_id=last_cycle_player.user_id, amount=Decimal("1000"),
+        contributed_at=previous_draw - timedelta(hours=1),
+    )
+    this_cycle = JackpotContribution(
+        jackpot_id=progressive.jackpot_id, player_id=casino["player_id"], amount=Decimal("1"),
+        contributed_at=now - timedelta(hours=1),
+    )
+    db.add_all([earlier_cycle, this_cycle, JackpotWin(
+        jackpot_id=progressive.jackpot_id, player_id=casino["player_id"], win_amount=Decimal("100"),
+        won_at=previous_draw, contributions_until=previous_draw,
+    )])
+    db.commit()
+
+    result = JackpotService.draw_winner(db, progressive.jackpot_id)
+
+    win = db.query(JackpotWin).filter(JackpotWin.won_at > previous_draw).one()
+    assert result["winner_id"] == str(casino["player_id"])
+    assert win.population_size == 1
+    assert win.contributions_from == previous_draw
+    assert previous_draw < win.contributions_until <= datetime.now()
+
+
+def test_contributions_after_the_watermark_are_not_drawn(db, casino, progressive):
+    db.add(JackpotContribution(
+        jackpot_id=progressive.jackpot_id, player_id=casino["player_id"], amount=Decimal("1"),
+        contributed_at=datetime.now() + timedelta(minutes=5),
+    ))
+    db.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        JackpotService.draw_winner(db, progressive.jackpot_id)
+    assert exc.value.status_code == 404
+
+
+def contribute(db, jackpot, player_id):
+    db.add(JackpotContribution(
+        jackpot_id=jackpot.jackpot_id, player_id=player_id, amount=Decimal("1"),
+        contributed_at=datetime.now() - timedelta(minutes=1),
+    ))
+    db.commit()
+
+
+def test_recurring_progressive_is_reseeded(db, casino, progressive):
+    deadline = datetime.now() - timedelta(minutes=1)
+    progressive.reset_cycle, progressive.deadline = "DAILY", deadline
+    db.commit()
+    contribute(db, progressive, casino["player_id"])
+
+    assert JackpotService.run_scheduled_draw(db, progressive.jackpot_id, datetime.now())["amount"] == 500
+
+    db.refresh(progressive)
+    assert progressive.status == "ACTIVE"
+    assert progressive.current_amount == progressive.seed_amount
+    assert progressive.deadline == deadline + timedelta(days=1)
+
+
+def test_failing_draw_backs_off_then_pauses(db, casino, progressive):
+    progressive.deadline = datetime.now() - timedelta(minutes=1)
+    db.commit()
+    contribute(db, progressive, casino["player_id"])
+    # Payout cannot be booked
+    db.query(TransactionType).filter(TransactionType.transaction_code == "jackpot_payout").delete()
+    db.commit()
+
+    now = datetime.now()
+    with pytest.raises(HTTPException):
+        JackpotService.run_scheduled_draw(db, progressive.jackpot_id, now)
+    db.refresh(progressive)
+    assert progressive.draw_failures == 1
+    assert progressive.next_draw_at == now + timedelta(seconds=DRAW_RETRY_BASE_SECONDS)
+    assert JackpotService.due_jackpots(db, now) == []
+    assert JackpotService.due_jackpots(db, progressive.next_draw_at) != []
+
+    for _ in range(MAX_DRAW_FAILURES - 1):
+        with pytest.raises(HTTPException):
+            JackpotService.run_scheduled_draw(db, progressive.jackpot_id, datetime.now() + timedelta(days=1))
+    db.refresh(progressive)
+    assert progressive.status == "PAUSED"
+
+    # An operator's manual draw, once the cause is fixed, resumes it
+    db.add(TransactionType(transaction_type_id=3, transaction_code="jackpot_payout", direction="credit"))
+    db.commit()
+    JackpotService.draw_winner(db, progressive.jackpot_id)
+    db.refresh(progressive)
+    assert progressive.status == "COMPLETED"
+    assert progressive.draw_failures == 0
+
+
+def test_late_contributions_to_a_completed_pool_are_refunded(db, casino, progressive, cash_balance):
+    contribute(db, progressive, casino["player_id"])
+    JackpotService.draw_winner(db, progressive.jackpot_id)
+    db.refresh(progressive)
+    assert progressive.status == "COMPLETED"
+    balance = cash_balance(casino["player_id"])
+
+    # A bet that still had the pool cached as the active progressive
+    bet_id = uuid.uuid4()
+    db.add(JackpotContribution(
+        jackpot_id=progressive.jackpot_id, player_id=casino["player_id"], amount=Decimal("2.50"), bet_id=bet_id,
+        contributed_at=datetime.now() + timedelta(seconds=1),
+    ))
+    JackpotPoolAccumulator.add(db, progressive.jackpot_id, Decimal("2.50"), shard_key=bet_id)
+    db.commit()
+
+    assert flush_once() == {}
+
+    db.expire_all()
+    assert progressive.current_amount == 500
+    assert sum(s.pending_amount for s in db.query(JackpotPoolShard).all()) == 0
+    assert db.query(JackpotContribution).filter(JackpotContribution.bet_id == bet_id).count() == 0
+    assert cash_balance(casino["player_id"]) == balance + Decimal("2.50")
+    refund = db.query(TransactionType.transaction_code).join(
+        WalletTransaction, WalletTransaction.transaction_type_id == TransactionType.transaction_type_id
+    ).filter(WalletTransaction.amount == Decimal("2.50")).one()
+    assert refund.transaction_code == "jackpot_refund"
+
+
+def test_voided_bet_leaves_a_paused_pool(db, casino, progressive):
+    bet_id = uuid.uuid4()
+    db.add(JackpotContribution(
+        jackpot_id=progressive.jackpot_id, player_id=casino["player_id"], amount=Decimal("2.50"), bet_id=bet_id,
+        contributed_at=datetime.now(),
+    ))
+    JackpotPoolAccumulator.add(db, progressive.jackpot_id, Decimal("2.50"), shard_key=bet_id)
+    progressive.status = "PAUSED"
+    db.commit()
+
+    assert JackpotService.reverse_contributions(db, [bet_id]) == Decimal("2.50")
+    db.commit()
+
+    assert sum(s.pending_amount for s in db.query(JackpotPoolShard).all()) == 0
+    assert db.query(JackpotContribution).count() == 0
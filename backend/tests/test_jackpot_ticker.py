@@ -0,0 +1,88 @@
+"""Live jackpot stream: pushed by the flusher and draws, opened with a stream token."""
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import STREAM_TOKEN_SCOPE, _user_from_token, create_access_token, create_stream_token
+from app.core.database import SessionLocal
+from app.models.jackpot import Jackpot
+from app.services.jackpot_pool_accumulator import JackpotPoolAccumulator
+from app.services.jackpot_ticker import JackpotTicker
+from app.workers.jackpot_pool_flusher import flush_once
+
+pytestmark = pytest.mark.db
+
+
+def frame_data(frame: str):
+    event, data = frame.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+async def next_frame(stream) -> tuple[str, object]:
+    return frame_data(await asyncio.wait_for(stream.__anext__(), timeout=5))
+
+
+# ─────────────────────────────
+# Push
+# ─────────────────────────────
+def test_flush_and_win_are_pushed(db, casino):
+    jackpot = Jackpot(
+        tenant_id=casino["tenant_id"], currency_id=1, jackpot_name="Progressive", jackpot_type="PROGRESSIVE",
+        status="ACTIVE", seed_amount=100, current_amount=100, contribution_percentage=1,
+    )
+    db.add(jackpot)
+    db.commit()
+
+    def contribute():
+        session = SessionLocal()
+        try:
+            JackpotPoolAccumulator.add(session, jackpot.jackpot_id, Decimal("7.50"))
+            session.commit()
+        finally:
+            session.close()
+        flush_once()
+
+    def announce():
+        session = SessionLocal()
+        try:
+            JackpotTicker.notify_win(session, casino["tenant_id"], {"jackpot_id": str(jackpot.jackpot_id)})
+            session.commit()
+        finally:
+            session.close()
+
+    async def scenario():
+        stream = JackpotTicker.stream(casino["tenant_id"])
+        try:
+            assert await next_frame(stream) == ("pools", [{
+                "jackpot_id": str(jackpot.jackpot_id), "jackpot_name": "Progressive",
+                "jackpot_type": "PROGRESSIVE", "current_amount": 100.0, "deadline": None,
+            }])
+
+            await asyncio.to_thread(contribute)
+            event, pools = await next_frame(stream)
+            assert (event, pools[0]["current_amount"]) == ("pools", 107.5)
+
+            await asyncio.to_thread(announce)
+            assert await next_frame(stream) == ("win", {"jackpot_id": str(jackpot.jackpot_id)})
+        finally:
+            await stream.aclose()
+
+    asyncio.run(scenario())
+    assert JackpotTicker._channels == {}
+
+
+# ─────────────────────────────
+# Stream tokens
+# ─────────────────────────────
+def test_stream_tokens_only_open_streams(db, casino):
+    stream_token = create_stream_token(casino["player_id"])
+    session_token = create_access_token({"sub": str(casino["player_id"])})
+
+    assert _user_from_token(db, stream_token, STREAM_TOKEN_SCOPE).user_id == casino["player_id"]
+    for token, scope in ((stream_token, None), (session_token, STREAM_TOKEN_SCOPE)):
+        with pytest.raises(HTTPException) as exc:
+            _user_from_token(db, token, scope)
+        assert exc.value.status_code == 401
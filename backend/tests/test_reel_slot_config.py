@@ -0,0 +1,28 @@
+"""Reel slot configs are rejected up front instead of playing something else or failing mid-spin."""
+import pytest
+
+from app.game_engines.reel_slot_engine import DEFAULT_REEL_CONFIG
+from app.game_engines.registry import EngineConfigError, engine_registry
+
+
+def test_reference_config_builds():
+    assert engine_registry.engine("reel_slot", DEFAULT_REEL_CONFIG).compiled.reels == 5
+
+
+@pytest.mark.parametrize("config", [{}, {"rows": 3, "paytable": {"A": {"3": 5}}}])
+def test_missing_reel_strips_is_rejected(config):
+    with pytest.raises(EngineConfigError) as exc:
+        engine_registry.engine("reel_slot", config)
+    assert "reel_strips" in str(exc.value)
+
+
+@pytest.mark.parametrize("override, field", [
+    ({"paytable": {"A": {"6": 10}}}, "paytable"),
+    ({"paytable": {"A": {"0": 10}}}, "paytable"),
+    ({"scatter_pays": {"16": 100}}, "scatter_pays"),
+    ({"scatter_pays": {"three": 5}}, "scatter_pays"),
+])
+def test_pay_counts_outside_the_grid_are_rejected(override, field):
+    with pytest.raises(EngineConfigError) as exc:
+        engine_registry.engine("reel_slot", {**DEFAULT_REEL_CONFIG, **override})
+    assert field in str(exc.value)
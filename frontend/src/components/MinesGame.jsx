@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import confetti from 'canvas-confetti';
 import { Bomb, Gem, Coins, Trophy, RefreshCcw } from 'lucide-react';
@@ -11,9 +11,9 @@ export default function MinesGame({ gameId, optIn, tenantId }) {
   
   // Game Configuration
   const [betAmount, setBetAmount] = useState(10);
-  const [mineCount, setMineCount] = useState(3);
   
-  // Game State
+  // Game State (mine layout and outcome live on the server; see /gameplay/rounds)
+  const [round, setRound] = useState(null);
   const [grid, setGrid] = useState(Array(25).fill(null));
   const [isGameActive, setIsGameActive] = useState(false);
   const [loading, setLoading] = useState(false);
@@ -21,93 +21,107 @@ export default function MinesGame({ gameId, optIn, tenantId }) {
   const [lastWin, setLastWin] = useState(0);
   const [gameOver, setGameOver] = useState(false);
 
-  // Audio/Visual feedback logic
-  const handleTileClick = (index) => {
-    if (!isGameActive || grid[index] !== null || gameOver) return;
+  // Reveal the whole board once the server settles the round
+  const showSettled = (data) => {
+    const { layout = [], revealed = [], hit } = data.game_data || {};
+    setGrid(prev => prev.map((_, i) =>
+      i === hit || layout.includes(i) ? 'mine' : revealed.includes(i) ? 'gem' : null
+    ));
+    setSuccessfulPicks(revealed.length);
+    updateBalance(data.balance);
+    setIsGameActive(false);
+    setGameOver(true);
+    setRound(null);
 
-    // Frontend "Probability" Logic 
-    // (Actual win is verified by backend upon cashout)
-    const isMine = Math.random() < (mineCount / (25 - successfulPicks));
-    
-    const newGrid = [...grid];
-    if (isMine) {
-      newGrid[index] = 'mine';
-      setGrid(newGrid);
-      handleLoss();
+    if (data.outcome === 'WIN') {
+      setLastWin(data.win_amount);
+      confetti({
+        particleCount: 150,
+        spread: 70,
+        origin: { y: 0.6 },
+        colors: ['#6366f1', '#10b981', '#ffffff']
+      });
     } else {
-      newGrid[index] = 'gem';
-      setGrid(newGrid);
-      setSuccessfulPicks(prev => prev + 1);
+      toast.error("BOOM! You hit a mine.");
     }
   };
 
-const handleStartGame = () => {
-    if (balance < betAmount) return toast.error("Insufficient balance");
-    
-    // Visually deduct money immediately (Optimistic Update)
-    // This makes the UI feel responsive, even though the API call happens later
-    updateBalance(balance - betAmount);
+  // After a 409 the board may be behind the server: pick the round up as it stands
+  const resync = async () => {
+    try {
+      const res = await api.get(`/gameplay/rounds/${round.round_id}`);
+      setRound(res.data);
+      setGrid(prev => prev.map((_, i) => (res.data.revealed.includes(i) ? 'gem' : null)));
+      setSuccessfulPicks(res.data.revealed.length);
+    } catch (err) {
+      // Settled meanwhile (e.g. by the idle-round reaper)
+      setIsGameActive(false);
+      setRound(null);
+    }
+  };
 
-    setGrid(Array(25).fill(null));
-    setSuccessfulPicks(0);
-    setLastWin(0);
-    setGameOver(false);
-    setIsGameActive(true);
+  const handleTileClick = async (index) => {
+    if (!isGameActive || !round || grid[index] !== null || gameOver || loading) return;
+    setLoading(true);
+
+    try {
+      const res = await api.post(`/gameplay/rounds/${round.round_id}/reveal`, { cell: index });
+
+      if (res.data.status === 'SETTLED') {
+        showSettled(res.data);
+      } else {
+        setRound(res.data);
+        setGrid(prev => prev.map((tile, i) => (res.data.revealed.includes(i) ? 'gem' : tile)));
+        setSuccessfulPicks(res.data.revealed.length);
+      }
+    } catch (err) {
+      console.error(err);
+      toast.error(err.response?.data?.detail || "Reveal failed");
+      if (err.response?.status === 409) await resync();
+    } finally {
+      setLoading(false);
+    }
   };
 
- const handleLoss = async () => {
-    setGameOver(true);
-    setIsGameActive(false);
-    toast.error("BOOM! You hit a mine.");
+  const handleStartGame = async () => {
+    if (balance < betAmount) return toast.error("Insufficient balance");
+    setLoading(true);
 
     try {
-      //  Call API to process the LOSS (Debit money, Credit 0)
-      const res = await api.post('/gameplay/play', {
+      // The bet is placed and the mine layout committed server-side
+      const res = await api.post('/gameplay/rounds/start', {
         game_id: gameId,
         tenant_id: tenantId,
         bet_amount: betAmount,
-        successful_picks: 0, // 0 picks means you lost
         opt_in: optIn
       });
 
-      // Update balance to reflect the lost bet
-      updateBalance(res.data.balance); 
-      
+      updateBalance(res.data.balance);
+      setRound(res.data);
+      setGrid(Array(res.data.grid_size).fill(null));
+      setSuccessfulPicks(0);
+      setLastWin(0);
+      setGameOver(false);
+      setIsGameActive(true);
     } catch (err) {
       console.error(err);
+      toast.error(err.response?.data?.detail || "Could not place bet");
+    } finally {
+      setLoading(false);
     }
   };
+
   const handleCashout = async () => {
-    if (successfulPicks === 0) return;
+    if (!round || successfulPicks === 0) return;
     setLoading(true);
 
     try {
-      const res = await api.post('/gameplay/play', {
-        game_id: gameId,
-        tenant_id: tenantId, 
-        bet_amount: betAmount,
-        successful_picks: successfulPicks, 
-        opt_in: optIn 
-
-      });
-
-      const { win_amount, balance: newBalance } = res.data;
-
-      setLastWin(win_amount);
-      updateBalance(newBalance);
-      setIsGameActive(false);
-      setGameOver(true);
-
-      confetti({
-        particleCount: 150,
-        spread: 70,
-        origin: { y: 0.6 },
-        colors: ['#6366f1', '#10b981', '#ffffff']
-      });
-      
+      const res = await api.post(`/gameplay/rounds/${round.round_id}/cashout`);
+      showSettled(res.data);
     } catch (err) {
       console.error(err);
-      toast.error("Cashout failed");
+      toast.error(err.response?.data?.detail || "Cashout failed");
+      if (err.response?.status === 409) await resync();
     } finally {
       setLoading(false);
     }
@@ -125,7 +139,7 @@ const handleStartGame = () => {
               key={i} 
               state={state} 
               onClick={() => handleTileClick(i)} 
-              disabled={!isGameActive || gameOver}
+              disabled={!isGameActive || gameOver || loading}
             />
           ))}
         </div>
@@ -188,20 +202,13 @@ const handleStartGame = () => {
             </div>
           </div>
 
-          {/* Mine Selection */}
-          <div className="space-y-2">
-            <label className="text-[10px] font-bold text-slate-500 uppercase tracking-widest">Mines</label>
-            <select 
-              value={mineCount}
-              onChange={(e) => setMineCount(Number(e.target.value))}
-              disabled={isGameActive}
-              className="w-full bg-slate-950 border border-slate-800 rounded-xl py-3 px-4 font-bold text-white outline-none focus:border-indigo-500 appearance-none cursor-pointer"
-            >
-              {[1, 3, 5, 10, 24].map(n => (
-                <option key={n} value={n}>{n} Mines</option>
-              ))}
-            </select>
-          </div>
+          {/* Mine Count (set by the game's configuration) */}
+          {round && (
+            <div className="flex justify-between text-[10px] font-bold uppercase tracking-widest">
+              <span className="text-slate-500">Mines</span>
+              <span className="text-slate-300">{round.mine_count}</span>
+            </div>
+          )}
 
           {/* Current Game Stats */}
           {isGameActive && (
@@ -210,6 +217,10 @@ const handleStartGame = () => {
                 <span className="text-indigo-300">Gems Found</span>
                 <span className="text-white">{successfulPicks}</span>
               </div>
+              <div className="flex justify-between text-xs font-bold uppercase tracking-tight">
+                <span className="text-indigo-300">Multiplier</span>
+                <span className="text-white">{(round?.multiplier || 0).toFixed(2)}x</span>
+              </div>
             </div>
           )}
 
@@ -217,6 +228,7 @@ const handleStartGame = () => {
           {!isGameActive ? (
             <button
               onClick={handleStartGame}
+              disabled={loading}
               className="w-full py-4 rounded-xl font-black text-lg bg-indigo-600 text-white hover:bg-indigo-500 shadow-lg shadow-indigo-500/20 transition-all"
             >
               BET
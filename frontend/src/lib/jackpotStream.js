@@ -0,0 +1,48 @@
+import api from './axios';
+
+// EventSource cannot send the Authorization header, so each connection
+// trades the session token for a short-lived stream token in the URL.
+// The token is only checked when the stream opens; after a drop we fetch
+// a fresh one and reconnect with backoff.
+const MAX_RETRY_MS = 30000;
+
+export function openJackpotStream(tenantId, { onPools, onWin }) {
+  let source = null;
+  let retryTimer = null;
+  let retryMs = 1000;
+  let closed = false;
+
+  const connect = async () => {
+    try {
+      const { data } = await api.post('/player/jackpots/stream-token');
+      if (closed) return;
+
+      const params = new URLSearchParams({ tenant_id: tenantId, token: data.token });
+      source = new EventSource(`${api.defaults.baseURL}/player/jackpots/stream?${params}`);
+
+      source.onopen = () => { retryMs = 1000; };
+      source.addEventListener('pools', (e) => onPools?.(JSON.parse(e.data)));
+      source.addEventListener('win', (e) => onWin?.(JSON.parse(e.data)));
+      source.onerror = () => {
+        source.close();
+        scheduleReconnect();
+      };
+    } catch (err) {
+      scheduleReconnect();
+    }
+  };
+
+  const scheduleReconnect = () => {
+    if (closed) return;
+    retryTimer = setTimeout(connect, retryMs);
+    retryMs = Math.min(retryMs * 2, MAX_RETRY_MS);
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    source?.close();
+  };
+}
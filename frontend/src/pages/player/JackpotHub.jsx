@@ -1,5 +1,6 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import api from '../../lib/axios';
+import { openJackpotStream } from '../../lib/jackpotStream';
 import { 
   Trophy, TrendingUp, Users, Clock, Plus, 
   Loader2, Sparkles, Zap, Coins, Star, Activity,
@@ -44,6 +45,33 @@ export default function JackpotHub() {
     fetchData();
   }, [fetchData]);
 
+  // Live pools and wins pushed by the server (no polling)
+  const shownIds = useRef(new Set());
+  useEffect(() => {
+    shownIds.current = new Set(jackpots.map(jp => jp.jackpot_id));
+  }, [jackpots]);
+
+  useEffect(() => {
+    if (!activeTenantId) return;
+
+    return openJackpotStream(activeTenantId, {
+      onPools: (pools) => {
+        const live = new Map(pools.map(p => [p.jackpot_id, p.current_amount]));
+        setJackpots(prev => prev.map(jp =>
+          live.has(jp.jackpot_id) ? { ...jp, current_amount: live.get(jp.jackpot_id) } : jp
+        ));
+        // A pool opened or closed: reload the full cards
+        if (live.size !== shownIds.current.size || [...live.keys()].some(id => !shownIds.current.has(id))) {
+          fetchData();
+        }
+      },
+      onWin: (win) => {
+        toast.success(`${win.jackpot_name} just paid out $${Number(win.win_amount).toLocaleString()}!`);
+        fetchData();
+      },
+    });
+  }, [activeTenantId, fetchData]);
+
   const handleOpenContribute = (jackpot) => {
     setSelectedJackpot(jackpot);
     setIsModalOpen(true);
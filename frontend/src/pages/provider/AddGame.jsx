@@ -41,8 +41,9 @@ const ENGINE_CONFIGS = {
     { name: 'multiplier_curve', label: 'Multiplier Curve', type: 'number', step: '0.01', defaultValue: 0.97 }
   ],
   plinko_engine: [
-    { name: 'rows', label: 'Rows', type: 'number', defaultValue: 8 },
-    { name: 'bucket_multipliers', label: 'Buckets (Comma Separated)', type: 'text' }
+    { name: 'rows', label: 'Rows (8-16)', type: 'number', defaultValue: 8 },
+    { name: 'risk_level', label: 'Risk Level (low / medium / high)', type: 'text', defaultValue: 'medium' },
+    { name: 'bucket_multipliers', label: 'Custom Buckets (rows + 1, Comma Separated, optional)', type: 'text' }
   ]
 };
 
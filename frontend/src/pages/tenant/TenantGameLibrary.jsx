@@ -10,24 +10,43 @@ import {
   Coins, 
   Settings2,
   X,
-  Gamepad2
+  Gamepad2,
+  ChevronLeft,
+  ChevronRight
 } from 'lucide-react';
 import api from '../../lib/axios';
 
+const PAGE_SIZE = 24;
+
 export default function TenantGameLibrary() {
   const [games, setGames] = useState([]);
+  const [total, setTotal] = useState(0);
+  const [page, setPage] = useState(1);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
+  const [search, setSearch] = useState('');
   const [selectedConfig, setSelectedConfig] = useState(null);
 
+  // Search runs server-side; wait for typing to settle and start again from page 1
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setSearch(searchTerm.trim());
+      setPage(1);
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
   useEffect(() => {
     fetchGames();
-  }, []);
+  }, [page, search]);
 
   const fetchGames = async () => {
     try {
-      const response = await api.get('/tenant/games/marketplace');
-      setGames(response.data);
+      const response = await api.get('/tenant/games/marketplace', {
+        params: { page, page_size: PAGE_SIZE, search: search || undefined }
+      });
+      setGames(response.data.items);
+      setTotal(response.data.total);
     } catch (error) {
       toast.error("Failed to load marketplace games");
     } finally {
@@ -35,6 +54,8 @@ export default function TenantGameLibrary() {
     }
   };
 
+  const pageCount = Math.max(1, Math.ceil(total / PAGE_SIZE));
+
   const handleToggle = async (gameId, currentStatus) => {
     try {
       await api.post('/tenant/games/toggle', {
@@ -52,11 +73,6 @@ export default function TenantGameLibrary() {
     }
   };
 
-  const filteredGames = games.filter(g =>
-    g.game_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    g.provider_name.toLowerCase().includes(searchTerm.toLowerCase())
-  );
-
   if (loading) return (
     <div className="flex flex-col items-center justify-center min-h-[400px]">
       <div className="relative">
@@ -81,7 +97,7 @@ export default function TenantGameLibrary() {
           <Search className="absolute left-4 top-1/2 -translate-y-1/2 text-slate-500 group-focus-within:text-teal-400 transition-colors" size={18} />
           <input
             type="text"
-            placeholder="Search providers or games..."
+            placeholder="Search games..."
             className="w-full pl-12 pr-4 py-3 bg-slate-800/50 border border-slate-700 rounded-xl text-white placeholder-slate-500 focus:outline-none focus:ring-2 focus:ring-teal-500/50 transition-all"
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
@@ -91,7 +107,7 @@ export default function TenantGameLibrary() {
 
       {/* 2. Game Cards Grid */}
       <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
-        {filteredGames.map((game, index) => (
+        {games.map((game, index) => (
           <div 
             key={game.game_id}
             className="group relative bg-slate-800/40 border border-slate-700/50 rounded-2xl overflow-hidden hover:border-teal-500/50 transition-all duration-300 hover:-translate-y-2 shadow-xl"
@@ -179,13 +195,39 @@ export default function TenantGameLibrary() {
       </div>
 
       {/* Empty State */}
-      {filteredGames.length === 0 && (
+      {games.length === 0 && (
         <div className="p-20 text-center bg-slate-800/20 border border-dashed border-slate-700 rounded-2xl">
           <Gamepad2 size={48} className="text-slate-700 mx-auto mb-4" />
           <p className="text-slate-500 font-medium">No games found matching your search.</p>
         </div>
       )}
 
+      {/* Pagination */}
+      {total > PAGE_SIZE && (
+        <div className="flex items-center justify-between">
+          <p className="text-slate-500 text-xs">
+            {(page - 1) * PAGE_SIZE + 1}–{Math.min(page * PAGE_SIZE, total)} of {total} games
+          </p>
+          <div className="flex items-center gap-2">
+            <button
+              onClick={() => setPage(p => p - 1)}
+              disabled={page <= 1}
+              className="p-2 rounded-xl bg-slate-800 text-slate-300 hover:text-white hover:bg-slate-700 border border-slate-700 disabled:opacity-40 disabled:pointer-events-none transition-colors"
+            >
+              <ChevronLeft size={18} />
+            </button>
+            <span className="text-slate-400 text-xs font-bold">Page {page} of {pageCount}</span>
+            <button
+              onClick={() => setPage(p => p + 1)}
+              disabled={page >= pageCount}
+              className="p-2 rounded-xl bg-slate-800 text-slate-300 hover:text-white hover:bg-slate-700 border border-slate-700 disabled:opacity-40 disabled:pointer-events-none transition-colors"
+            >
+              <ChevronRight size={18} />
+            </button>
+          </div>
+        </div>
+      )}
+
       {/*  ENGINE CONFIG MODAL*/}
       {selectedConfig && (
         <div className="fixed inset-0 z-[100] flex items-center justify-center p-4">